@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+# 리스트/API를 async 뷰로 (settings.GOLD_ASYNC_VIEWS)
+os.environ.setdefault('GOLD_ASYNC_VIEWS', '1')
 
 application = get_asgi_application()
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -78,9 +79,43 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # 수집기와 웹 서버가 같은 파일을 씀 → 쓰기 트랜잭션은 시작할 때 잠금 (PRAGMA는 make_gold.db)
+        'OPTIONS': {
+            'transaction_mode': 'IMMEDIATE',
+            'timeout': 30,
+        },
+    }
+}
+
+
+# 캐시 (리스트 페이지 응답 / 개수)
+# probe.py / agent.py 가 올린 데이터 버전을 웹 서버도 봐야 해서 프로세스 간 공유되는 파일 캐시
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.cache',
+        'TIMEOUT': 300,
+        'OPTIONS': {'MAX_ENTRIES': 5000},
     }
 }
 
+# 리스트 페이지 (make_gold.views.gold_list)
+GOLD_LIST_PAGE_SIZE = 40          # 한 페이지 카드 개수 (?size= 로 변경 가능)
+GOLD_LIST_MAX_PAGE_SIZE = 100     # ?size= 상한
+GOLD_LIST_COUNT_TIMEOUT = 300     # 전체 개수(COUNT) 캐시 유지 시간(초)
+GOLD_LIST_PAGE_CACHE_TIMEOUT = 600  # 렌더링된 페이지 캐시 유지 시간(초, 데이터가 바뀌면 그 전에 무효화)
+GOLD_SEARCH_RESULT_WINDOW = 400   # 검색 결과는 관련도 상위 N개까지만 페이지 이동 허용
+# 리스트/API를 async 뷰(views.gold_list_async, api.item_list_async)로 연결할지
+# config/asgi.py가 켬 → uvicorn config.asgi:application 으로 띄우면 async, runserver/WSGI는 기존 동기 뷰
+GOLD_ASYNC_VIEWS = os.environ.get('GOLD_ASYNC_VIEWS', '') == '1'
+
+# AI 스펙 추출 캐시 (make_gold.spec_cache)
+SPEC_CACHE_TTL_DAYS = 90          # 생성 후 N일 지나면 다시 분석
+SPEC_CACHE_MAX_ENTRIES = 50000    # 넘으면 오래 안 쓴 것부터 삭제 (LRU)
+
+# 증분 수집 (make_gold.incremental)
+CRAWL_REFRESH_DAYS = 7            # 리스트 요약이 그대로여도 N일 지나면 상세 페이지 다시 수집
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -14,11 +14,20 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path
-from make_gold import views
+from make_gold import api, export, views
+
+# ASGI(config.asgi)로 띄우면 async 뷰, WSGI면 동기 뷰
+if settings.GOLD_ASYNC_VIEWS:
+    list_view, items_view, export_view = views.gold_list_async, api.item_list_async, export.export_view_async
+else:
+    list_view, items_view, export_view = views.gold_list, api.item_list, export.export_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('', views.gold_list, name='index'),
+    path('', list_view, name='index'),
+    path('api/items/', items_view, name='api-items'),
+    path('api/export/<str:table>/', export_view, name='api-export'),
 ]
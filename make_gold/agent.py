@@ -1,8 +1,12 @@
 import os
 import sys
 import json
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import django
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 
 # =========================================================
 # [Portable Path] 어디서 실행하든 찰떡같이 경로 찾기
@@ -28,7 +32,11 @@ if project_root not in sys.path:
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 django.setup()
 
+from django.utils import timezone
 from make_gold.models import AuctionItem
+from make_gold import page_cache, rules, spec_cache
+from make_gold.throttle import TokenBucket, call_with_retry
+from make_gold.valuation import VALUE_FIELDS, current_spot, value_item
 
 # ---------------------------------------------------------
 # Secrets 로드 (안전하게 Import)
@@ -56,19 +64,55 @@ else:
 
 genai.configure(api_key=GOOGLE_API_KEY)
 
-def analyze_spec(description):
+# ---------------------------------------------------------
+# 배치 실행 기본값 (CLI 옵션으로 변경 가능)
+# ---------------------------------------------------------
+MODEL_NAME = "gemini-flash-latest"
+PROMPT_VERSION = "v2"          # build_prompt 내용을 바꾸면 올릴 것 (캐시 키에 포함)
+DEFAULT_WORKERS = 4            # 동시에 날리는 AI 요청 수
+DEFAULT_RPM = 60               # 분당 최대 요청 수 (토큰 버킷)
+DEFAULT_WRITE_CHUNK = 50       # bulk_update 한 번에 쓰는 개수
+BATCH_TOKEN_BUDGET = 4000     # 묶음 프롬프트 1개의 입력 토큰 상한 (추정치)
+BATCH_MAX_ITEMS = 20           # 묶음 1개에 넣는 최대 설명 개수
+RETRY_ATTEMPTS = 4
+RETRY_BASE_DELAY = 1.0         # 재시도 대기(초): 1, 2, 4 ... (+지터)
+
+# 잠깐 기다리면 풀리는 오류들 (재시도 대상)
+TRANSIENT_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.TooManyRequests,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded,
+    google_exceptions.InternalServerError,
+    ConnectionError,
+    TimeoutError,
+)
+
+FALLBACK_SPEC = {"material": "UNKNOWN", "weight_g": 0, "risk_factor": "HIGH"}
+
+
+class GeminiClient:
     """
-    텍스트 설명(description)을 분석하여 JSON 데이터를 반환
+    모델 클라이언트 기본 구현 (Gemini)
+    generate(prompt) -> 응답 텍스트 형태만 맞추면 다른 클라이언트(테스트용 가짜 등)로 교체 가능
     """
-    model = genai.GenerativeModel('gemini-flash-latest')
 
-    prompt = f"""
+    def __init__(self, model_name=MODEL_NAME):
+        self.model_name = model_name
+        self.model = genai.GenerativeModel(model_name)
+
+    def generate(self, prompt):
+        return self.model.generate_content(prompt).text
+
+
+def build_prompt(description):
+    return f"""
     너는 전문 귀금속 감정사야. 아래 [공매 물품 설명]을 분석해서 JSON 데이터를 추출해.
     
     [규칙]
     1. material: "GOLD", "SILVER", "DIAMOND", "OTHERS" 중 하나.
     2. purity: "24K", "18K", "14K", "UNKNOWN". (순금=24K)
-    3. weight_g: 순수 금 무게(g)로 환산. (1돈=3.75g). 숫자만 출력.
+    3. weight_g: 제품 총 중량(g). 순도로 환산하지 말고 적힌 무게 그대로. (1돈=3.75g). 숫자만 출력.
     4. risk_factor: 설명이 명확하면 "LOW", 애매하면 "HIGH".
     
     [입력]
@@ -78,48 +122,336 @@ def analyze_spec(description):
     JSON 포맷만 출력 (Markdown backtick 없이).
     """
 
+
+def parse_response(text):
+    """ 모델 응답 텍스트 → dict (```json 감싸기 제거) """
+    text = text.strip().replace("```json", "").replace("```", "")
+    result = json.loads(text)
+    if not isinstance(result, dict):
+        raise ValueError(f"JSON 객체가 아님: {text[:50]}")
+    return result
+
+
+SPEC_RULES = """
+    [규칙]
+    1. material: "GOLD", "SILVER", "DIAMOND", "OTHERS" 중 하나.
+    2. purity: "24K", "18K", "14K", "UNKNOWN". (순금=24K)
+    3. weight_g: 제품 총 중량(g). 순도로 환산하지 말고 적힌 무게 그대로. (1돈=3.75g). 숫자만 출력.
+    4. risk_factor: 설명이 명확하면 "LOW", 애매하면 "HIGH".
+    5. id: 입력에 적힌 id를 그대로 출력.
+"""
+
+SPEC_FIELDS = ("material", "purity", "weight_g", "risk_factor")
+
+
+def build_batch_prompt(entries):
+    """ entries: [(id, 설명), ...] → 규칙은 한 번만 쓰고 설명 N개를 한 프롬프트에 """
+    blocks = "\n".join(f"    ### id={item_id}\n    {description}" for item_id, description in entries)
+    return f"""
+    너는 전문 귀금속 감정사야. 아래 [공매 물품 목록]의 물품 설명을 각각 분석해서 JSON 데이터를 추출해.
+    {SPEC_RULES}
+    [입력]
+{blocks}
+    
+    [출력]
+    물품 {len(entries)}개에 대해 길이 {len(entries)}인 JSON 배열만 출력 (Markdown backtick 없이).
+    예: [{{"id": 1, "material": "GOLD", "purity": "24K", "weight_g": 3.75, "risk_factor": "LOW"}}]
+    """
+
+
+def estimate_tokens(text):
+    """ 대략적인 토큰 수 (한글은 글자당 1토큰 안팎이라 보수적으로 계산) """
+    return len(text) // 2 + 1
+
+
+def pack_batches(entries, token_budget=BATCH_TOKEN_BUDGET, max_items=BATCH_MAX_ITEMS):
+    """ (id, 설명) 목록을 토큰 예산/최대 개수 안에서 묶음 리스트로 나눔 """
+    overhead = estimate_tokens(build_batch_prompt([]))
+    batches, current, used = [], [], overhead
+    for item_id, description in entries:
+        cost = estimate_tokens(description) + 10
+        if current and (used + cost > token_budget or len(current) >= max_items):
+            batches.append(current)
+            current, used = [], overhead
+        current.append((item_id, description))
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _valid_spec(obj):
+    """ 배열 원소 하나가 스키마(필드 존재 + weight_g 숫자)에 맞는지 """
+    if not isinstance(obj, dict) or any(field not in obj for field in SPEC_FIELDS):
+        return False
+    try:
+        float(obj["weight_g"])
+    except (TypeError, ValueError):
+        return False
+    return all(isinstance(obj[field], str) for field in ("material", "purity", "risk_factor"))
+
+
+def parse_batch_response(text, expected_ids):
+    """
+    묶음 응답(JSON 배열) → {id: 결과}
+    스키마가 맞고 요청한 id인 원소만 채택. 빠지거나 깨진 id는 결과에 없음 (호출한 쪽에서 단건 재시도)
+    """
+    text = text.strip().replace("```json", "").replace("```", "")
+    rows = json.loads(text)
+    if not isinstance(rows, list):
+        raise ValueError(f"JSON 배열이 아님: {text[:50]}")
+
+    expected = {str(item_id): item_id for item_id in expected_ids}
+    if len(rows) != len(expected):
+        print(f"   ⚠️ 묶음 응답 개수 불일치: 요청 {len(expected)}개 / 응답 {len(rows)}개")
+
+    results = {}
+    for row in rows:
+        if not _valid_spec(row):
+            continue
+        item_id = expected.get(str(row.get("id")))
+        if item_id is not None and item_id not in results:
+            results[item_id] = {field: row[field] for field in SPEC_FIELDS}
+    return results
+
+
+def _model_name(client):
+    return getattr(client, "model_name", type(client).__name__)
+
+
+def _generate(prompt, client, limiter=None):
+    """ 속도 제한 토큰을 받고 모델 호출, 일시 오류(429/503/타임아웃)는 백오프 후 재시도 """
+    def request():
+        if limiter:
+            limiter.acquire()
+        return client.generate(prompt)
+
+    return call_with_retry(
+        request, retry_on=TRANSIENT_ERRORS,
+        attempts=RETRY_ATTEMPTS, base_delay=RETRY_BASE_DELAY,
+    )
+
+
+def request_spec(description, client, limiter=None):
+    """
+    캐시를 거치지 않고 모델에 바로 물어봄 (실패하면 예외를 그대로 올림)
+    - limiter : 요청 전에 토큰을 받아갈 TokenBucket (없으면 제한 없음)
+    """
+    started = time.monotonic()
+    try:
+        return parse_response(_generate(build_prompt(description), client, limiter))
+    finally:
+        spec_cache.stats.record_miss(time.monotonic() - started)
+
+
+def request_specs_batch(entries, client, limiter=None):
+    """
+    설명 여러 개를 한 번에 물어봄
+    entries: [(id, 설명), ...] → {id: 결과 dict 또는 실패 예외}
+    묶음 응답에서 빠지거나 깨진 항목만 단건 호출로 다시 물어봄
+    """
+    results = {}
+    if len(entries) > 1:
+        started = time.monotonic()
+        try:
+            prompt = build_batch_prompt(entries)
+            results = parse_batch_response(_generate(prompt, client, limiter), [i for i, _ in entries])
+        except Exception as e:
+            print(f"   ⚠️ 묶음 분석 에러 (전부 단건으로 재시도): {e}")
+        elapsed = (time.monotonic() - started) / len(entries)
+        for _ in results:
+            spec_cache.stats.record_miss(elapsed)
+
+    for item_id, description in entries:
+        if item_id in results:
+            continue
+        try:
+            results[item_id] = request_spec(description, client, limiter)
+        except Exception as e:
+            results[item_id] = e
+    return results
+
+
+def analyze_spec(description, client=None, limiter=None, use_cache=True, use_rules=True):
+    """
+    텍스트 설명(description)을 분석하여 JSON 데이터를 반환
+    - client    : generate(prompt)를 가진 모델 클라이언트 (없으면 Gemini)
+    - use_cache : 같은 설명을 분석한 적 있으면 네트워크 없이 캐시 결과 반환
+    - use_rules : 규칙 엔진(rules.py)이 확신하면 AI 호출 생략
+    """
+    if use_rules:
+        result = rules.classify(description)
+        if rules.is_confident(result):
+            return result
+
+    client = client or GeminiClient()
+
+    key = None
+    if use_cache:
+        key = spec_cache.make_key(description, PROMPT_VERSION, _model_name(client))
+        cached = spec_cache.get(key)
+        if cached is not None:
+            spec_cache.stats.record_hits()
+            return cached
+
     try:
-        response = model.generate_content(prompt)
-        text = response.text.strip().replace("```json", "").replace("```", "")
-        return json.loads(text)
+        result = request_spec(description, client, limiter)
     except Exception as e:
         print(f"   ⚠️ AI 분석 에러: {e}")
-        return {"material": "UNKNOWN", "weight_g": 0, "risk_factor": "HIGH"}
+        # 실패 결과는 캐시하지 않음 (같은 설명을 다시 물으면 다시 호출)
+        # 대체값(risk_factor=HIGH)을 저장하면 그 물건은 분석 대기열에서 빠지므로, 저장 여부는 호출한 쪽이 결정
+        return dict(FALLBACK_SPEC)
+
+    if key:
+        spec_cache.put(key, result, PROMPT_VERSION, _model_name(client))
+    return result
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def apply_spec(item, result):
+    """ 분석 결과를 모델 인스턴스에 반영 (저장은 호출한 쪽에서) """
+    item.material = result.get('material', 'OTHERS')
+    item.purity = result.get('purity', 'UNKNOWN')
+    item.weight_g = _to_float(result.get('weight_g', 0.0))
+    item.risk_factor = result.get('risk_factor', 'HIGH')
+    # bulk_update는 auto_now를 채워주지 않음
+    item.updated_at = timezone.now()
+
+
+def _flush(items, cache_entries, model_name):
+    """ 분석 결과 묶음과 새 캐시 항목을 한 번에 저장 """
+    if items:
+        # 순도/무게가 새로 채워졌으니 가치 평가도 같이 (시세 조회는 묶음당 한 번)
+        spot = current_spot()
+        for item in items:
+            value_item(item, spot)
+        AuctionItem.objects.bulk_update(
+            items, ['material', 'purity', 'weight_g', 'risk_factor', 'updated_at', *VALUE_FIELDS]
+        )
+        page_cache.bump_on_commit()
+        print(f"   💾 {len(items)}개 저장")
+    spec_cache.put_many(cache_entries, PROMPT_VERSION, model_name)
+
 
-def run_batch_analysis():
+def run_batch_analysis(workers=DEFAULT_WORKERS, rpm=DEFAULT_RPM, write_chunk=DEFAULT_WRITE_CHUNK,
+                       token_budget=BATCH_TOKEN_BUDGET, max_batch_items=BATCH_MAX_ITEMS,
+                       use_rules=True, client=None):
     print("\n=== 🤖 AI 분석 요원 투입 (Batch Start) ===")
+    # 캐시 통계는 모듈 전역이라 실행마다 새로 셈 (리포트는 이번 실행분만)
+    spec_cache.stats.reset()
     
     # 분석 안 된(risk_factor가 UNKNOWN인) 아이템만 가져오기
-    target_items = AuctionItem.objects.filter(risk_factor="UNKNOWN")
+    target_items = list(
+        AuctionItem.objects.pending_analysis().only('id', 'title', 'description')
+    )
     
-    count = target_items.count()
-    print(f">> 분석 대기 물량: {count}개")
+    count = len(target_items)
+    print(f">> 분석 대기 물량: {count}개 (동시 {workers}개 / 분당 {rpm}회)")
 
     if count == 0:
         print(">> 모든 물건이 분석 완료 상태입니다. 퇴근합니다.")
         return
 
+    client = client or GeminiClient()
+    model_name = _model_name(client)
+    limiter = TokenBucket(rate=rpm / 60.0, capacity=workers)
+
+    pending = []
+    new_entries = {}
+
+    def collect(items, result):
+        for item in items:
+            apply_spec(item, result)
+            pending.append(item)
+
+    # 0. 규칙 엔진으로 명확한 물건은 바로 처리 (AI 호출 없음)
+    if use_rules:
+        unresolved = []
+        for item in target_items:
+            result = rules.classify(item.description)
+            if rules.is_confident(result):
+                collect([item], result)
+            else:
+                unresolved.append(item)
+        print(f">> 규칙 엔진 처리 {len(pending)}개, AI 대상 {len(unresolved)}개")
+        target_items = unresolved
+
+    # 1. 같은 설명(보일러플레이트)끼리 묶고, 캐시는 쿼리 한 번으로 조회
+    groups = {}
     for item in target_items:
-        print(f"   🔍 분석 중: {item.title[:20]}...", end=" ")
-        
-        try:
-            # 1. AI 분석 수행
-            result = analyze_spec(item.description)
-            
-            # 2. 결과 DB 업데이트
-            item.material = result.get('material', 'OTHERS')
-            item.purity = result.get('purity', 'UNKNOWN')
-            item.weight_g = result.get('weight_g', 0.0)
-            item.risk_factor = result.get('risk_factor', 'HIGH')
-            
-            item.save()
-            print(f"-> [완료] {item.weight_g}g / {item.purity}")
-            
-        except Exception as e:
-            print(f"-> [실패] {e}")
-            continue
+        key = spec_cache.make_key(item.description, PROMPT_VERSION, model_name)
+        groups.setdefault(key, []).append(item)
+
+    cache_hits = 0
+    for key, result in spec_cache.get_many(groups.keys()).items():
+        items = groups.pop(key)
+        cache_hits += len(items)
+        collect(items, result)
+
+    # 같은 설명이 여러 개면 대표 1개만 호출하고 나머지는 적중으로 계산
+    cache_hits += sum(len(items) - 1 for items in groups.values())
+    spec_cache.stats.record_hits(cache_hits)
+    print(f">> 캐시 적중 {cache_hits}개, API 호출 필요 {len(groups)}건")
+
+    # 2. 설명 여러 개를 토큰 예산 안에서 한 프롬프트로 묶기 (id = 대표 물건 pk)
+    key_by_id = {items[0].pk: key for key, items in groups.items()}
+    batches = pack_batches(
+        [(items[0].pk, items[0].description) for items in groups.values()],
+        token_budget=token_budget, max_items=max_batch_items,
+    )
+    print(f">> 묶음 요청 {len(batches)}건 (토큰 예산 {token_budget}, 최대 {max_batch_items}개)")
+
+    # 3. AI 호출은 스레드 풀에서 동시에, DB 쓰기는 이 스레드에서만 (SQLite 잠금 방지)
+    failed = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(request_specs_batch, batch, client, limiter) for batch in batches]
 
+        for done, future in enumerate(as_completed(futures), start=1):
+            for item_id, result in future.result().items():
+                key = key_by_id[item_id]
+                items = groups[key]
+                if isinstance(result, Exception):
+                    # 저장하지 않고 UNKNOWN으로 둠 → 다음 실행 때 다시 분석 대상
+                    print(f"   ⚠️ AI 분석 에러 (x{len(items)}, 다음 실행 때 재시도): {result}")
+                    failed += len(items)
+                    continue
+
+                new_entries[key] = result
+                collect(items, result)
+                print(f"   {items[0].title[:20]} (x{len(items)}) -> {items[0].weight_g}g / {items[0].purity}")
+
+            print(f"   [{done}/{len(futures)}] 묶음 완료")
+            if len(pending) >= write_chunk:
+                _flush(pending, new_entries, model_name)
+                pending, new_entries = [], {}
+
+    _flush(pending, new_entries, model_name)
+
+    # 4. 캐시 정리 + 절약 효과 리포트
+    evicted = spec_cache.evict()
+    if failed:
+        print(f">> 분석 실패 {failed}개는 UNKNOWN으로 남김 (다음 실행 때 재시도)")
+    print(f">> {spec_cache.stats.summary()} / 만료·정리 {evicted}건")
     print("=== 분석 작업 종료 ===")
 
 if __name__ == "__main__":
-    run_batch_analysis()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="AI 스펙 분석 배치")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="동시 요청 수")
+    parser.add_argument("--rpm", type=float, default=DEFAULT_RPM, help="분당 최대 요청 수")
+    parser.add_argument("--chunk", type=int, default=DEFAULT_WRITE_CHUNK, help="한 번에 저장할 개수")
+    parser.add_argument("--token-budget", type=int, default=BATCH_TOKEN_BUDGET, help="묶음 프롬프트 토큰 상한")
+    parser.add_argument("--batch-items", type=int, default=BATCH_MAX_ITEMS, help="묶음 1개당 최대 설명 수 (1이면 단건)")
+    parser.add_argument("--no-rules", action="store_true", help="규칙 엔진 없이 전부 AI로 분석")
+    args = parser.parse_args()
+
+    run_batch_analysis(
+        workers=args.workers, rpm=args.rpm, write_chunk=args.chunk,
+        token_budget=args.token_budget, max_batch_items=args.batch_items,
+        use_rules=not args.no_rules,
+    )
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import math
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse
+from django.utils.cache import get_conditional_response, quote_etag
+from django.views.decorators.http import condition, require_GET
+
+from . import page_cache
+from .models import AuctionItem
+from .pagination import akeyset_page, awindow_page, get_page_size, keyset_page, window_page
+from .regions import normalize_region
+from .views import filter_items, parse_min_discount
+
+# =========================================================
+# 읽기 전용 JSON API (/api/items/)
+# - 필터: 리스트 화면과 같은 q / region / min_discount / sort + purity, 무게/가격 범위
+# - ?fields=url,price,weight_g → 그 컬럼만 .values()로 조회 (큰 description은 요청할 때만)
+# - 페이지: 리스트 화면과 같은 키셋 커서 (검색어가 있으면 관련도 순 결과 창 안에서 OFFSET)
+# - ASGI로 띄우면 item_list_async (같은 동작, async ORM)
+# - ETag = 데이터 버전 + 정규화된 파라미터 → If-None-Match가 같으면 DB 조회 없이 304
+# =========================================================
+
+# API로 내보내는 컬럼 (요청한 fields는 이 안에서만)
+API_FIELDS = (
+    'id', 'url', 'title', 'location', 'region', 'price', 'image_url', 'description',
+    'material', 'purity', 'weight_g', 'risk_factor', 'melt_value', 'discount_pct',
+    'created_at', 'updated_at',
+)
+DEFAULT_FIELDS = (
+    'id', 'url', 'title', 'location', 'price', 'purity', 'weight_g', 'melt_value', 'discount_pct', 'created_at',
+)
+# ?min_weight= 같은 범위 파라미터 → ORM 조건
+RANGE_FILTERS = {
+    'min_weight': 'weight_g__gte',
+    'max_weight': 'weight_g__lte',
+    'min_price': 'price__gte',
+    'max_price': 'price__lte',
+}
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def _number(params, name):
+    raw = params.get(name, '').strip()
+    if not raw:
+        return None
+    try:
+        value = float(raw)
+    except ValueError:
+        value = math.nan
+    if not math.isfinite(value):
+        raise BadRequest(f"'{name}' 값이 숫자가 아닙니다: {raw}")
+    return value
+
+
+def parse_params(params):
+    """ GET 파라미터 → 정규화된 dict (같은 조건이면 같은 dict → 같은 ETag). 잘못되면 BadRequest """
+    region = params.get('region', '').strip()
+    fields = [field.strip() for field in params.get('fields', '').split(',') if field.strip()]
+    unknown = [field for field in fields if field not in API_FIELDS]
+    if unknown:
+        raise BadRequest(f"알 수 없는 필드: {', '.join(unknown)} (가능: {', '.join(API_FIELDS)})")
+
+    parsed = {
+        'q': " ".join(params.get('q', '').split()),
+        'region': normalize_region(region) or region,
+        'purity': sorted({p.strip().upper() for p in params.get('purity', '').split(',') if p.strip()}),
+        'sort': 'discount' if params.get('sort') == 'discount' else 'latest',
+        'min_discount': parse_min_discount(params.get('min_discount')),
+        'size': get_page_size(params.get('size')),
+        'cursor': params.get('cursor', ''),
+        'fields': list(dict.fromkeys(fields)) or list(DEFAULT_FIELDS),
+    }
+    for name in RANGE_FILTERS:
+        parsed[name] = _number(params, name)
+    return parsed
+
+
+def build_queryset(parsed):
+    """ 정규화된 파라미터 → .values() 쿼리셋 (아직 DB 조회 안 함) """
+    items = filter_items(
+        AuctionItem.objects.all(), parsed['q'], parsed['region'], parsed['min_discount'], parsed['sort'],
+    )
+    if parsed['purity']:
+        items = items.filter(purity__in=parsed['purity'])
+    conditions = {lookup: parsed[name] for name, lookup in RANGE_FILTERS.items() if parsed[name] is not None}
+    if conditions:
+        items = items.filter(**conditions)
+
+    # 키셋 커서에 필요한 컬럼은 요청에 없어도 읽고 응답에서 뺌
+    order_column = 'discount_pct' if parsed['sort'] == 'discount' else 'created_at'
+    columns = list(dict.fromkeys([*parsed['fields'], 'id', order_column]))
+    if 'search_rank' in items.query.annotations:
+        columns.append('search_rank')   # 검색 관련도 (정렬 기준이라 같이 읽어야 함)
+    return items.values(*columns)
+
+
+def _project(parsed, rows):
+    """ 응답에 넣을 컬럼만 남김 (키셋 정렬 컬럼 / search_rank 제거) """
+    fields = parsed['fields']
+    return [{field: row[field] for field in fields} for row in rows]
+
+
+def fetch_page(parsed, items):
+    """ (이번 페이지 행 목록, 다음 커서) """
+    if parsed['q']:
+        window = getattr(settings, 'GOLD_SEARCH_RESULT_WINDOW', 400)
+        rows, next_cursor = window_page(items, parsed['cursor'], parsed['size'], window)
+    else:
+        rows, next_cursor = keyset_page(items, parsed['cursor'], parsed['size'], order=parsed['sort'])
+    return _project(parsed, rows), next_cursor
+
+
+async def afetch_page(parsed, items):
+    """ fetch_page의 async 버전 """
+    if parsed['q']:
+        window = getattr(settings, 'GOLD_SEARCH_RESULT_WINDOW', 400)
+        rows, next_cursor = await awindow_page(items, parsed['cursor'], parsed['size'], window)
+    else:
+        rows, next_cursor = await akeyset_page(items, parsed['cursor'], parsed['size'], order=parsed['sort'])
+    return _project(parsed, rows), next_cursor
+
+
+def next_link(request, next_cursor):
+    if not next_cursor:
+        return None
+    params = request.GET.copy()
+    params['cursor'] = next_cursor
+    return f"{request.path}?{params.urlencode()}"
+
+
+# ---------------------------------------------------------
+# 뷰
+# ---------------------------------------------------------
+def _etag(version, parsed):
+    raw = json.dumps([version, parsed], sort_keys=True, ensure_ascii=False)
+    return hashlib.md5(raw.encode()).hexdigest()
+
+
+def items_etag(request):
+    """ 데이터 버전(캐시에서 읽음, DB 조회 없음) + 정규화된 파라미터 """
+    try:
+        parsed = parse_params(request.GET)
+    except BadRequest:
+        return None
+    return _etag(page_cache.data_version(), parsed)
+
+
+def bad_request(error):
+    return JsonResponse({'error': str(error)}, status=400, json_dumps_params={'ensure_ascii': False})
+
+
+def items_response(request, rows, next_cursor):
+    return JsonResponse(
+        {'items': rows, 'next_cursor': next_cursor, 'next': next_link(request, next_cursor)},
+        encoder=DjangoJSONEncoder,
+        json_dumps_params={'ensure_ascii': False},
+    )
+
+
+@require_GET
+@condition(etag_func=items_etag)
+def item_list(request):
+    try:
+        parsed = parse_params(request.GET)
+    except BadRequest as e:
+        return bad_request(e)
+    rows, next_cursor = fetch_page(parsed, build_queryset(parsed))
+    return items_response(request, rows, next_cursor)
+
+
+@require_GET
+async def item_list_async(request):
+    """
+    item_list의 async 버전 (ASGI)
+    @condition은 etag_func를 이벤트 루프에서 바로 부름 (파일 캐시 읽기가 루프를 막음)
+    → 데이터 버전은 await로 읽고 If-None-Match 비교는 여기서 직접
+    """
+    try:
+        parsed = parse_params(request.GET)
+    except BadRequest as e:
+        return bad_request(e)
+    etag = quote_etag(_etag(await page_cache.adata_version(), parsed))
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        return not_modified
+    rows, next_cursor = await afetch_page(parsed, build_queryset(parsed))
+    response = items_response(request, rows, next_cursor)
+    response.headers.setdefault('ETag', etag)
+    return response
@@ -4,3 +4,18 @@ from django.apps import AppConfig
 class MakeGoldConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'make_gold'
+
+    def ready(self):
+        # 리스트 페이지 캐시 무효화: save()/delete()로 바뀐 물건도 데이터 버전 올림
+        # (bulk 저장 경로는 ItemWriter / agent / valuation 에서 직접 올림)
+        from django.db.backends.signals import connection_created
+        from django.db.models.signals import post_delete, post_save
+        from .db import on_connection_created
+        from .models import AuctionItem
+        from .page_cache import on_item_change
+
+        post_save.connect(on_item_change, sender=AuctionItem, dispatch_uid="gold_list_cache_save")
+        post_delete.connect(on_item_change, sender=AuctionItem, dispatch_uid="gold_list_cache_delete")
+
+        # SQLite 연결마다 WAL / busy_timeout 등 PRAGMA (수집기 sqlite3 연결과 같은 설정)
+        connection_created.connect(on_connection_created, dispatch_uid="sqlite_pragmas")
@@ -0,0 +1,192 @@
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+# 프로젝트 루트를 경로에 추가 (make_gold 패키지 import용)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from make_gold.db import get_db_connection
+from make_gold.prices import epoch_sql
+from make_gold.rules import extract_purity
+from make_gold.valuation import PURITY_FRACTION, value_arrays
+
+# =========================================================
+# 백테스트: 지난 회차(auction_history) 낙찰 물건이 그 당시 금값 대비 얼마나 쌌는지
+# 실행: python make_gold/backtest.py [--seasons 12-20] [--season-dates 12=2025-01-15,13=2025-02-12]
+# - 물건마다 경매 시점의 1g 시세를 gold_price_series에서 as-of 조인 (정렬된 배열 + searchsorted)
+# - 순도는 probe와 같은 규칙(rules.extract_purity)으로 purity_info에서 추출
+# - 가치/할인율 계산식은 valuation.value_arrays 그대로 (리스트 화면과 같은 숫자)
+# - 회차별 경매일을 모르면 수집 시각(created_at)을 경매 시점으로 사용
+# =========================================================
+
+PERCENTILES = (25, 50, 75)
+
+
+def parse_season_dates(text):
+    """ '12=2025-01-15,13=2025-02-12 14:00' → {12: epoch, 13: epoch} (날짜만 주면 그날 마지막 시각) """
+    dates = {}
+    for part in (text or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        season, _, value = part.partition("=")
+        value = value.strip()
+        try:
+            moment = datetime.strptime(value, "%Y-%m-%d %H:%M")
+        except ValueError:
+            moment = datetime.strptime(value, "%Y-%m-%d").replace(hour=23, minute=59, second=59)
+        dates[int(season)] = int(time.mktime(moment.timetuple()))
+    return dates
+
+
+# ---------------------------------------------------------
+# 1. 데이터 읽기 → numpy 배열
+# ---------------------------------------------------------
+def load_history(conn, seasons=None):
+    """ auction_history → 열별 배열 (season, price, weight, purity, collected_at epoch) """
+    rows = []
+    has_table = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='auction_history'"
+    ).fetchone()
+    if has_table:
+        sql = f"SELECT season, price, weight, purity_info, {epoch_sql('created_at')} FROM auction_history"
+        params = []
+        if seasons:
+            sql += f" WHERE season IN ({', '.join('?' * len(seasons))})"
+            params = list(seasons)
+        rows = conn.execute(sql, params).fetchall()
+
+    season, price, weight, purity_info, created_at = zip(*rows) if rows else ((),) * 5
+    # 함량 문구는 같은 게 반복되니 서로 다른 문구만 규칙 검사
+    purity_of = {info: extract_purity(info) for info in set(purity_info)}
+    # created_at(UTC DateTimeField)은 SQL에서 epoch 초로 바꿔서 읽음, 없으면 -1
+    collected_at = np.array([-1 if at is None else at for at in created_at], dtype=np.int64)
+    return {
+        "season": np.array(season, dtype=np.int64),
+        "price": np.array([p or 0 for p in price], dtype=np.float64),
+        "weight": np.array([w or 0 for w in weight], dtype=np.float64),
+        # 고정 길이 문자열 배열 → 순도 비교가 C 루프로 돎
+        "purity": np.array([purity_of[info] for info in purity_info], dtype=str),
+        "collected_at": collected_at,
+    }
+
+
+def load_series(conn):
+    """ gold_price_series → (구간 시작 시각 배열, 1g 시세 배열) 시간순 """
+    rows = conn.execute(
+        f"SELECT {epoch_sql('started_at')}, price FROM gold_price_series ORDER BY started_at"
+    ).fetchall()
+    starts, prices = zip(*rows) if rows else ((), ())
+    return np.array(starts, dtype=np.int64), np.array(prices, dtype=np.float64)
+
+
+# ---------------------------------------------------------
+# 2. as-of 조인 + 가치 계산
+# ---------------------------------------------------------
+def auction_times(seasons, collected_at, season_dates=None):
+    """ 회차별 경매일이 주어지면 그 시각, 아니면 수집 시각 """
+    at = collected_at.copy()
+    for season, epoch in (season_dates or {}).items():
+        at[seasons == season] = epoch
+    return at
+
+
+def spot_asof(starts, prices, at):
+    """ 각 시각 at에 유효했던 1g 시세 (그 전 기록이 없으면 NaN) - 구간 시작 배열에서 이진 탐색 """
+    idx = np.searchsorted(starts, at, side="right") - 1
+    found = (idx >= 0) & (at >= 0)
+    spot = np.full(len(at), np.nan)
+    spot[found] = prices[idx[found]]
+    return spot
+
+
+def value_history(history, starts, prices, season_dates=None):
+    """ 물건별 (경매 시점 시세, 금 함량 가치, 할인율) - 계산 불가한 자리는 NaN """
+    at = auction_times(history["season"], history["collected_at"], season_dates)
+    spot = spot_asof(starts, prices, at)
+    fraction = np.zeros(len(at))
+    for purity, value in PURITY_FRACTION.items():
+        fraction[history["purity"] == purity] = value
+
+    # value_arrays는 시세 하나(스칼라) 기준이라 1g당 가치(순도 비율 × 무게)를 먼저 구하고 시세 배열을 곱함
+    has_spot = ~np.isnan(spot)
+    melt, discount, has_melt, has_discount = value_arrays(
+        history["price"], history["weight"] * np.where(has_spot, spot, 0.0), fraction, 1
+    )
+    melt = np.where(has_melt & has_spot, melt, np.nan)
+    discount = np.where(has_discount & has_spot, discount, np.nan)
+    return spot, melt, discount
+
+
+def run_backtest(conn, seasons=None, season_dates=None):
+    """
+    회차 × 순도별 할인율 분포
+    반환: [{"season", "purity", "lots", "valued", "mean", "p25", "p50", "p75", "below_melt"}, ...]
+    """
+    history = load_history(conn, seasons)
+    starts, prices = load_series(conn)
+    _, _, discount = value_history(history, starts, prices, season_dates)
+
+    report = []
+    for season in np.unique(history["season"]):
+        in_season = history["season"] == season
+        purities = history["purity"][in_season]
+        season_discount = discount[in_season]
+        for purity in PURITY_FRACTION:
+            group = purities == purity
+            lots = int(group.sum())
+            if not lots:
+                continue
+            values = season_discount[group]
+            values = values[~np.isnan(values)]
+            row = {"season": int(season), "purity": purity, "lots": lots, "valued": len(values)}
+            if len(values):
+                p25, p50, p75 = np.percentile(values, PERCENTILES)
+                row.update(mean=float(values.mean()), p25=float(p25), p50=float(p50), p75=float(p75),
+                           below_melt=float((values > 0).mean() * 100))
+            report.append(row)
+    return report
+
+
+# ---------------------------------------------------------
+# 3. 출력
+# ---------------------------------------------------------
+def print_report(report):
+    if not report:
+        print("⚠️ 계산할 이력이 없습니다. (auction_history / gold_price_series 확인)")
+        return
+    print(f"{'회차':>4} {'순도':>4} {'물건':>5} {'평가':>5} {'평균':>8} {'하위25%':>8} {'중앙값':>8} {'상위25%':>8} {'금값 이하':>8}")
+    for row in report:
+        if not row["valued"]:
+            print(f"{row['season']:>4} {row['purity']:>4} {row['lots']:>5} {0:>5}   (경매 시점 시세 없음)")
+            continue
+        print(
+            f"{row['season']:>4} {row['purity']:>4} {row['lots']:>5} {row['valued']:>5} "
+            f"{row['mean']:>7.1f}% {row['p25']:>7.1f}% {row['p50']:>7.1f}% {row['p75']:>7.1f}% "
+            f"{row['below_melt']:>7.0f}%"
+        )
+
+
+if __name__ == "__main__":
+    from make_gold.past_collector import parse_seasons
+
+    parser = argparse.ArgumentParser(description="지난 회차 낙찰가 vs 당시 금 시세 백테스트")
+    parser.add_argument("--seasons", default="", help="회차 범위 (예: 12-20, 비우면 전체)")
+    parser.add_argument("--season-dates", default="", help="회차별 경매일 (예: 12=2025-01-15,13=2025-02-12)")
+    parser.add_argument("--db", default=None, help="SQLite 파일 (기본: 프로젝트 db.sqlite3)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    conn = get_db_connection(args.db)
+    try:
+        report = run_backtest(conn, parse_seasons(args.seasons), parse_season_dates(args.season_dates))
+    finally:
+        conn.close()
+    print_report(report)
+    print(f"\n⏱️ {time.perf_counter() - started:.2f}초")
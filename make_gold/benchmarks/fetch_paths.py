@@ -0,0 +1,154 @@
+import argparse
+import os
+import sys
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+# =========================================================
+# kapao 페이지 수집 경로 벤치마크: HTTP(requests + lxml) vs 크롬(셀레니움)
+# 실행: python -m make_gold.benchmarks.fetch_paths [--rounds 30] [--skip-browser]
+# - 저장해둔 kapao HTML(testdata/kapao)을 로컬 서버로 띄워서 같은 페이지를 수집
+# - 초당 처리 페이지 수 + 메모리(RSS, 크롬은 자식 프로세스까지 합산)
+# =========================================================
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from make_gold import kapao
+
+FIXTURES = os.path.join(project_root, "make_gold", "testdata", "kapao")
+DETAIL_PAGES = ["view_101.html", "view_102.html", "view_103.html"]
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_fixtures():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=FIXTURES))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/"
+
+
+# ---------------------------------------------------------
+# 메모리 측정 (/proc 기준, 리눅스 전용)
+# ---------------------------------------------------------
+def _rss_kb(pid):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def tree_rss_mb(pid=None):
+    """ pid(기본: 자기 자신)와 모든 자식 프로세스의 RSS 합계 (MB). /proc이 없으면 None """
+    if not os.path.isdir("/proc"):
+        return None
+    pid = pid or os.getpid()
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    total, stack = 0, [pid]
+    while stack:
+        current = stack.pop()
+        total += _rss_kb(current)
+        stack.extend(children.get(current, []))
+    return total / 1024
+
+
+def _fmt_mb(value):
+    return "측정 불가" if value is None else f"{value:.0f}MB"
+
+
+# ---------------------------------------------------------
+# 두 가지 수집 경로
+# ---------------------------------------------------------
+def run_http(base_url, rounds):
+    pages, peak = 0, 0.0
+    with kapao.open_session() as session:
+        started = time.perf_counter()
+        for _ in range(rounds):
+            targets = kapao.fetch_list(session, url=base_url + "list.html")
+            pages += 2   # 검색 폼 페이지 + 결과 페이지
+            for target in targets:
+                kapao.fetch_detail(session, target)
+                pages += 1
+            peak = max(peak, tree_rss_mb() or 0.0)
+        elapsed = time.perf_counter() - started
+    return pages, elapsed, peak or None
+
+
+def run_browser(base_url, rounds):
+    from make_gold import waits
+    from make_gold.browser import DriverPool
+
+    pool = DriverPool(size=1, headless=True)
+    try:
+        with pool.driver() as driver:
+            driver.get(base_url + "list.html")   # 브라우저 기동은 측정에서 제외
+            pages, peak = 0, 0.0
+            started = time.perf_counter()
+            for _ in range(rounds):
+                driver.get(base_url + "list.html")
+                items = waits.wait_list(driver, kapao.LIST_XPATH, "리스트")
+                pages += 1
+                for name in DETAIL_PAGES[:len(items)]:
+                    target = {"url": base_url + name, "list_text": ""}
+                    driver.get(target["url"])
+                    waits.wait_present(driver, kapao.DETAIL_INFO_XPATH, "상세")
+                    kapao.parse_detail(kapao.driver_text_at(driver), target)
+                    pages += 1
+                peak = max(peak, tree_rss_mb() or 0.0)
+            elapsed = time.perf_counter() - started
+    finally:
+        pool.close()
+    return pages, elapsed, peak or None
+
+
+def report(name, pages, elapsed, rss):
+    print(f"{name:<14} {pages:>5}페이지 / {elapsed:6.2f}초 = {pages / elapsed:7.1f} 페이지/초, 최대 RSS {_fmt_mb(rss)}")
+    return pages / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="kapao HTTP vs 크롬 수집 벤치마크")
+    parser.add_argument("--rounds", type=int, default=30, help="리스트 + 상세 3개를 몇 번 반복할지")
+    parser.add_argument("--skip-browser", action="store_true", help="크롬 경로는 건너뜀")
+    args = parser.parse_args()
+
+    server, base_url = serve_fixtures()
+    try:
+        print(f"로컬 픽스처 서버: {base_url} (반복 {args.rounds}회)")
+        print(f"시작 시 RSS: {_fmt_mb(tree_rss_mb())}")
+        http_rate = report("HTTP + lxml", *run_http(base_url, args.rounds))
+
+        if args.skip_browser:
+            return
+        try:
+            browser_rate = report("크롬(셀레니움)", *run_browser(base_url, args.rounds))
+        except Exception as e:
+            print(f"크롬(셀레니움)  건너뜀 - 브라우저를 띄울 수 없음: {type(e).__name__}: {e}")
+            return
+        print(f"→ HTTP 경로가 {http_rate / browser_rate:.1f}배 빠름")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
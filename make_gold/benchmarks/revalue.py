@@ -0,0 +1,112 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+import django
+
+# =========================================================
+# 시세 변경 시 전체 재평가 벤치마크: numpy 일괄 계산 vs 행마다 ORM save
+# 실행: python -m make_gold.benchmarks.revalue [--sizes 10000,100000,1000000] [--row-limit 20000]
+# - 임시 SQLite 파일에 마이그레이션을 적용하고 가짜 매물 N개를 채운 뒤 측정
+# - 행마다 방식은 느려서 row-limit개까지만 실측하고 나머지는 같은 속도로 추정
+# =========================================================
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+PURITIES = ["24K", "24K", "18K", "14K", "SILVER", "UNKNOWN"]
+INSERT_CHUNK = 50000
+
+
+def setup_django(db_path):
+    """ 실제 db.sqlite3 대신 벤치마크용 임시 파일을 쓰도록 설정한 뒤 마이그레이션 """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    from django.conf import settings
+    settings.DATABASES["default"]["NAME"] = db_path
+    settings.DEBUG = False   # DEBUG면 모든 SQL 문자열을 기록해서 양쪽 다 느려짐
+    django.setup()
+
+    from django.core.management import call_command
+    call_command("migrate", verbosity=0)
+
+
+def fill_items(count, seed=0):
+    """ 가짜 매물 count개 (검색 인덱스 트리거는 측정과 무관하니 잠시 끔) """
+    from django.db import connection, transaction
+    from django.utils import timezone
+
+    rng = random.Random(seed)
+    now = timezone.now().isoformat()
+    with connection.cursor() as cursor:
+        triggers = cursor.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'gold_items'"
+        ).fetchall()
+        with transaction.atomic():
+            for name, _ in triggers:
+                cursor.execute(f'DROP TRIGGER "{name}"')
+            cursor.execute("DELETE FROM gold_items")
+            for start in range(0, count, INSERT_CHUNK):
+                cursor.executemany(
+                    "INSERT INTO gold_items (url, title, location, region, price, description, created_at, "
+                    "updated_at, list_fingerprint, purity, weight_g, risk_factor) "
+                    "VALUES (%s, '금', '서울', '서울', %s, '', %s, %s, '', %s, %s, 'LOW')",
+                    [
+                        (f"https://bench/{no}", rng.randrange(0, 5_000_000, 1000), now, now,
+                         rng.choice(PURITIES), round(rng.uniform(0, 40), 2))
+                        for no in range(start, min(count, start + INSERT_CHUNK))
+                    ],
+                )
+            for _, sql in triggers:
+                cursor.execute(sql)
+
+
+def run_vectorized(spot):
+    from make_gold.valuation import revalue
+
+    started = time.perf_counter()
+    updated = revalue(spot)
+    return updated, time.perf_counter() - started
+
+
+def run_row_by_row(spot, limit):
+    """ 예전 방식: 인스턴스를 하나씩 읽어서 계산하고 save(update_fields=...) """
+    from django.db import transaction
+    from make_gold.models import AuctionItem
+    from make_gold.valuation import VALUE_FIELDS, value_item
+
+    started = time.perf_counter()
+    with transaction.atomic():
+        items = AuctionItem.objects.only("id", "price", "weight_g", "purity").order_by("id")[:limit]
+        for item in items:
+            value_item(item, spot)
+            item.save(update_fields=VALUE_FIELDS)
+    return limit, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="전체 재평가 벤치마크 (numpy vs 행마다 ORM)")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="매물 수 목록 (쉼표 구분)")
+    parser.add_argument("--row-limit", type=int, default=20000, help="행마다 방식을 실측할 최대 행 수")
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_django(os.path.join(tmp, "bench.sqlite3"))
+        print(f"{'매물 수':>10} {'numpy 일괄':>12} {'행마다 ORM':>14} {'배율':>8}")
+        for size in sizes:
+            fill_items(size)
+
+            updated, vector_seconds = run_vectorized(spot=100000)
+            assert updated == size
+
+            measured, row_seconds = run_row_by_row(spot=110000, limit=min(size, args.row_limit))
+            estimated = row_seconds / measured * size
+            mark = "" if measured == size else " (추정)"
+            print(f"{size:>10,} {vector_seconds:>11.2f}초 {estimated:>11.2f}초{mark:<5} {estimated / vector_seconds:>7.1f}배")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from socketserver import ThreadingMixIn
+from urllib.parse import quote
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+import numpy as np
+
+# =========================================================
+# 리스트/API 부하 테스트: WSGI(동기 뷰) vs ASGI(async 뷰)
+# 실행: python -m make_gold.benchmarks.serving [--items 20000] [--requests 2000] [--concurrency 50]
+# - 임시 SQLite 파일에 가짜 매물 N개를 채우고 같은 DB로 두 서버를 차례로 띄워서 같은 요청을 보냄
+#   WSGI: wsgiref + 스레드 (요청마다 스레드 하나)   ASGI: uvicorn config.asgi (이벤트 루프 하나)
+# - 페이지 캐시는 끔(DummyCache) → 매 요청이 COUNT + 페이지 조회를 실제로 함
+# - 결과: 경로별 요청/초, p50 / p99 지연(ms), 실패 수
+# =========================================================
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+DEFAULT_PATHS = "/,/?sort=discount,/?region=서울,/api/items/?fields=url,price"
+KINDS = ("wsgi", "asgi")
+
+
+# ---------------------------------------------------------
+# 서버 (자식 프로세스로 실행: --serve wsgi|asgi)
+# ---------------------------------------------------------
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def configure(db_path, kind):
+    """ 같은 임시 DB / 캐시 끔 / DEBUG 끔 (settings를 읽기 전에 호출) """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    os.environ["GOLD_ASYNC_VIEWS"] = "1" if kind == "asgi" else ""
+    from django.conf import settings
+    settings.DATABASES["default"]["NAME"] = db_path
+    settings.DEBUG = False
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+
+def serve(kind, db_path, port):
+    configure(db_path, kind)
+    if kind == "wsgi":
+        from config.wsgi import application
+        server = make_server("127.0.0.1", port, application, ThreadingWSGIServer, QuietHandler)
+        server.serve_forever()
+    else:
+        import uvicorn
+        from config.asgi import application
+        uvicorn.run(application, host="127.0.0.1", port=port, log_level="warning")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(kind, db_path):
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "make_gold.benchmarks.serving", "--serve", kind, "--db", db_path, "--port", str(port)],
+        cwd=project_root,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{kind} 서버가 바로 종료됨 (exit {process.returncode})")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process, port
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError(f"{kind} 서버가 30초 안에 뜨지 않음")
+
+
+# ---------------------------------------------------------
+# 부하 생성 (asyncio 소켓, 요청마다 연결 새로)
+# ---------------------------------------------------------
+async def fetch(port, path):
+    """ GET 한 번 → (상태 코드, 걸린 초) """
+    started = time.perf_counter()
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        f"GET {quote(path, safe='/?=&,')} HTTP/1.1\r\nHost: 127.0.0.1\r\nConnection: close\r\n\r\n".encode("utf-8")
+    )
+    await writer.drain()
+    status_line = await reader.readline()
+    await reader.read()   # 본문까지 다 받아야 응답 완료
+    writer.close()
+    await writer.wait_closed()
+    try:
+        status = int(status_line.split()[1])
+    except (IndexError, ValueError):
+        status = 0
+    return status, time.perf_counter() - started
+
+
+async def load(port, path, total, concurrency):
+    """ 동시 concurrency개 연결로 total번 → (지연 배열, 실패 수, 걸린 초) """
+    latencies, failures = [], 0
+    remaining = iter(range(total))
+
+    async def worker():
+        nonlocal failures
+        for _ in remaining:
+            try:
+                status, seconds = await fetch(port, path)
+            except OSError:
+                status, seconds = 0, 0.0
+            if status == 200:
+                latencies.append(seconds)
+            else:
+                failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return np.array(latencies), failures, time.perf_counter() - started
+
+
+def measure(kind, db_path, paths, total, concurrency, warmup):
+    process, port = start_server(kind, db_path)
+    try:
+        results = []
+        for path in paths:
+            asyncio.run(load(port, path, warmup, min(concurrency, warmup)))
+            latencies, failures, seconds = asyncio.run(load(port, path, total, concurrency))
+            results.append((path, latencies, failures, seconds))
+        return results
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def print_row(kind, path, latencies, failures, seconds):
+    if len(latencies):
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+        rps = len(latencies) / seconds
+        print(f"{kind:<5} {path:<32} {rps:>9.0f} {p50:>9.1f} {p99:>9.1f} {failures:>6}")
+    else:
+        print(f"{kind:<5} {path:<32} {'-':>9} {'-':>9} {'-':>9} {failures:>6}")
+
+
+def split_paths(text):
+    """ '/,/api/items/?fields=url,price' → 경로 목록 (쉼표 뒤가 '/'로 시작할 때만 새 경로) """
+    paths = []
+    for part in text.split(","):
+        if part.startswith("/") or not paths:
+            paths.append(part)
+        else:
+            paths[-1] += "," + part
+    return [path for path in paths if path]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="리스트/API 부하 테스트 (WSGI 동기 뷰 vs ASGI async 뷰)")
+    parser.add_argument("--items", type=int, default=20000, help="가짜 매물 수")
+    parser.add_argument("--requests", type=int, default=2000, help="경로마다 보낼 요청 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 연결 수")
+    parser.add_argument("--warmup", type=int, default=50, help="측정 전에 버리는 요청 수")
+    parser.add_argument("--paths", default=DEFAULT_PATHS, help="요청 경로 목록 (쉼표 구분)")
+    parser.add_argument("--kinds", default=",".join(KINDS), help="비교할 배포 (wsgi,asgi)")
+    parser.add_argument("--serve", choices=KINDS, help=argparse.SUPPRESS)
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.db, args.port)
+        return
+
+    kinds = [kind for kind in args.kinds.split(",") if kind in KINDS]
+    if "asgi" in kinds:
+        try:
+            import uvicorn  # noqa: F401
+        except ImportError:
+            print("⚠️ uvicorn이 없어서 ASGI는 건너뜁니다. (pip install uvicorn)")
+            kinds.remove("asgi")
+    paths = split_paths(args.paths)
+
+    from make_gold.benchmarks.revalue import fill_items, setup_django
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "serving.sqlite3")
+        configure(db_path, "wsgi")   # 준비 단계의 재평가가 실제 캐시 폴더를 건드리지 않도록
+        setup_django(db_path)
+        fill_items(args.items)
+        from make_gold.valuation import revalue
+        revalue(100000)   # 할인율 정렬용 값 채움
+
+        print(f"매물 {args.items:,}개, 경로마다 {args.requests:,}요청, 동시 {args.concurrency}")
+        print(f"{'배포':<5} {'경로':<32} {'요청/초':>9} {'p50(ms)':>9} {'p99(ms)':>9} {'실패':>6}")
+        for kind in kinds:
+            for row in measure(kind, db_path, paths, args.requests, args.concurrency, args.warmup):
+                print_row(kind, *row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+# =========================================================
+# 규칙 엔진(1차) + AI(2차) 분석기 벤치마크
+# 실행: python -m make_gold.benchmarks.tiered_analyzer [--llm-latency 1.5]
+# - 픽스처 코퍼스에서 AI 호출이 얼마나 줄어드는지
+# - 규칙 엔진이 확신한 항목의 정확도
+# - 물건 1개당 지연시간 (규칙 엔진 실측 + AI 호출 추정)
+# =========================================================
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from make_gold import rules
+
+DEFAULT_CORPUS = os.path.join(project_root, "make_gold", "testdata", "spec_corpus.jsonl")
+
+
+def load_corpus(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run(path, repeat, llm_latency):
+    corpus = load_corpus(path)
+
+    # 1. 분류 결과 + 정확도
+    confident, correct = 0, 0
+    for row in corpus:
+        result = rules.classify(row["description"])
+        if rules.is_confident(result):
+            confident += 1
+            expected = (row["material"], row["purity"], row["weight_g"])
+            if (result["material"], result["purity"], result["weight_g"]) == expected:
+                correct += 1
+
+    # 2. 규칙 엔진 지연시간 (물건별로 repeat번 돌려 평균)
+    timings = []
+    for row in corpus:
+        started = time.perf_counter()
+        for _ in range(repeat):
+            rules.classify(row["description"])
+        timings.append((time.perf_counter() - started) / repeat * 1e6)
+
+    total = len(corpus)
+    llm_calls = total - confident
+    rule_mean_us = statistics.mean(timings)
+    tiered_ms = rule_mean_us / 1000 + llm_latency * 1000 * llm_calls / total
+
+    print(f"코퍼스: {total}개 ({os.path.basename(path)})")
+    print(f"AI 호출: {total}회 → {llm_calls}회 (감소율 {confident / total:.0%})")
+    print(f"규칙 엔진 확정 정확도: {correct}/{confident}")
+    print(f"규칙 엔진 지연: 평균 {rule_mean_us:.1f}µs / p50 {percentile(timings, 50):.1f}µs / p99 {percentile(timings, 99):.1f}µs")
+    print(f"물건당 예상 지연 (AI {llm_latency:.2f}초 가정): AI만 {llm_latency * 1000:.0f}ms → 계층형 {tiered_ms:.0f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="규칙 엔진 1차 분류 벤치마크")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="JSONL (description/material/purity/weight_g)")
+    parser.add_argument("--repeat", type=int, default=2000, help="지연 측정 반복 횟수")
+    parser.add_argument("--llm-latency", type=float, default=1.5, help="AI 호출 1회 평균 지연(초) 가정치")
+    args = parser.parse_args()
+
+    run(args.corpus, args.repeat, args.llm_latency)
@@ -0,0 +1,256 @@
+import atexit
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import (
+    InvalidSessionIdException, NoSuchWindowException, SessionNotCreatedException, WebDriverException,
+)
+from selenium.webdriver.chrome.service import Service
+
+# =========================================================
+# 공용 크롬 드라이버 풀 (probe / past_collector / gold_price 공용)
+# - chromedriver 경로는 한 번만 찾고 파일에 캐시 (매번 버전 체크 X)
+# - 브라우저를 미리 띄워두고(warm) 컨텍스트 매니저로 빌려줌
+# - N페이지 쓰면 새로 띄우고, 크래시 나면 버리고 새로 띄움
+# - size > 1 이면 여러 스레드가 동시에 하나씩 빌려 쓸 수 있음
+# =========================================================
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 드라이버 경로 캐시 파일 (CHROMEDRIVER_PATH 환경변수가 있으면 그걸 우선 사용)
+DRIVER_PATH_CACHE = os.path.join(project_root, ".chromedriver-path")
+DRIVER_PATH_MAX_AGE = 7 * 24 * 3600   # 일주일에 한 번은 버전 체크
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def driver_path():
+    """ chromedriver 실행 파일 경로 (프로세스 안에서는 메모리, 프로세스 간에는 파일로 캐시) """
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path:
+            return _driver_path
+
+        env_path = os.environ.get("CHROMEDRIVER_PATH")
+        if env_path:
+            _driver_path = env_path
+            return _driver_path
+
+        try:
+            fresh = time.time() - os.path.getmtime(DRIVER_PATH_CACHE) < DRIVER_PATH_MAX_AGE
+            with open(DRIVER_PATH_CACHE, encoding="utf-8") as f:
+                cached = f.read().strip()
+            if fresh and cached and os.path.exists(cached):
+                _driver_path = cached
+                return _driver_path
+        except OSError:
+            pass
+
+        # 캐시가 없거나 오래됐을 때만 webdriver_manager로 버전 체크 + 다운로드
+        from webdriver_manager.chrome import ChromeDriverManager
+        _driver_path = ChromeDriverManager().install()
+        try:
+            with open(DRIVER_PATH_CACHE, "w", encoding="utf-8") as f:
+                f.write(_driver_path)
+        except OSError:
+            pass
+        return _driver_path
+
+
+def make_options(headless=True, user_agent=None):
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument('--headless')
+    options.add_argument('window-size=1920x1080')
+    options.add_argument("--log-level=3")
+    if user_agent:
+        options.add_argument(f"user-agent={user_agent}")
+    return options
+
+
+def is_crash(error):
+    """
+    브라우저 세션 자체가 죽은 오류인지 (요소 못 찾음/타임아웃 같은 건 브라우저는 멀쩡함)
+    """
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException, SessionNotCreatedException)):
+        return True
+    # "chrome not reachable", "disconnected" 등은 하위 클래스 없이 WebDriverException으로 옴
+    return type(error) is WebDriverException
+
+
+def _install_page_counter(driver):
+    """ driver.get 호출 횟수 세기 (재활용 기준) """
+    original_get = driver.get
+    driver.pages_loaded = 0
+
+    def counting_get(url):
+        driver.pages_loaded += 1
+        return original_get(url)
+
+    driver.get = counting_get
+    return driver
+
+
+class DriverPool:
+    """
+    크롬 드라이버 풀
+        pool = DriverPool(size=3)
+        with pool.driver() as driver:
+            driver.get(url)
+    """
+
+    def __init__(self, size=1, headless=True, user_agent=None, max_pages=200, factory=None):
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self.headless = headless
+        self.user_agent = user_agent
+        self._factory = factory or self._launch
+        self._idle = queue.LifoQueue()   # 최근에 쓴(캐시가 따뜻한) 브라우저부터 재사용
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._in_use = 0
+        self._all = set()
+        self.launched = 0
+        self.recycled = 0
+
+    def _launch(self):
+        return webdriver.Chrome(
+            service=Service(driver_path()),
+            options=make_options(self.headless, self.user_agent),
+        )
+
+    def _create(self):
+        driver = _install_page_counter(self._factory())
+        with self._lock:
+            self._all.add(driver)
+            self.launched += 1
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            self._all.discard(driver)
+            self.recycled += 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def resize(self, size):
+        """ 동시에 빌려줄 수 있는 브라우저 수 변경 (늘리면 대기 중인 스레드를 깨움) """
+        with self._available:
+            self.size = max(1, size)
+            self._available.notify_all()
+
+    def warm(self, count=None):
+        """ 브라우저를 미리 띄워둠 (첫 요청의 콜드 스타트 제거) """
+        with self._lock:
+            missing = min(count or self.size, self.size) - len(self._all)
+        for _ in range(max(0, missing)):
+            self._idle.put(self._create())
+
+    def acquire(self, timeout=None):
+        """ 브라우저 하나 빌리기 (풀이 다 쓰이는 중이면 반납될 때까지 대기). 다 쓰면 release()로 반납 """
+        with self._available:
+            if not self._available.wait_for(lambda: self._in_use < self.size, timeout=timeout):
+                raise TimeoutError("사용 가능한 브라우저가 없습니다.")
+            self._in_use += 1
+
+        # 대기 중인 브라우저도 한도를 넘겼으면 버림 (반납 뒤에 페이지를 연 경우 등)
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if not self.expired(driver):
+                return driver
+            self._discard(driver)
+        try:
+            return self._create()
+        except Exception:
+            self._release_slot()
+            raise
+
+    def expired(self, driver):
+        """
+        max_pages만큼 페이지를 열었는지 (메모리가 계속 쌓이므로 새 브라우저로 교체 대상)
+        오래 빌려 쓰는 쪽(상주 샘플러 등)은 반납을 안 하므로 직접 확인하고 바꿔야 함
+        """
+        return driver.pages_loaded >= self.max_pages
+
+    def release(self, driver, broken=False):
+        """ 반납: 크래시 났거나 max_pages를 넘긴 브라우저는 종료하고 다음에 새로 띄움 """
+        try:
+            if broken or self.expired(driver):
+                self._discard(driver)
+            else:
+                self._idle.put(driver)
+        finally:
+            self._release_slot()
+
+    def _release_slot(self):
+        with self._available:
+            self._in_use -= 1
+            self._available.notify()
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """
+        with pool.driver() as driver: ... 형태로 빌려 쓰기
+        세션이 죽는 오류(is_crash)로 빠져나오면 그 브라우저는 버림
+        """
+        driver = self.acquire(timeout=timeout)
+        broken = False
+        try:
+            yield driver
+        except WebDriverException as e:
+            broken = is_crash(e)
+            raise
+        finally:
+            self.release(driver, broken=broken)
+
+    def close(self):
+        """ 풀의 모든 브라우저 종료 """
+        with self._lock:
+            drivers = list(self._all)
+            self._all.clear()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        while not self._idle.empty():
+            self._idle.get_nowait()
+
+
+# ---------------------------------------------------------
+# 프로세스 공용 풀 (같은 설정이면 같은 풀을 돌려줌)
+# ---------------------------------------------------------
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(size=1, headless=True, user_agent=None, max_pages=200):
+    key = (headless, user_agent)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = DriverPool(size=size, headless=headless, user_agent=user_agent, max_pages=max_pages)
+        elif size > pool.size:
+            pool.resize(size)
+        return pool
+
+
+@atexit.register
+def shutdown_all():
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
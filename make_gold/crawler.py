@@ -0,0 +1,90 @@
+import queue
+import threading
+
+# =========================================================
+# 동시 상세 페이지 수집기
+# - 워커 N개가 각자 세션(브라우저 or HTTP 세션)을 하나씩 잡고 URL을 나눠 처리
+# - 요청 간격은 워커별 sleep 대신 호스트별 속도 제한기(HostRateLimiter)가 통제
+# - 결과는 큐로 모이고, crawl()을 돌리는 스레드 하나가 받아서 저장 (단일 writer)
+# =========================================================
+
+_DONE = object()
+
+# 세션을 연속으로 못 여는 횟수 한도 (브라우저 실행 자체가 안 되는 경우)
+MAX_SESSION_FAILURES = 3
+
+
+def crawl(targets, fetch, open_session, workers=4, limiter=None, is_broken=None):
+    """
+    targets 를 동시에 처리하고 (target, result, error)를 끝난 순서대로 yield
+
+    - fetch(session, target) -> result     : 워커 스레드에서 실행 (DB 접근 금지)
+    - open_session()                       : 워커별 세션을 여는 컨텍스트 매니저
+    - limiter                              : wait(url)을 가진 속도 제한기
+    - is_broken(error) -> bool             : True면 그 세션을 버리고 새로 엶
+    """
+    pending = queue.Queue()
+    for target in targets:
+        pending.put(target)
+
+    results = queue.Queue()
+    stop = threading.Event()
+    is_broken = is_broken or (lambda error: False)
+
+    def next_target():
+        if stop.is_set():
+            return None
+        try:
+            return pending.get_nowait()
+        except queue.Empty:
+            return None
+
+    def work(session):
+        """ 세션 하나로 계속 처리. 세션이 망가지면 예외를 올려서 바깥에서 새로 열게 함 """
+        while True:
+            target = next_target()
+            if target is None:
+                return
+            if limiter:
+                limiter.wait(target["url"])
+            try:
+                result = fetch(session, target)
+            except Exception as e:
+                results.put((target, None, e))
+                if is_broken(e):
+                    raise
+                continue
+            results.put((target, result, None))
+
+    def worker():
+        failures = 0
+        try:
+            while not stop.is_set() and not pending.empty():
+                try:
+                    with open_session() as session:
+                        failures = 0
+                        work(session)
+                        return
+                except Exception as e:
+                    failures += 1
+                    if not is_broken(e) or failures >= MAX_SESSION_FAILURES:
+                        results.put((None, None, e))
+                        return
+        finally:
+            results.put(_DONE)
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(max(1, workers))]
+    for thread in threads:
+        thread.start()
+
+    try:
+        finished = 0
+        while finished < len(threads):
+            item = results.get()
+            if item is _DONE:
+                finished += 1
+                continue
+            yield item
+    finally:
+        # 소비하는 쪽이 중간에 멈추면 워커도 새 작업을 안 가져가게
+        stop.set()
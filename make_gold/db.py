@@ -0,0 +1,48 @@
+import os
+import sqlite3
+
+# =========================================================
+# SQLite 연결 설정 (한 파일을 여러 프로세스가 같이 씀)
+# - 쓰는 쪽: probe/agent (Django ORM), past_collector / gold_price (sqlite3 직접)
+# - 읽는 쪽: 웹 서버 (리스트 / API)
+# 모든 연결에 같은 PRAGMA를 적용:
+#   WAL          : 쓰는 중에도 읽기가 막히지 않음 (읽기는 스냅샷)
+#   synchronous  : WAL에서는 NORMAL이면 충분 (커밋마다 fsync 안 함)
+#   busy_timeout : 다른 프로세스가 쓰는 중이면 바로 "database is locked" 대신 기다림
+#   mmap_size / cache_size : 읽기를 OS 페이지 캐시 / 연결 캐시에서
+# 쓰기 트랜잭션은 처음부터 쓰기 잠금을 잡음(BEGIN IMMEDIATE):
+#   읽고 나서 쓰는 트랜잭션이 중간에 잠금을 올리다 실패하면 busy_timeout으로도 못 기다림
+#   → Django는 settings.DATABASES OPTIONS transaction_mode, sqlite3 직접 연결은 isolation_level
+# =========================================================
+
+BUSY_TIMEOUT_MS = 30000
+
+PRAGMAS = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("busy_timeout", BUSY_TIMEOUT_MS),
+    ("mmap_size", 256 * 1024 * 1024),   # 256MB
+    ("cache_size", -64000),             # 음수 = KiB 단위 → 약 64MB
+)
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'db.sqlite3')
+
+
+def apply_pragmas(cursor):
+    """ sqlite3 연결 / 커서 또는 Django 커서에 PRAGMA 적용 """
+    for name, value in PRAGMAS:
+        cursor.execute(f"PRAGMA {name}={value}")
+
+
+def get_db_connection(db_path=None):
+    """ 프로젝트 db.sqlite3에 연결 (db_path를 주면 그 파일) - PRAGMA 적용 + 쓰기는 BEGIN IMMEDIATE """
+    conn = sqlite3.connect(db_path or DEFAULT_DB_PATH, timeout=BUSY_TIMEOUT_MS / 1000, isolation_level="IMMEDIATE")
+    apply_pragmas(conn)
+    return conn
+
+
+def on_connection_created(sender, connection, **kwargs):
+    """ Django connection_created 시그널용 (apps.ready에서 연결) """
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            apply_pragmas(cursor)
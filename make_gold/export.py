@@ -0,0 +1,206 @@
+import csv
+from datetime import datetime, time as dt_time, timezone as dt_timezone
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.views.decorators.http import require_GET
+
+from .models import AuctionHistory, AuctionItem
+
+# =========================================================
+# 전체 덤프 (gold_items / auction_history) - CSV 또는 NDJSON을 한 줄씩 스트리밍
+# - ORM 인스턴스/리스트를 만들지 않고 values_list().iterator(chunk_size)로 N행씩만 읽어서 바로 씀
+#   → 테이블 크기와 상관없이 메모리 일정 (ASGI에서는 같은 iterator를 스레드에서 묶음씩 읽는 async 제너레이터)
+# - ?since= (gold_items: updated_at, auction_history: created_at) 이후 바뀐 행만 → 야간 동기화용
+#   (시세 재평가 valuation.revalue()도 updated_at을 올리므로 melt_value / discount_pct 변경도 포함)
+# - 웹: /api/export/<table>/?format=ndjson|csv&since=...   명령: python manage.py export_data <table>
+# =========================================================
+
+EXPORT_CHUNK_SIZE = 2000
+FORMATS = {
+    'ndjson': 'application/x-ndjson; charset=utf-8',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+ITEM_COLUMNS = (
+    'id', 'url', 'title', 'location', 'region', 'price', 'image_url', 'description',
+    'material', 'purity', 'weight_g', 'risk_factor', 'melt_value', 'discount_pct',
+    'created_at', 'updated_at',
+)
+HISTORY_COLUMNS = ('id', 'season', 'title', 'price', 'weight', 'purity_info', 'url', 'created_at')
+
+
+class ExportError(ValueError):
+    pass
+
+
+def parse_since(raw):
+    """ '2025-01-01' / '2025-01-01T09:00:00+09:00' → aware datetime (시간대 없으면 UTC) """
+    if not raw:
+        return None
+    try:
+        moment = parse_datetime(raw)
+    except ValueError:
+        moment = None
+    if moment is None:
+        day = parse_date(raw)
+        if day is None:
+            raise ExportError(f"since 형식을 알 수 없습니다: {raw} (예: 2025-01-01 또는 2025-01-01T09:00:00)")
+        moment = datetime.combine(day, dt_time.min)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment, dt_timezone.utc)
+    return moment
+
+
+# ---------------------------------------------------------
+# 테이블별 행 읽기 (values_list 쿼리셋 → 동기/async 이터레이터)
+# ---------------------------------------------------------
+def item_values(since=None):
+    items = AuctionItem.objects.order_by('id')
+    if since is not None:
+        # (updated_at, id) 인덱스 순서 → 마지막 행의 updated_at을 다음 동기화의 since로
+        # 같은 시각에 저장된 행을 놓치지 않도록 이상(>=) 비교 (겹치는 행은 받는 쪽 upsert로 처리)
+        items = items.filter(updated_at__gte=since).order_by('updated_at', 'id')
+    return items.values_list(*ITEM_COLUMNS)
+
+
+def history_values(since=None):
+    history = AuctionHistory.objects.order_by('id')
+    if since is not None:
+        # (created_at, id) 인덱스 순서 (gold_items와 같은 이상 비교)
+        history = history.filter(created_at__gte=since).order_by('created_at', 'id')
+    return history.values_list(*HISTORY_COLUMNS)
+
+
+EXPORTS = {
+    'gold_items': (ITEM_COLUMNS, item_values),
+    'auction_history': (HISTORY_COLUMNS, history_values),
+}
+
+
+def _export_values(table, since):
+    if table not in EXPORTS:
+        raise ExportError(f"내보낼 수 없는 테이블: {table} (가능: {', '.join(EXPORTS)})")
+    columns, values = EXPORTS[table]
+    return columns, values(since)
+
+
+def export_rows(table, since=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """ (컬럼 이름, 행 이터레이터). 모르는 테이블이면 ExportError """
+    columns, values = _export_values(table, since)
+    return columns, values.iterator(chunk_size=chunk_size)
+
+
+async def _achunks(rows, chunk_size):
+    """ 동기 행 이터레이터를 chunk_size개씩 스레드에서 읽어서 async로 내보냄 """
+    def next_chunk():
+        return list(islice(rows, chunk_size))
+
+    while True:
+        chunk = await sync_to_async(next_chunk)()
+        for row in chunk:
+            yield row
+        if len(chunk) < chunk_size:
+            break
+
+
+def aexport_rows(table, since=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    export_rows의 async 버전 (행은 async for로 chunk_size개씩 읽음)
+    values_list().aiterator()는 Django 5.2에서 첫 SELECT를 이벤트 루프에서 실행해서
+    SynchronousOnlyOperation이 남 → iterator()(아직 실행 전인 제너레이터)를 스레드에서 읽음
+    """
+    columns, values = _export_values(table, since)
+    return columns, _achunks(values.iterator(chunk_size=chunk_size), chunk_size)
+
+
+# ---------------------------------------------------------
+# 한 줄씩 직렬화
+# ---------------------------------------------------------
+class _Echo:
+    """ csv.writer가 쓴 줄을 버퍼에 모으지 않고 그대로 돌려줌 """
+
+    def write(self, value):
+        return value
+
+
+def _csv_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def render_csv(columns, rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow([_csv_value(value) for value in row])
+
+
+async def arender_csv(columns, rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(columns)
+    async for row in rows:
+        yield writer.writerow([_csv_value(value) for value in row])
+
+
+def render_ndjson(columns, rows):
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for row in rows:
+        yield encoder.encode(dict(zip(columns, row))) + "\n"
+
+
+async def arender_ndjson(columns, rows):
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    async for row in rows:
+        yield encoder.encode(dict(zip(columns, row))) + "\n"
+
+
+RENDERERS = {'ndjson': render_ndjson, 'csv': render_csv}
+ARENDERERS = {'ndjson': arender_ndjson, 'csv': arender_csv}
+
+
+def render(fmt, columns, rows, renderers=RENDERERS):
+    if fmt not in renderers:
+        raise ExportError(f"지원하지 않는 형식: {fmt} (가능: {', '.join(renderers)})")
+    return renderers[fmt](columns, rows)
+
+
+def arender(fmt, columns, rows):
+    """ render의 async 버전: async 행 이터레이터 → async 제너레이터 """
+    return render(fmt, columns, rows, ARENDERERS)
+
+
+# ---------------------------------------------------------
+# 뷰
+# ---------------------------------------------------------
+def _stream(request, table, read, write):
+    fmt = request.GET.get('format', 'ndjson')
+    try:
+        since = parse_since(request.GET.get('since', ''))
+        columns, rows = read(table, since)
+        lines = write(fmt, columns, rows)
+    except ExportError as e:
+        return JsonResponse({'error': str(e)}, status=400, json_dumps_params={'ensure_ascii': False})
+
+    response = StreamingHttpResponse(lines, content_type=FORMATS[fmt])
+    suffix = f"-since-{since:%Y%m%dT%H%M%S}" if since else ""
+    response['Content-Disposition'] = f'attachment; filename="{table}{suffix}.{fmt}"'
+    return response
+
+
+@require_GET
+def export_view(request, table):
+    return _stream(request, table, export_rows, render)
+
+
+@require_GET
+async def export_view_async(request, table):
+    """
+    export_view의 async 버전 (ASGI)
+    ASGI에서 동기 제너레이터를 스트리밍하면 Django가 sync_to_async(list)로 전부 읽은 뒤에 보냄(버퍼링)
+    → async 제너레이터(aexport_rows)로 chunk_size개씩 읽으면서 바로 보냄
+    """
+    return _stream(request, table, aexport_rows, arender)
@@ -1,122 +1,154 @@
+import argparse
 import time
 import re
-import sqlite3
 from datetime import datetime
 import os
-from selenium import webdriver
+import sys
+import django
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# 프로젝트 루트를 경로에 추가 (make_gold 패키지 import용)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# 새 시세가 들어오면 매물 가치 평가를 다시 해야 해서 Django ORM 사용
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+from make_gold.browser import DEFAULT_USER_AGENT, get_pool, is_crash
+from make_gold.prices import PriceSeries
+from make_gold.valuation import revalue
+
 # ==========================================
-# 1. DB 관련 함수
+# 1. DB 관련 함수 → prices.py (gold_price_series 시계열)
 # ==========================================
-def get_db_connection():
-    """상위 폴더에 있는 db.sqlite3에 연결"""
-    # 1. 현재 파일(collect_history.py)의 절대 경로를 구함
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    # 2. 부모 폴더(상위 폴더) 경로 구하기
-    parent_dir = os.path.dirname(current_dir)
-    
-    # 3. 경로 합치기 (부모폴더 + db.sqlite3)
-    db_path = os.path.join(parent_dir, 'db.sqlite3')
-    
-    return sqlite3.connect(db_path)
+DEFAULT_INTERVAL = 300   # 샘플러 모드 기본 조회 간격 (초)
 
-def init_db():
-    """DB 테이블이 없으면 생성"""
-    conn = get_db_connection() 
-    cur = conn.cursor()
-    
-    # [수정] price 타입을 REAL(실수) -> INTEGER(정수)로 변경
-    cur.execute('''
-        CREATE TABLE IF NOT EXISTS gold_price (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            date TEXT NOT NULL,
-            price INTEGER NOT NULL,
-            created_at TEXT
-        )
-    ''')
-    conn.commit()
-    conn.close()
-
-def save_to_db(price):
-    """가격을 DB에 저장"""
-    # 들어오는 price는 이제 int형입니다.
-    conn = get_db_connection()
-    cur = conn.cursor()
-    
-    today = datetime.now().strftime('%Y-%m-%d')
+def save_to_db(price, series=None):
+    """가격을 시계열에 기록 (직전과 같은 가격이면 구간만 연장, 새 가격이면 매물 재평가)"""
+    own = series is None
+    series = series or PriceSeries()
+    try:
+        changed = series.record(price)
+    finally:
+        if own:
+            series.close()
     now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    
-    cur.execute('''
-        INSERT INTO gold_price (date, price, created_at)
-        VALUES (?, ?, ?)
-    ''', (today, price, now))
-    
-    conn.commit()
-    conn.close()
-    # [수정] 출력 포맷도 정수로 변경
-    print(f"💾 [DB저장] {today} 기준 시세 {price:,}원 저장 완료!")
+    if changed:
+        print(f"💾 [DB저장] {now} 시세 {price:,}원 (새 가격)")
+        # 옛 시세로 평가된 매물만 다시 계산
+        print(f"📊 [가치 재평가] {revalue(price):,}개 갱신")
+    else:
+        print(f"💾 [DB저장] {now} 시세 {price:,}원 (변동 없음 → 구간 연장)")
+    return changed
 
 # ==========================================
 # 2. 크롤링 함수
 # ==========================================
-def get_gold_price_selenium():
-    options = webdriver.ChromeOptions()
-    options.add_argument('--headless') # 테스트 끝나면 주석 해제해서 창 안뜨게 해도 됨
-    options.add_argument('window-size=1920x1080')
-    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-    options.add_argument("--log-level=3") 
+def read_price(driver):
+    """ 네이버 금시세 → 신한은행 → 실물 팔 때 탭의 3.75g 가격을 1g 기준 정수로 """
+    driver.get("https://search.naver.com/search.naver?query=금시세")
+    wait = WebDriverWait(driver, 10)
+
+    # 신한은행 탭
+    shinhan_tab_xpath = "/html/body/div[3]/div[2]/div[1]/div[1]/section[2]/div[1]/div[1]/div[2]/a[2]"
+    shinhan_tab = wait.until(EC.element_to_be_clickable((By.XPATH, shinhan_tab_xpath)))
+    shinhan_tab.click()
+    time.sleep(0.5)
+
+    # 실물 팔 때 탭
+    real_gold_tab_xpath = "/html/body/div[3]/div[2]/div[1]/div[1]/section[2]/div[1]/div[2]/div[1]/div/ul/li[2]/a"
+    real_gold_tab = wait.until(EC.element_to_be_clickable((By.XPATH, real_gold_tab_xpath)))
+    real_gold_tab.click()
+    time.sleep(0.5)
+
+    # 가격 가져오기 (3.75g)
+    target_price_xpath = "/html/body/div[3]/div[2]/div[1]/div[1]/section[2]/div[1]/div[2]/div[2]/div[3]/div[2]/span"
+    price_element = wait.until(EC.visibility_of_element_located((By.XPATH, target_price_xpath)))
+    raw_price = price_element.text 
+
+    # [수정] 계산 로직: 반올림 후 정수(int) 변환
+    price_num = float(re.sub(r'[^\d]', '', raw_price))
     
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+    # 3.75로 나누고 -> 반올림(round) -> 정수 변환(int)
+    return int(round(price_num / 3.75))
+
+def get_gold_price_selenium():
+    # 공용 드라이버 풀에서 브라우저 빌리기 (네이버는 UA를 맞춰줘야 함)
+    pool = get_pool(headless=True, user_agent=DEFAULT_USER_AGENT)
+    driver = pool.acquire()
+    broken = False
     
     try:
-        driver.get("https://search.naver.com/search.naver?query=금시세")
-        wait = WebDriverWait(driver, 10)
-
-        # 신한은행 탭
-        shinhan_tab_xpath = "/html/body/div[3]/div[2]/div[1]/div[1]/section[2]/div[1]/div[1]/div[2]/a[2]"
-        shinhan_tab = wait.until(EC.element_to_be_clickable((By.XPATH, shinhan_tab_xpath)))
-        shinhan_tab.click()
-        time.sleep(0.5)
-
-        # 실물 팔 때 탭
-        real_gold_tab_xpath = "/html/body/div[3]/div[2]/div[1]/div[1]/section[2]/div[1]/div[2]/div[1]/div/ul/li[2]/a"
-        real_gold_tab = wait.until(EC.element_to_be_clickable((By.XPATH, real_gold_tab_xpath)))
-        real_gold_tab.click()
-        time.sleep(0.5)
-
-        # 가격 가져오기 (3.75g)
-        target_price_xpath = "/html/body/div[3]/div[2]/div[1]/div[1]/section[2]/div[1]/div[2]/div[2]/div[3]/div[2]/span"
-        price_element = wait.until(EC.visibility_of_element_located((By.XPATH, target_price_xpath)))
-        raw_price = price_element.text 
-
-        # [수정] 계산 로직: 반올림 후 정수(int) 변환
-        price_num = float(re.sub(r'[^\d]', '', raw_price))
-        
-        # 3.75로 나누고 -> 반올림(round) -> 정수 변환(int)
-        price_per_gram = int(round(price_num / 3.75))
-        
+        price_per_gram = read_price(driver)
         print(f"✅ 가져온 시세(1g): {price_per_gram:,}원") # 소수점 제거
         return price_per_gram
 
     except Exception as e:
         print(f"❌ 에러: {e}")
+        broken = is_crash(e)
         return None
     finally:
-        driver.quit()
+        pool.release(driver, broken=broken)
+
+def run_sampler(interval=DEFAULT_INTERVAL, count=None):
+    """
+    상주 모드: 브라우저 하나를 계속 띄워두고 interval초마다 시세 기록
+    count를 주면 그만큼 기록하고 종료 (Ctrl+C로도 종료)
+    """
+    pool = get_pool(headless=True, user_agent=DEFAULT_USER_AGENT)
+    series = PriceSeries()
+    driver = pool.acquire()
+    taken = 0
+    next_at = time.monotonic()
+    print(f"=== ⏱️ 금 시세 샘플러 시작 ({interval}초 간격) ===")
+    try:
+        while count is None or taken < count:
+            if pool.expired(driver):
+                # 계속 빌려두는 브라우저라 반납 때의 재활용 검사를 안 거침 → max_pages를 넘기면 여기서 교체
+                pool.release(driver)
+                driver = None
+                driver = pool.acquire()
+            try:
+                price = read_price(driver)
+                save_to_db(price, series)
+            except Exception as e:
+                print(f"❌ 에러: {e}")
+                if is_crash(e):
+                    # 브라우저가 죽었으면 새로 띄워서 계속
+                    pool.release(driver, broken=True)
+                    driver = None
+                    driver = pool.acquire()
+            taken += 1
+
+            # 조회에 걸린 시간만큼 빼고 대기 (간격이 밀리지 않게)
+            next_at += interval
+            time.sleep(max(0.0, next_at - time.monotonic()))
+    except KeyboardInterrupt:
+        print("\n>> 샘플러 종료 요청")
+    finally:
+        if driver is not None:
+            pool.release(driver)
+        series.close()
+        print(f"=== 샘플러 종료 (조회 {taken}회) ===")
 
 # ==========================================
 # 3. 메인 실행
 # ==========================================
 if __name__ == "__main__":
-    init_db()
-    
-    gold_price = get_gold_price_selenium()
-    
-    if gold_price:
-        save_to_db(gold_price)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="금 시세 수집 (1회 또는 상주 샘플러)")
+    parser.add_argument("--sample", action="store_true", help="상주 모드: interval초마다 계속 조회")
+    parser.add_argument("--interval", type=int, default=DEFAULT_INTERVAL, help="샘플러 조회 간격 (초)")
+    parser.add_argument("--count", type=int, default=None, help="샘플러 조회 횟수 (기본: 무한)")
+    args = parser.parse_args()
+
+    if args.sample:
+        run_sampler(interval=args.interval, count=args.count)
+    else:
+        gold_price = get_gold_price_selenium()
+        
+        if gold_price:
+            save_to_db(gold_price)
@@ -0,0 +1,83 @@
+import hashlib
+import re
+import unicodedata
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import AuctionItem
+
+# =========================================================
+# 증분 수집: 리스트 요약이 바뀐 물건만 상세 페이지 방문
+# - 리스트 카드 텍스트(list_text = 제목/가격/보관장소 ...)의 지문을 URL별로 저장
+# - 이번 리스트의 지문과 DB 지문을 쿼리 한 번으로 비교
+# - 지문이 같아도 마지막 상세 수집 후 N일 지나면 강제로 다시 수집
+# =========================================================
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(list_text):
+    """ 공백/전각 차이는 무시한 리스트 요약 텍스트의 sha256 """
+    text = _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", list_text or "")).strip()
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def refresh_days():
+    return getattr(settings, "CRAWL_REFRESH_DAYS", 7)
+
+
+class ChangeReport:
+    def __init__(self):
+        self.new = 0
+        self.changed = 0
+        self.expired = 0
+        self.skipped = 0
+
+    @property
+    def to_fetch(self):
+        return self.new + self.changed + self.expired
+
+    def summary(self):
+        return (
+            f"상세 수집 {self.to_fetch}개 (신규 {self.new} / 변경 {self.changed} / 기한 만료 {self.expired}), "
+            f"변경 없음 {self.skipped}개는 건너뜀"
+        )
+
+
+def select_changed(targets, max_age_days=None, now=None):
+    """
+    targets(리스트 수집 결과)에 'fingerprint'를 붙이고,
+    상세 페이지를 다시 봐야 하는 것만 골라서 (목록, ChangeReport) 반환
+    max_age_days=0 이면 전부 다시 수집
+    """
+    max_age_days = refresh_days() if max_age_days is None else max_age_days
+    now = now or timezone.now()
+    stale_before = now - timedelta(days=max_age_days)
+
+    for target in targets:
+        target['fingerprint'] = fingerprint(target['list_text'])
+
+    stored = {
+        url: (stored_fingerprint, fetched_at)
+        for url, stored_fingerprint, fetched_at in AuctionItem.objects
+        .filter(url__in=[target['url'] for target in targets])
+        .values_list('url', 'list_fingerprint', 'fingerprinted_at')
+    }
+
+    report = ChangeReport()
+    selected = []
+    for target in targets:
+        previous = stored.get(target['url'])
+        if previous is None:
+            report.new += 1
+        elif previous[0] != target['fingerprint']:
+            report.changed += 1
+        elif previous[1] is None or previous[1] <= stale_before:
+            report.expired += 1
+        else:
+            report.skipped += 1
+            continue
+        selected.append(target)
+    return selected, report
@@ -0,0 +1,252 @@
+import re
+from contextlib import contextmanager
+from urllib.parse import urljoin
+
+import requests
+from lxml import html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from make_gold.browser import DEFAULT_USER_AGENT
+from make_gold.rules import extract_weight, extract_purity
+
+# =========================================================
+# kapao 페이지 HTTP 수집기 (브라우저 없이 requests + lxml)
+# - 리스트/상세 페이지는 서버에서 렌더링되므로 HTML만 받아서 같은 XPath로 파싱
+# - 세션 하나가 커넥션 풀(keep-alive)을 유지 → 매 요청마다 TLS 핸드셰이크 안 함
+# - 회차 변경(set_ps) 같은 JS가 꼭 필요한 단계만 셀레니움(browser.py) 사용
+# - 파싱 함수는 text_at(xpath) 하나만 받아서 셀레니움/lxml 양쪽에서 같이 씀
+# =========================================================
+
+BASE_URL = "https://www.kapao.co.kr"
+LIST_URL = BASE_URL + "/ver2/p/item/item"
+CATEGORY = "귀금속"
+
+# --- 페이지 구조 (probe / past_collector 공용 XPath) ---
+LIST_XPATH = "/html/body/div[4]/main/div[2]/div[5]/ul/li"
+CATEGORY_LABEL_XPATH = "//*[@id='cate-info']//label[contains(., $category)]"
+SEARCH_FORM_ID = "frm_item_search"
+
+DETAIL_INFO_XPATH = "/html/body/div[4]/main/div[3]/div[1]/div[2]/dl"
+PRICE_XPATH = "/html/body/div[4]/main/div[3]/div[1]/div[2]/dl[2]"
+WEIGHT_DL_XPATH = "/html/body/div[4]/main/div[3]/div[1]/div[2]/dl[3]"
+WEIGHT_XPATH = "/html/body/div[4]/main/div[3]/div[1]/div[2]/dl[3]/dd/span"
+DESCRIPTION_BOX_XPATH = "/html/body/div[4]/main/div[3]/div[4]/div[1]"
+
+# div 위치가 9번일 수도, 13번일 수도 있으니 리스트로 순회하며 찾음
+DESCRIPTION_XPATHS = [
+    DESCRIPTION_BOX_XPATH + "/div[13]", # 네가 새로 발견한 곳
+    DESCRIPTION_BOX_XPATH + "/div[9]",  # 아까 발견한 곳
+    DESCRIPTION_BOX_XPATH,              # 전체 박스 (최후의 수단)
+]
+
+REQUEST_TIMEOUT = 10
+
+
+# ---------------------------------------------------------
+# 세션
+# ---------------------------------------------------------
+def make_session(pool_size=4):
+    """ keep-alive 커넥션 풀 + 일시 오류(5xx) 재시도가 붙은 세션 """
+    session = requests.Session()
+    retry = Retry(total=2, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "User-Agent": DEFAULT_USER_AGENT,
+        "Accept-Language": "ko-KR,ko;q=0.9",
+    })
+    return session
+
+
+@contextmanager
+def open_session():
+    """ crawl()용 워커별 세션 (requests.Session은 스레드 간 공유하지 않음) """
+    session = make_session()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def copy_cookies(driver, session):
+    """ 셀레니움에서 회차/필터를 바꾼 뒤 그 쿠키를 HTTP 세션으로 넘김 """
+    for cookie in driver.get_cookies():
+        session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/"))
+
+
+# ---------------------------------------------------------
+# HTML → 텍스트
+# ---------------------------------------------------------
+_BLOCK_TAGS = {
+    "address", "article", "br", "dd", "div", "dl", "dt", "footer", "form", "h1", "h2", "h3", "h4",
+    "h5", "h6", "header", "hr", "li", "main", "ol", "p", "section", "table", "tr", "ul",
+}
+_SKIP_TAGS = {"script", "style", "noscript", "template"}
+
+
+def inner_text(element):
+    """
+    셀레니움 element.text와 비슷하게: 블록 요소/줄바꿈(br)마다 줄을 나누고 공백 정리
+    """
+    parts = []
+
+    def walk(el):
+        tag = el.tag if isinstance(el.tag, str) else None
+        if tag not in _SKIP_TAGS and tag is not None:
+            if tag in _BLOCK_TAGS:
+                parts.append("\n")
+            if el.text:
+                parts.append(el.text)
+            for child in el:
+                walk(child)
+            if tag in _BLOCK_TAGS:
+                parts.append("\n")
+        if el.tail and el is not element:
+            parts.append(el.tail)
+
+    walk(element)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def load(content, url):
+    """ 응답 바이트 → lxml 문서 (인코딩은 meta charset 기준) """
+    return html.document_fromstring(content, base_url=url)
+
+
+def doc_text_at(doc):
+    """ lxml 문서용 text_at(xpath): 첫 요소의 텍스트, 없으면 None """
+    def text_at(xpath):
+        found = doc.xpath(xpath)
+        return inner_text(found[0]) if found else None
+    return text_at
+
+
+def driver_text_at(driver):
+    """ 셀레니움 드라이버용 text_at(xpath) """
+    from selenium.webdriver.common.by import By
+
+    def text_at(xpath):
+        found = driver.find_elements(By.XPATH, xpath)
+        return found[0].text if found else None
+    return text_at
+
+
+def get(session, url, **kwargs):
+    response = session.get(url, timeout=REQUEST_TIMEOUT, **kwargs)
+    response.raise_for_status()
+    return load(response.content, response.url)
+
+
+# ---------------------------------------------------------
+# 리스트 페이지
+# ---------------------------------------------------------
+def parse_summary(raw_text):
+    """ 리스트 카드의 dl 텍스트 → 제목 / 가격 / 보관장소 """
+    title = "제목 없음"
+    price = 0
+    location = "미분류"
+
+    for line in raw_text.split('\n'):
+        if "물품명" in line: title = line.replace("물품명", "").strip()
+        if "감정평가액" in line or "최저입찰가" in line:
+            # 가격 숫자만 추출
+            nums = re.findall(r'\d+', line.replace(",", ""))
+            if nums: price = int(nums[-1])
+        if "보관장소" in line: location = line.replace("보관장소", "").strip()
+
+    return {"title": title, "price": price, "location": location}
+
+
+def parse_list(doc):
+    """ 리스트 문서 → probe가 쓰는 target dict 목록 """
+    targets = []
+    for item in doc.xpath(LIST_XPATH):
+        links = item.xpath("./a/@href")
+        dls = item.xpath("./a/div[2]/dl")
+        if not links or not dls:
+            continue
+        images = item.xpath("./a/div[1]/div/img/@src")
+        raw_text = inner_text(dls[0])
+
+        target = {
+            "url": urljoin(doc.base_url or "", links[0]),
+            "image_url": urljoin(doc.base_url or "", images[0]) if images else "",
+            "list_text": raw_text,
+        }
+        target.update(parse_summary(raw_text))
+        targets.append(target)
+    return targets
+
+
+def search_request(doc, category=CATEGORY):
+    """
+    검색 폼을 그대로 채워서 (method, url, 파라미터) 반환
+    - 폼의 기본값(hidden 등)은 유지하고 카테고리 체크박스만 켬
+    """
+    form = doc.get_element_by_id(SEARCH_FORM_ID)
+    values = list(form.form_values())
+
+    inputs = doc.xpath(CATEGORY_LABEL_XPATH + "//input[@type='checkbox']", category=category)
+    if not inputs:
+        # <label for="..."> 형태
+        ids = doc.xpath(CATEGORY_LABEL_XPATH + "/@for", category=category)
+        inputs = [doc.get_element_by_id(ids[0])] if ids else []
+    if not inputs:
+        raise ValueError(f"'{category}' 카테고리 체크박스를 찾지 못했습니다.")
+
+    checkbox = inputs[0]
+    pair = (checkbox.get("name"), checkbox.get("value", "on"))
+    if pair not in values:
+        values.append(pair)
+    return (form.method or "GET").upper(), form.action or doc.base_url, values
+
+
+def fetch_list(session, url=LIST_URL, category=CATEGORY):
+    """ 리스트 페이지 열기 → 카테고리 검색 제출 → target 목록 """
+    method, action, values = search_request(get(session, url), category)
+    if method == "POST":
+        response = session.post(action, data=values, timeout=REQUEST_TIMEOUT)
+    else:
+        response = session.get(action, params=values, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return parse_list(load(response.content, response.url))
+
+
+# ---------------------------------------------------------
+# 상세 페이지
+# ---------------------------------------------------------
+def parse_detail(text_at, target):
+    """ 상세 페이지에서 무게/설명/순도 추출 (text_at: xpath → 텍스트 or None) """
+    weight_g = 0.0
+    full_description = target['list_text'] # 기본값
+    purity_val = "UNKNOWN"
+
+    # 1. 무게 추출
+    weight_text = text_at(WEIGHT_XPATH)
+    if weight_text:
+        weight_g = extract_weight(weight_text)
+
+    # 2. 상세 설명 및 순도 추출
+    for xpath in DESCRIPTION_XPATHS:
+        text = (text_at(xpath) or "").strip()
+
+        # 내용이 비어있지 않으면 이걸 상세 설명으로 채택!
+        if text:
+            full_description = text
+            # 전체 텍스트 안에서 순도 검색 (줄바꿈 포함)
+            purity_val = extract_purity(full_description)
+            break # 찾았으면 루프 탈출
+
+    return {
+        'description': full_description,
+        'weight_g': weight_g,
+        'purity': purity_val,
+    }
+
+
+def fetch_detail(session, target):
+    """ crawl()용: 상세 페이지를 HTTP로 받아서 파싱 """
+    return parse_detail(doc_text_at(get(session, target['url'])), target)
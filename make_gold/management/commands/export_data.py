@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from make_gold.export import EXPORT_CHUNK_SIZE, EXPORTS, RENDERERS, ExportError, export_rows, parse_since, render
+
+
+class Command(BaseCommand):
+    help = "gold_items / auction_history를 CSV 또는 NDJSON으로 한 줄씩 내보내기 (메모리 일정)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("table", choices=sorted(EXPORTS), help="내보낼 테이블")
+        parser.add_argument("--format", choices=sorted(RENDERERS), default="ndjson", help="출력 형식 (기본: ndjson)")
+        parser.add_argument("--since", default="", help="이 시각 이후 바뀐 행만 (예: 2025-01-01T00:00:00)")
+        parser.add_argument("--output", "-o", default="-", help="저장할 파일 (기본: 표준 출력)")
+        parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE, help="DB에서 한 번에 읽는 행 수")
+
+    def handle(self, *args, **options):
+        try:
+            since = parse_since(options["since"])
+            columns, rows = export_rows(options["table"], since, options["chunk_size"])
+            lines = render(options["format"], columns, rows)
+        except ExportError as e:
+            raise CommandError(str(e))
+
+        count = 0
+        if options["output"] == "-":
+            for line in lines:
+                self.stdout.write(line, ending="")
+                count += 1
+        else:
+            with open(options["output"], "w", encoding="utf-8", newline="") as out:
+                for line in lines:
+                    out.write(line)
+                    count += 1
+
+        if options["format"] == "csv":
+            count -= 1   # 헤더 줄
+        self.stderr.write(f"📦 {options['table']} {count:,}행 내보냄 ({options['format']})")
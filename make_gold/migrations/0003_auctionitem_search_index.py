@@ -0,0 +1,19 @@
+# 전문 검색 인덱스 (SQLite FTS5 / PostgreSQL pg_trgm)
+
+from django.db import migrations
+
+from ._search_sql import POSTGRES_BACKWARD, POSTGRES_FORWARD, SQLITE_BACKWARD, SQLITE_FORWARD, run_sql
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('make_gold', '0002_auctionitem_material_auctionitem_purity_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_sql({'sqlite': SQLITE_FORWARD, 'postgresql': POSTGRES_FORWARD}),
+            run_sql({'sqlite': SQLITE_BACKWARD, 'postgresql': POSTGRES_BACKWARD}),
+        ),
+    ]
@@ -0,0 +1,87 @@
+# Generated by Django 5.2.10 on 2026-10-18 06:53
+
+from django.db import migrations, models
+
+from ._search_sql import restore_search_triggers
+
+# make_gold.regions의 마이그레이션 시점 사본 (이후 앱 코드가 바뀌어도 이 마이그레이션 결과는 그대로)
+REGION_ALIASES = (
+    ("서울", ("서울특별시", "서울시", "서울")),
+    ("부산", ("부산광역시", "부산시", "부산")),
+    ("대구", ("대구광역시", "대구시", "대구")),
+    ("인천", ("인천광역시", "인천시", "인천")),
+    ("광주", ("광주광역시", "광주시", "광주")),
+    ("대전", ("대전광역시", "대전시", "대전")),
+    ("울산", ("울산광역시", "울산시", "울산")),
+    ("세종", ("세종특별자치시", "세종시", "세종")),
+    ("경기", ("경기도", "경기")),
+    ("강원", ("강원특별자치도", "강원도", "강원")),
+    ("충북", ("충청북도", "충북")),
+    ("충남", ("충청남도", "충남")),
+    ("전북", ("전북특별자치도", "전라북도", "전북")),
+    ("전남", ("전라남도", "전남")),
+    ("경북", ("경상북도", "경북")),
+    ("경남", ("경상남도", "경남")),
+    ("제주", ("제주특별자치도", "제주도", "제주")),
+)
+
+
+def normalize_region(location):
+    """ 가장 앞에 나오는 지역 표기 → 정규화된 지역명 (못 찾으면 빈 문자열) """
+    if not location:
+        return ""
+
+    best_region, best_pos = "", len(location)
+    for region, aliases in REGION_ALIASES:
+        for alias in aliases:
+            pos = location.find(alias)
+            if pos != -1 and pos < best_pos:
+                best_region, best_pos = region, pos
+    return best_region
+
+
+def backfill_region(apps, schema_editor):
+    """ 기존 물건들의 location → region 채우기 """
+    AuctionItem = apps.get_model('make_gold', 'AuctionItem')
+    batch = []
+    for item in AuctionItem.objects.only('id', 'location').iterator(chunk_size=1000):
+        item.region = normalize_region(item.location)
+        batch.append(item)
+        if len(batch) >= 1000:
+            AuctionItem.objects.bulk_update(batch, ['region'])
+            batch = []
+    if batch:
+        AuctionItem.objects.bulk_update(batch, ['region'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('make_gold', '0003_auctionitem_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='auctionitem',
+            name='region',
+            field=models.CharField(blank=True, default='', max_length=10, verbose_name='지역(정규화)'),
+        ),
+        migrations.RunPython(backfill_region, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='auctionitem',
+            index=models.Index(fields=['-created_at', '-id'], name='gold_items_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auctionitem',
+            index=models.Index(fields=['region', '-created_at', '-id'], name='gold_items_region_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auctionitem',
+            index=models.Index(fields=['risk_factor', 'id'], name='gold_items_risk_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auctionitem',
+            index=models.Index(fields=['purity', 'weight_g'], name='gold_items_purity_weight_idx'),
+        ),
+        migrations.RunPython(restore_search_triggers, migrations.RunPython.noop),
+    ]
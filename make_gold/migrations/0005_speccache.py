@@ -0,0 +1,29 @@
+# Generated by Django 5.2.10 on 2026-10-18 06:54
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('make_gold', '0004_auctionitem_region_and_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SpecCache',
+            fields=[
+                ('key', models.CharField(max_length=64, primary_key=True, serialize=False, verbose_name='캐시 키(sha256)')),
+                ('model_name', models.CharField(max_length=50)),
+                ('prompt_version', models.CharField(max_length=20)),
+                ('result', models.JSONField(verbose_name='분석 결과')),
+                ('hits', models.PositiveIntegerField(default=0, verbose_name='적중 횟수')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('last_used_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                'db_table': 'spec_cache',
+            },
+        ),
+    ]
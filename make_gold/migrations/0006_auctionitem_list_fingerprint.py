@@ -0,0 +1,26 @@
+# Generated by Django 5.2.10 on 2026-10-18 07:08
+
+from django.db import migrations, models
+
+from ._search_sql import restore_search_triggers
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('make_gold', '0005_speccache'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='auctionitem',
+            name='fingerprinted_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='상세 수집일시'),
+        ),
+        migrations.AddField(
+            model_name='auctionitem',
+            name='list_fingerprint',
+            field=models.CharField(blank=True, default='', max_length=64, verbose_name='리스트 요약 지문'),
+        ),
+        migrations.RunPython(restore_search_triggers, migrations.RunPython.noop),
+    ]
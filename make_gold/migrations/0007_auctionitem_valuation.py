@@ -0,0 +1,32 @@
+# Generated by Django 5.2.10 on 2026-10-18 07:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('make_gold', '0006_auctionitem_list_fingerprint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='auctionitem',
+            name='discount_pct',
+            field=models.FloatField(blank=True, null=True, verbose_name='시세 대비 할인율(%)'),
+        ),
+        migrations.AddField(
+            model_name='auctionitem',
+            name='melt_value',
+            field=models.BigIntegerField(blank=True, null=True, verbose_name='금 함량 가치'),
+        ),
+        migrations.AddField(
+            model_name='auctionitem',
+            name='valued_spot',
+            field=models.IntegerField(blank=True, null=True, verbose_name='평가 기준 1g 시세'),
+        ),
+        migrations.AddIndex(
+            model_name='auctionitem',
+            index=models.Index(fields=['-discount_pct', '-id'], name='gold_items_discount_idx'),
+        ),
+    ]
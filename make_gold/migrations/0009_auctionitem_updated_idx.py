@@ -0,0 +1,17 @@
+# Generated by Django 5.2.10 on 2026-10-18 07:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('make_gold', '0007_auctionitem_valuation'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='auctionitem',
+            index=models.Index(fields=['updated_at', 'id'], name='gold_items_updated_idx'),
+        ),
+    ]
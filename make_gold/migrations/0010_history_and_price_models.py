@@ -0,0 +1,143 @@
+# Generated by Django 5.2.10 on 2026-10-18 07:39
+
+import time
+from datetime import datetime, timezone
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+# past_collector.py / gold_price.py가 sqlite3로 직접 만들던 테이블을 모델로 옮김
+# 1. 기존 테이블을 *__raw로 이름만 바꿔두고  2. 모델 테이블 생성  3. INSERT ... SELECT로 한 번에 옮긴 뒤 raw 삭제
+# - gold_price_series: epoch 정수 → DateTimeField (UTC)
+# - auction_history   : 예전 중복 URL은 처음 저장된 행만 (UNIQUE), 빈 값은 기본값으로
+# - 시계열이 없고 더 예전 gold_price(날짜 TEXT)만 있으면 그걸 구간으로 묶어서 옮김 (gold_price는 그대로 둠)
+# 원래 테이블은 SQLite에서만 만들어졌으므로 다른 DB에서는 아무것도 안 함
+
+RAW_TABLES = ('auction_history', 'gold_price_series')
+LEGACY_TABLE = 'gold_price'
+
+
+# 예전 형식 변환은 여기서만 함 (수집기 / 백테스트는 마이그레이션을 마친 스키마를 전제로 함)
+# to_db_time은 make_gold.prices와 같은 저장 형식 (마이그레이션은 앱 모듈을 import하지 않음)
+def to_db_time(at):
+    """ epoch 초 → DateTimeField 저장 형식 (UTC) """
+    return datetime.fromtimestamp(int(at), timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _legacy_epoch(date_text, created_text):
+    for text, fmt in ((created_text, '%Y-%m-%d %H:%M:%S'), (date_text, '%Y-%m-%d')):
+        try:
+            return int(time.mktime(datetime.strptime(text, fmt).timetuple()))
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def legacy_ranges(rows):
+    """ 예전 gold_price 행 [(date, price, created_at), ...] → 구간 [(started_at, last_seen_at, price, samples), ...] """
+    observations = sorted(
+        (at, price) for at, price in
+        ((_legacy_epoch(date, created), price) for date, price, created in rows)
+        if at is not None
+    )
+    ranges = []
+    for at, price in observations:
+        if ranges and ranges[-1][2] == price:
+            started_at, _, _, samples = ranges[-1]
+            ranges[-1] = (started_at, at, price, samples + 1)
+        elif ranges and ranges[-1][0] == at:
+            ranges[-1] = (at, at, price, 1)     # 같은 시각에 다른 가격 → 나중 값
+        else:
+            ranges.append((at, at, price, 1))
+    return ranges
+
+
+def _table_columns(cursor, table):
+    cursor.execute(f'PRAGMA table_info("{table}")')
+    return {row[1]: row[2].upper() for row in cursor.fetchall()}
+
+
+def stash_raw_tables(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for table in RAW_TABLES:
+            if _table_columns(cursor, table):
+                cursor.execute(f'ALTER TABLE "{table}" RENAME TO "{table}__raw"')
+        # 예전 UNIQUE 인덱스는 이름째로 raw 테이블에 따라감 → 이름 비워둠
+        cursor.execute('DROP INDEX IF EXISTS "auction_history_url_uniq"')
+
+
+def import_raw_rows(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        if _table_columns(cursor, 'auction_history__raw'):
+            cursor.execute("""
+                INSERT OR IGNORE INTO auction_history (id, season, title, price, weight, purity_info, url, created_at)
+                SELECT id, COALESCE(season, 0), COALESCE(title, ''), price, weight, COALESCE(purity_info, ''), url,
+                       COALESCE(created_at, STRFTIME('%Y-%m-%d %H:%M:%f', 'NOW'))
+                FROM auction_history__raw ORDER BY id
+            """)
+            cursor.execute('DROP TABLE auction_history__raw')
+
+        columns = _table_columns(cursor, 'gold_price_series__raw')
+        if columns:
+            # epoch 정수(예전 형식)면 변환, 이미 날짜 문자열이면 그대로
+            to_time = (lambda c: f"DATETIME({c}, 'unixepoch')") if columns['started_at'] == 'INTEGER' else (lambda c: c)
+            cursor.execute(f"""
+                INSERT INTO gold_price_series (started_at, last_seen_at, price, samples)
+                SELECT {to_time('started_at')}, {to_time('last_seen_at')}, price, COALESCE(samples, 1)
+                FROM gold_price_series__raw
+            """)
+            cursor.execute('DROP TABLE gold_price_series__raw')
+        elif _table_columns(cursor, LEGACY_TABLE):
+            cursor.execute(f'SELECT date, price, created_at FROM "{LEGACY_TABLE}" ORDER BY id')
+            cursor.executemany(
+                "INSERT INTO gold_price_series (started_at, last_seen_at, price, samples) VALUES (%s, %s, %s, %s)",
+                [(to_db_time(start), to_db_time(last), price, samples)
+                 for start, last, price, samples in legacy_ranges(cursor.fetchall())],
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('make_gold', '0009_auctionitem_updated_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(stash_raw_tables, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='GoldPrice',
+            fields=[
+                ('started_at', models.DateTimeField(primary_key=True, serialize=False, verbose_name='구간 시작(첫 관측)')),
+                ('last_seen_at', models.DateTimeField(verbose_name='마지막 관측')),
+                ('price', models.DecimalField(decimal_places=2, max_digits=12, verbose_name='1g 시세(원)')),
+                ('samples', models.PositiveIntegerField(db_default=1, verbose_name='관측 수')),
+            ],
+            options={
+                'db_table': 'gold_price_series',
+                'ordering': ['-started_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='AuctionHistory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('season', models.IntegerField(verbose_name='회차')),
+                ('title', models.TextField(blank=True, default='', verbose_name='물품명')),
+                ('price', models.BigIntegerField(blank=True, null=True, verbose_name='낙찰가/감정가')),
+                ('weight', models.DecimalField(blank=True, decimal_places=3, max_digits=10, null=True, verbose_name='중량(g)')),
+                ('purity_info', models.TextField(blank=True, default='', verbose_name='함량 문구')),
+                ('url', models.URLField(blank=True, max_length=500, null=True, unique=True, verbose_name='상세페이지 URL')),
+                ('created_at', models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), verbose_name='수집일시')),
+            ],
+            options={
+                'db_table': 'auction_history',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['season'], name='auction_history_season_idx'), models.Index(fields=['created_at', 'id'], name='auction_history_created_idx')],
+            },
+        ),
+        migrations.RunPython(import_raw_rows, migrations.RunPython.noop),
+    ]
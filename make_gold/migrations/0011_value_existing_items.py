@@ -0,0 +1,46 @@
+# Generated by Django 5.2.10 on 2026-10-18 09:02
+
+from django.db import migrations
+
+
+# 0007에서 평가 컬럼을 만들었지만, 시세(gold_price_series)는 0010에서야 모델 테이블로 옮겨지므로
+# 이미 수집된 물건들의 첫 평가는 여기서 함
+# make_gold.valuation의 마이그레이션 시점 사본 (이후 앱 코드가 바뀌어도 이 마이그레이션 결과는 그대로)
+PURITY_FRACTION = {"24K": 1.0, "18K": 0.75, "14K": 0.585}
+VALUE_FIELDS = ['melt_value', 'discount_pct', 'valued_spot']
+
+
+def valuation(price, weight_g, purity, spot):
+    """ 금 함량 가치 / 시세 대비 할인율 (금이 아니거나 무게를 모르면 NULL, 가격 0 = 정보 없음) """
+    melt = round((weight_g or 0) * PURITY_FRACTION.get(purity, 0.0) * spot)
+    if melt <= 0:
+        return {'melt_value': None, 'discount_pct': None, 'valued_spot': spot}
+    discount = round((melt - price) * 100.0 / melt, 2) if price else None
+    return {'melt_value': melt, 'discount_pct': discount, 'valued_spot': spot}
+
+
+def value_existing(apps, schema_editor):
+    """ 이미 수집된 물건들을 최신 시세로 한 번 평가 (시세 기록이 없으면 건너뜀) """
+    db = schema_editor.connection.alias
+    GoldPrice = apps.get_model('make_gold', 'GoldPrice')
+    spot = GoldPrice.objects.using(db).order_by('-started_at').values_list('price', flat=True).first()
+    if spot is None:
+        return
+    spot = int(spot)
+    AuctionItem = apps.get_model('make_gold', 'AuctionItem')
+    items = list(AuctionItem.objects.using(db).only('id', 'price', 'weight_g', 'purity'))
+    for item in items:
+        for field, value in valuation(item.price, item.weight_g, item.purity, spot).items():
+            setattr(item, field, value)
+    AuctionItem.objects.using(db).bulk_update(items, VALUE_FIELDS, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('make_gold', '0010_history_and_price_models'),
+    ]
+
+    operations = [
+        migrations.RunPython(value_existing, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,85 @@
+# 검색 인덱스 DDL 모음 (0003이 만들고, gold_items를 새로 만드는 0004 / 0006이 트리거를 다시 만듦)
+# 이름이 _로 시작하므로 마이그레이션 로더는 이 모듈을 마이그레이션으로 읽지 않음
+
+# save(), bulk_create(update_conflicts=True) 모두 트리거로 동기화
+SQLITE_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS gold_items_fts_ai AFTER INSERT ON gold_items BEGIN
+        INSERT INTO gold_items_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS gold_items_fts_ad AFTER DELETE ON gold_items BEGIN
+        INSERT INTO gold_items_fts(gold_items_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS gold_items_fts_au AFTER UPDATE OF title, description ON gold_items BEGIN
+        INSERT INTO gold_items_fts(gold_items_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO gold_items_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+# 기존에 쌓인 (또는 트리거가 없던 동안 바뀐) 데이터 색인
+SQLITE_REBUILD = "INSERT INTO gold_items_fts(gold_items_fts) VALUES('rebuild')"
+
+SQLITE_FORWARD = [
+    # external content 테이블: 본문은 gold_items에만 저장하고 FTS는 인덱스만 보관
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS gold_items_fts USING fts5(
+        title, description,
+        content='gold_items', content_rowid='id',
+        tokenize='trigram'
+    )
+    """,
+    # rank 컬럼 기본 랭킹 함수: 제목 가중치 10, 설명 가중치 1
+    "INSERT INTO gold_items_fts(gold_items_fts, rank) VALUES('rank', 'bm25(10.0, 1.0)')",
+    *SQLITE_TRIGGERS,
+    SQLITE_REBUILD,
+]
+
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS gold_items_fts_au",
+    "DROP TRIGGER IF EXISTS gold_items_fts_ad",
+    "DROP TRIGGER IF EXISTS gold_items_fts_ai",
+    "DROP TABLE IF EXISTS gold_items_fts",
+]
+
+# search.py도 이 식을 그대로 씀 → 검색 쿼리의 식이 인덱스 식과 글자 그대로 같아야 인덱스를 탐
+PG_SEARCH_VECTOR = (
+    "(setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B'))"
+)
+
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    # Django의 icontains는 UPPER("title"::text) LIKE UPPER(%s)로 나감 → 같은 식에 trigram 인덱스
+    "CREATE INDEX IF NOT EXISTS gold_items_title_trgm ON gold_items USING gin ((UPPER(title::text)) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS gold_items_desc_trgm ON gold_items USING gin ((UPPER(description::text)) gin_trgm_ops)",
+    # 단어 매칭 + 랭킹용 tsvector 식 인덱스 (제목 A / 설명 B 가중치)
+    f"CREATE INDEX IF NOT EXISTS gold_items_search_vector ON gold_items USING gin ({PG_SEARCH_VECTOR})",
+]
+
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS gold_items_search_vector",
+    "DROP INDEX IF EXISTS gold_items_desc_trgm",
+    "DROP INDEX IF EXISTS gold_items_title_trgm",
+]
+
+
+def run_sql(statements_by_vendor):
+    """ {vendor: [sql, ...]} → 현재 DB 종류에 맞는 SQL만 실행하는 RunPython 함수 """
+    def run(apps, schema_editor):
+        for sql in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(sql, params=None)
+    return run
+
+
+# SQLite에서 NOT NULL 컬럼 추가는 gold_items를 새로 만들어 복사하는 방식이라 트리거가 같이 사라짐
+# → 그런 마이그레이션 끝에서 다시 만들고 그동안 빠진 행까지 색인
+restore_search_triggers = run_sql({'sqlite': [*SQLITE_TRIGGERS, SQLITE_REBUILD]})
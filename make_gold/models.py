@@ -1,4 +1,19 @@
 from django.db import models
+from django.db.models.functions import Now
+from django.utils import timezone
+from .regions import normalize_region
+from .valuation import VALUE_FIELDS, value_item
+
+
+class AuctionItemQuerySet(models.QuerySet):
+    def in_region(self, region):
+        """ 지역 버튼(서울/경기/부산...) 필터: 정규화된 region 컬럼 동등 비교 (인덱스 사용) """
+        return self.filter(region=normalize_region(region) or region)
+
+    def pending_analysis(self):
+        """ AI 분석 대기 물건 (risk_factor, id) 인덱스 순서대로 """
+        return self.filter(risk_factor="UNKNOWN").order_by("id")
+
 
 class AuctionItem(models.Model):
     # 1. 식별자 (URL을 ID로)
@@ -8,6 +23,7 @@ class AuctionItem(models.Model):
     image_url = models.URLField(max_length=500, null=True, blank=True, verbose_name="썸네일 URL")
     title = models.CharField(max_length=255, verbose_name="물품명")
     location = models.CharField(max_length=100, verbose_name="보관장소/지역")
+    region = models.CharField(max_length=10, blank=True, default="", verbose_name="지역(정규화)")
     price = models.BigIntegerField(default=0, verbose_name="최저입찰가")
 
     # 3. 상세 정보
@@ -16,15 +32,113 @@ class AuctionItem(models.Model):
     # 4. 메타 데이터
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="수집일시")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="갱신일시")
+    list_fingerprint = models.CharField(max_length=64, blank=True, default="", verbose_name="리스트 요약 지문")
+    fingerprinted_at = models.DateTimeField(null=True, blank=True, verbose_name="상세 수집일시")
 
     material = models.CharField(max_length=50, blank=True, null=True)  # 재질
     purity = models.CharField(max_length=20, blank=True, null=True)    # 순도
     weight_g = models.FloatField(default=0.0)                          # 무게
     risk_factor = models.CharField(max_length=20, default="UNKNOWN")   # 위험도
 
+    # 5. 가치 평가 (make_gold.valuation) - 시세가 바뀌면 다시 계산
+    melt_value = models.BigIntegerField(null=True, blank=True, verbose_name="금 함량 가치")
+    discount_pct = models.FloatField(null=True, blank=True, verbose_name="시세 대비 할인율(%)")
+    valued_spot = models.IntegerField(null=True, blank=True, verbose_name="평가 기준 1g 시세")
+
+    objects = AuctionItemQuerySet.as_manager()
+
     def __str__(self):
         return f"[{self.location}] {self.title}"
 
+    def save(self, *args, spot=None, **kwargs):
+        # 보관장소가 바뀌면 지역 컬럼도 같이 맞춰줌
+        self.region = normalize_region(self.location)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "location" in update_fields:
+            kwargs["update_fields"] = update_fields = {*update_fields, "region"}
+
+        # spot(1g 시세)을 주면 가치 평가도 같이 저장
+        # 시세 조회는 호출한 쪽에서 (저장마다 SELECT 하지 않도록, 묶음이면 한 번만 조회해서 넘김)
+        # 안 주면 평가 컬럼은 그대로 → valued_spot이 최신 시세와 다르니 다음 revalue()가 채움
+        if spot is not None:
+            value_item(self, spot)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, *VALUE_FIELDS}
+        super().save(*args, **kwargs)
+
     class Meta:
         db_table = 'gold_items' # 테이블 이름도 'gold_items'로 센스 있게 바꿨다
-        ordering = ['-created_at']
\ No newline at end of file
+        ordering = ['-created_at']
+        indexes = [
+            # 리스트 최신순 정렬 + 키셋 페이지네이션
+            models.Index(fields=['-created_at', '-id'], name='gold_items_created_idx'),
+            # 지역 버튼 필터 + 최신순
+            models.Index(fields=['region', '-created_at', '-id'], name='gold_items_region_idx'),
+            # agent.run_batch_analysis 대기열
+            models.Index(fields=['risk_factor', 'id'], name='gold_items_risk_idx'),
+            # 순도/무게 기준 가치 조회
+            models.Index(fields=['purity', 'weight_g'], name='gold_items_purity_weight_idx'),
+            # 시세 대비 할인율 정렬/필터 + 키셋 페이지네이션
+            models.Index(fields=['-discount_pct', '-id'], name='gold_items_discount_idx'),
+            # 증분 내보내기 (?since=updated_at)
+            models.Index(fields=['updated_at', 'id'], name='gold_items_updated_idx'),
+        ]
+
+
+class SpecCache(models.Model):
+    """ AI 스펙 추출 결과 캐시 (정규화된 설명 + 프롬프트 버전 + 모델명 해시 → 결과) """
+    key = models.CharField(max_length=64, primary_key=True, verbose_name="캐시 키(sha256)")
+    model_name = models.CharField(max_length=50)
+    prompt_version = models.CharField(max_length=20)
+    result = models.JSONField(verbose_name="분석 결과")
+    hits = models.PositiveIntegerField(default=0, verbose_name="적중 횟수")
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)   # TTL 기준
+    last_used_at = models.DateTimeField(default=timezone.now, db_index=True)  # LRU 기준
+
+    def __str__(self):
+        return f"{self.model_name}/{self.prompt_version} {self.key[:12]}"
+
+    class Meta:
+        db_table = 'spec_cache'
+
+
+class GoldPrice(models.Model):
+    """
+    금 1g 시세 구간 (gold_price.py가 수집, make_gold.prices.PriceSeries가 sqlite3로 직접 기록)
+    같은 가격이 이어지면 새 행 대신 last_seen_at / samples만 늘림 → started_at이 구간의 키
+    """
+    started_at = models.DateTimeField(primary_key=True, verbose_name="구간 시작(첫 관측)")
+    last_seen_at = models.DateTimeField(verbose_name="마지막 관측")
+    price = models.DecimalField(max_digits=12, decimal_places=2, verbose_name="1g 시세(원)")
+    samples = models.PositiveIntegerField(db_default=1, verbose_name="관측 수")
+
+    def __str__(self):
+        return f"{self.started_at:%Y-%m-%d %H:%M} {self.price}원"
+
+    class Meta:
+        db_table = 'gold_price_series'
+        ordering = ['-started_at']
+
+
+class AuctionHistory(models.Model):
+    """ 지난 회차 낙찰 물건 (past_collector.py가 sqlite3로 직접 기록 → created_at은 DB 기본값) """
+    season = models.IntegerField(verbose_name="회차")
+    title = models.TextField(blank=True, default="", verbose_name="물품명")
+    price = models.BigIntegerField(null=True, blank=True, verbose_name="낙찰가/감정가")
+    weight = models.DecimalField(max_digits=10, decimal_places=3, null=True, blank=True, verbose_name="중량(g)")
+    purity_info = models.TextField(blank=True, default="", verbose_name="함량 문구")
+    url = models.URLField(max_length=500, unique=True, null=True, blank=True, verbose_name="상세페이지 URL")
+    created_at = models.DateTimeField(db_default=Now(), verbose_name="수집일시")
+
+    def __str__(self):
+        return f"[{self.season}회] {self.title}"
+
+    class Meta:
+        db_table = 'auction_history'
+        ordering = ['id']
+        indexes = [
+            # 회차별 조회 (백테스트 --seasons, 관리 화면)
+            models.Index(fields=['season'], name='auction_history_season_idx'),
+            # 증분 내보내기 (?since=created_at) / 기간 조회
+            models.Index(fields=['created_at', 'id'], name='auction_history_created_idx'),
+        ]
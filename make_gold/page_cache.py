@@ -0,0 +1,121 @@
+import hashlib
+import json
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+
+# =========================================================
+# 리스트 페이지(gold_list) 응답 캐시
+# - 키: 정규화된 (검색어, 지역, 정렬, 할인율 필터, 페이지 크기, 커서) + 데이터 버전
+# - 데이터 버전은 probe(ItemWriter) / agent / 시세 재평가가 저장을 커밋한 뒤 올림
+#   → 새 버전에서는 키가 달라져서 예전 페이지가 나갈 일이 없음 (옛 키는 만료에 맡김)
+# - async 뷰(ASGI)는 a로 시작하는 버전 사용 (캐시 파일 I/O를 이벤트 루프 밖 스레드에서)
+# - 수집기와 웹 서버는 프로세스가 달라서 기본 캐시는 프로세스 간 공유되는 파일 캐시 (settings.CACHES)
+# =========================================================
+
+VERSION_KEY = "gold_list:data_version"
+
+
+class PageCacheStats:
+    """ 이 프로세스의 적중/미스 카운터 (응답 헤더 X-Cache-Hit-Rate로도 보임) """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def summary(self):
+        return f"리스트 캐시 적중 {self.hits} / 미스 {self.misses} (적중률 {self.hit_rate:.0%})"
+
+
+stats = PageCacheStats()
+
+
+# ---------------------------------------------------------
+# 데이터 버전
+# ---------------------------------------------------------
+def data_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        version = time.time_ns()
+        # 다른 프로세스가 먼저 만들었으면 그 값을 씀
+        if not cache.add(VERSION_KEY, version, timeout=None):
+            version = cache.get(VERSION_KEY, version)
+    return version
+
+
+def bump_data_version():
+    """ 새 토큰으로 교체 (증가 대신 교체라서 여러 프로세스가 동시에 올려도 안전) """
+    cache.set(VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def bump_on_commit():
+    """
+    저장이 커밋된 뒤에 버전 올림 (트랜잭션 밖이면 바로)
+    커밋 전에 올리면 그 사이 요청이 옛 데이터를 새 버전 키로 캐시할 수 있음
+    """
+    transaction.on_commit(bump_data_version)
+
+
+def on_item_change(sender, **kwargs):
+    """ AuctionItem post_save / post_delete 시그널용 (admin 수정 등) """
+    bump_on_commit()
+
+
+# ---------------------------------------------------------
+# 응답 저장/조회
+# ---------------------------------------------------------
+def page_key(version, **params):
+    raw = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+    return f"gold_list:page:{version}:" + hashlib.md5(raw.encode()).hexdigest()
+
+
+def get(key):
+    """ 캐시된 응답 (없으면 None). 적중/미스 기록 + X-Cache 헤더 """
+    cached = cache.get(key)
+    stats.record(cached is not None)
+    if cached is None:
+        return None
+    content, content_type = cached
+    return _with_headers(HttpResponse(content, content_type=content_type), "HIT")
+
+
+def put(key, response):
+    if response.status_code == 200:
+        timeout = getattr(settings, "GOLD_LIST_PAGE_CACHE_TIMEOUT", 600)
+        cache.set(key, (response.content, response["Content-Type"]), timeout)
+    return _with_headers(response, "MISS")
+
+
+def _with_headers(response, status):
+    response["X-Cache"] = status
+    response["X-Cache-Hit-Rate"] = f"{stats.hit_rate:.2f}"
+    return response
+
+
+# ---------------------------------------------------------
+# async 뷰용
+# ---------------------------------------------------------
+adata_version = sync_to_async(data_version)
+aget = sync_to_async(get)
+aput = sync_to_async(put)
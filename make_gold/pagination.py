@@ -0,0 +1,174 @@
+import base64
+import binascii
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+# =========================================================
+# 리스트 페이지네이션 도우미
+# - 기본 목록 : (created_at, id) 키셋(커서) 페이지네이션 → OFFSET 없이 인덱스 탐색
+# - 할인율 순 : (discount_pct, id) 키셋 (값은 valuation이 미리 계산해서 저장)
+# - 검색 결과 : 관련도 순이라 키셋이 불가 → 최대 결과 창(window) 안에서만 OFFSET 허용
+# - a로 시작하는 함수(akeyset_page 등)는 같은 동작의 async 버전 (ASGI 뷰용)
+# =========================================================
+
+
+def get_page_size(raw_value=None):
+    """ ?size= 파라미터를 설정값 범위 안으로 보정 """
+    default = getattr(settings, "GOLD_LIST_PAGE_SIZE", 40)
+    maximum = getattr(settings, "GOLD_LIST_MAX_PAGE_SIZE", 100)
+    try:
+        size = int(raw_value)
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(size, maximum))
+
+
+def encode_cursor(position):
+    """ {'c': ..., 'i': ...} → URL에 그대로 넣을 수 있는 문자열 """
+    raw = json.dumps(position, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    """ 커서 문자열 → dict (깨졌거나 비어있으면 None = 첫 페이지) """
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        position = json.loads(raw)
+    except (binascii.Error, ValueError):
+        return None
+    return position if isinstance(position, dict) else None
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# 키셋 정렬 기준: 이름 → (컬럼, 커서 값 → 비교 값, 행 → 커서 값)
+# 둘 다 (컬럼 DESC, id DESC) 순서이고 같은 모양의 인덱스가 있음
+KEYSET_ORDERS = {
+    "latest": ("created_at", lambda raw: parse_datetime(str(raw)), lambda value: value.isoformat()),
+    "discount": ("discount_pct", _to_float, float),
+}
+
+
+def _field(row, name):
+    """ 모델 인스턴스 / .values() dict 둘 다 """
+    return row[name] if isinstance(row, dict) else getattr(row, name)
+
+
+def _keyset_query(queryset, cursor, page_size, order):
+    """ 커서 위치 이후를 (컬럼 DESC, id DESC) 순서로 page_size + 1개 (아직 DB 조회 안 함) """
+    column, parse, _ = KEYSET_ORDERS[order]
+    position = decode_cursor(cursor)
+    if position:
+        value = parse(position.get("c", ""))
+        last_id = position.get("i")
+        if value is not None and isinstance(last_id, int):
+            queryset = queryset.filter(
+                Q(**{f"{column}__lt": value}) |
+                Q(**{column: value, "id__lt": last_id})
+            )
+
+    # 한 개 더 가져와서 다음 페이지 존재 여부 판단 (COUNT 불필요)
+    return queryset.order_by(f"-{column}", "-id")[:page_size + 1]
+
+
+def _keyset_result(rows, page_size, order):
+    column, _, dump = KEYSET_ORDERS[order]
+    if len(rows) <= page_size:
+        return rows, None
+
+    rows = rows[:page_size]
+    last = rows[-1]
+    return rows, encode_cursor({"c": dump(_field(last, column)), "i": _field(last, "id")})
+
+
+def keyset_page(queryset, cursor, page_size, order="latest"):
+    """
+    (컬럼 DESC, id DESC) 키셋 페이지 조회 (기본: 최신순, "discount": 할인율 높은 순)
+    .values() 쿼리셋이면 정렬 컬럼과 id가 포함되어 있어야 함
+    반환: (이번 페이지 아이템 리스트, 다음 페이지 커서 or None)
+    """
+    rows = list(_keyset_query(queryset, cursor, page_size, order))
+    return _keyset_result(rows, page_size, order)
+
+
+async def akeyset_page(queryset, cursor, page_size, order="latest"):
+    """ keyset_page의 async 버전 (ASGI 뷰용) """
+    rows = [row async for row in _keyset_query(queryset, cursor, page_size, order)]
+    return _keyset_result(rows, page_size, order)
+
+
+def _window_bounds(cursor, page_size, window):
+    """ 커서 → (offset, limit) - 최대 window개 안으로 보정 """
+    position = decode_cursor(cursor) or {}
+    try:
+        offset = int(position.get("o", 0))
+    except (TypeError, ValueError):
+        offset = 0
+    offset = max(0, min(offset, window))
+    return offset, min(page_size, window - offset)
+
+
+def _window_result(rows, offset, limit, window):
+    has_next = len(rows) > limit and offset + limit < window
+    rows = rows[:limit]
+
+    next_cursor = encode_cursor({"o": offset + limit}) if has_next else None
+    return rows, next_cursor
+
+
+def window_page(queryset, cursor, page_size, window):
+    """
+    이미 정렬된(관련도 순) 쿼리셋을 최대 window개 안에서 OFFSET 페이지 조회
+    반환: (이번 페이지 아이템 리스트, 다음 페이지 커서 or None)
+    """
+    offset, limit = _window_bounds(cursor, page_size, window)
+    rows = list(queryset[offset:offset + limit + 1])
+    return _window_result(rows, offset, limit, window)
+
+
+async def awindow_page(queryset, cursor, page_size, window):
+    """ window_page의 async 버전 """
+    offset, limit = _window_bounds(cursor, page_size, window)
+    rows = [row async for row in queryset[offset:offset + limit + 1]]
+    return _window_result(rows, offset, limit, window)
+
+
+def _count_key(key):
+    return "gold_list:count:" + hashlib.md5(key.encode()).hexdigest()
+
+
+def cached_count(queryset, key, limit=None):
+    """
+    COUNT(*)를 요청마다 돌리지 않도록 캐시에 잠깐 보관
+    limit이 있으면 그 개수까지만 세고 멈춤 (검색 결과 창 크기)
+    """
+    timeout = getattr(settings, "GOLD_LIST_COUNT_TIMEOUT", 300)
+
+    def compute():
+        target = queryset[:limit] if limit else queryset
+        return target.count()
+
+    return cache.get_or_set(_count_key(key), compute, timeout)
+
+
+async def acached_count(queryset, key, limit=None):
+    """ cached_count의 async 버전 (acount) """
+    cache_key = _count_key(key)
+    count = await cache.aget(cache_key)
+    if count is None:
+        target = queryset[:limit] if limit else queryset
+        count = await target.acount()
+        await cache.aset(cache_key, count, getattr(settings, "GOLD_LIST_COUNT_TIMEOUT", 300))
+    return count
@@ -1,70 +1,127 @@
-import time
-import sqlite3
+import argparse
 import re
 import os
-from selenium import webdriver
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+
+# 프로젝트 루트를 경로에 추가 (make_gold 패키지 import용)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from make_gold.browser import get_pool
+from make_gold.db import get_db_connection
+from make_gold.throttle import HostRateLimiter
+from make_gold import kapao, waits
+
+LIST_XPATH = kapao.LIST_XPATH
+MENU_BTN_XPATH = "/html/body/div[4]/main/div[2]/div[2]/div/ul/li[2]/button"
 
 # ==========================================
-# 1. DB 초기화 (auction_history)
+# 1. 이력 저장소 (auction_history)
 # ==========================================
-def get_db_connection():
-    """상위 폴더에 있는 db.sqlite3에 연결"""
-    # 1. 현재 파일(collect_history.py)의 절대 경로를 구함
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    # 2. 부모 폴더(상위 폴더) 경로 구하기
-    parent_dir = os.path.dirname(current_dir)
-    
-    # 3. 경로 합치기 (부모폴더 + db.sqlite3)
-    db_path = os.path.join(parent_dir, 'db.sqlite3')
-    
-    return sqlite3.connect(db_path)
+HISTORY_BATCH_SIZE = 20    # 이만큼 모이면 (또는 회차가 끝나면) 한 번에 저장 + 커밋 (= 체크포인트 간격)
+SEASON_DONE = ""           # 체크포인트에서 '회차 전체 완료'를 뜻하는 url 값
 
-def init_history_db():
-    conn = get_db_connection()
-    cur = conn.cursor()
-    
-    # season: 회차
-    # weight: 중량 (실수형)
-    # price: 공매가/감정가 (정수형)
-    # purity_info: 순금 함량 정보 (텍스트)
-    cur.execute('''
-        CREATE TABLE IF NOT EXISTS auction_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            season INTEGER,
-            title TEXT,
-            price INTEGER,
-            weight REAL,
-            purity_info TEXT,
-            url TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+# auction_history 테이블/인덱스(URL UNIQUE 포함)는 models.AuctionHistory 마이그레이션이 관리
+# → 먼저 python manage.py migrate (예전 테이블의 중복 정리 / 변환도 0010 마이그레이션이 한 번만 함)
+# season: 회차 / weight: 중량(g) / price: 공매가/감정가 / purity_info: 순금 함량 정보 (텍스트)
+
+# 체크포인트: 상세 수집까지 끝난 (회차, URL) → 재실행 시 그 페이지는 다시 안 엶
+# url = SEASON_DONE('') 행은 그 회차 전체가 끝났다는 표시 (수집기 혼자 쓰는 테이블이라 모델 없음)
+CHECKPOINT_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS auction_history_checkpoint (
+        season INTEGER NOT NULL,
+        url TEXT NOT NULL,
+        done_at INTEGER NOT NULL,
+        PRIMARY KEY (season, url)
+    ) WITHOUT ROWID
+'''
+
+
+class HistoryStore:
+    """
+    이력 저장소: 연결 하나를 계속 쓰고(WAL), 모아서 executemany + 커밋 한 번
+        with HistoryStore() as store:
+            store.add(item)
+            inserted, skipped = store.flush()
+    저장되는 행의 (회차, URL)은 같은 트랜잭션에서 체크포인트에도 기록
+    스레드마다 HistoryStore를 따로 만들어서 씀 (sqlite 연결은 스레드 간 공유 불가)
+    """
+
+    def __init__(self, db_path=None, batch_size=HISTORY_BATCH_SIZE):
+        # WAL 등 PRAGMA는 get_db_connection이 적용 (저장 중에도 웹 서버가 읽을 수 있고, 커밋이 가벼움)
+        self.conn = get_db_connection(db_path)
+        with self.conn:
+            self.conn.execute(CHECKPOINT_SCHEMA)
+        self.batch_size = batch_size
+        self._pending = []
+        self.inserted = 0
+        self.skipped = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def add(self, item):
+        self._pending.append((item['season'], item['title'], item['price'], item['weight'], item['purity_info'], item['url']))
+        if len(self._pending) >= self.batch_size:
+            return self.flush()
+        return None
+
+    def flush(self):
+        """ 모아둔 행 저장 → (신규, 이미 저장됨) 건수 """
+        rows, self._pending = self._pending, []
+        if not rows:
+            return 0, 0
+        before = self.conn.total_changes
+        with self.conn:   # 한 트랜잭션 + 커밋 1번
+            self.conn.executemany('''
+                INSERT INTO auction_history (season, title, price, weight, purity_info, url)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO NOTHING
+            ''', rows)
+            inserted = self.conn.total_changes - before
+            now = int(time.time())
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO auction_history_checkpoint (season, url, done_at) VALUES (?, ?, ?)",
+                [(row[0], row[5], now) for row in rows],
+            )
+        self.inserted += inserted
+        self.skipped += len(rows) - inserted
+        return inserted, len(rows) - inserted
+
+    # --- 체크포인트 ---
+    def done_urls(self, season):
+        rows = self.conn.execute(
+            "SELECT url FROM auction_history_checkpoint WHERE season = ? AND url != ?", (season, SEASON_DONE)
         )
-    ''')
-    conn.commit()
-    conn.close()
+        return {url for (url,) in rows}
 
-def save_item_to_db(item):
-    conn = get_db_connection()
-    cur = conn.cursor()
-    
-    # 중복 방지 (같은 URL이면 저장 안 함)
-    cur.execute("SELECT count(*) FROM auction_history WHERE url=?", (item['url'],))
-    if cur.fetchone()[0] == 0:
-        cur.execute('''
-            INSERT INTO auction_history (season, title, price, weight, purity_info, url)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (item['season'], item['title'], item['price'], item['weight'], item['purity_info'], item['url']))
-        print(f"   💾 [저장완료] {item['title']} | {item['weight']}g | {item['price']:,}원")
-    else:
-        print(f"   PASS (이미 저장됨): {item['title']}")
-            
-    conn.commit()
-    conn.close()
+    def finished_seasons(self):
+        rows = self.conn.execute("SELECT season FROM auction_history_checkpoint WHERE url = ?", (SEASON_DONE,))
+        return {season for (season,) in rows}
+
+    def finish_season(self, season):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO auction_history_checkpoint (season, url, done_at) VALUES (?, ?, ?)",
+                (season, SEASON_DONE, int(time.time())),
+            )
+
+    def reset_checkpoints(self, seasons):
+        with self.conn:
+            self.conn.executemany("DELETE FROM auction_history_checkpoint WHERE season = ?", [(s,) for s in seasons])
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            self.conn.close()
 
 # ==========================================
 # 2. 데이터 정제 함수 (Helper)
@@ -87,229 +144,215 @@ def parse_weight(text):
     except:
         return 0.0
 
+def parse_detail(text_at):
+    """
+    상세 페이지 → (공매가, 중량, 순금 함량 정보)
+    text_at(xpath)는 kapao.doc_text_at / driver_text_at (요소 없으면 None)
+    """
+    # (1) 공매가 (dl[2])
+    # dl 태그 전체 텍스트 예: "공매가\n1,200,000원"
+    price_text = text_at(kapao.PRICE_XPATH)
+    # (2) 중량 (dl[3])
+    weight_text = text_at(kapao.WEIGHT_DL_XPATH)
+    if price_text is None or weight_text is None:
+        raise ValueError("공매가/중량 정보를 찾지 못했습니다.")
+    price = parse_price(price_text) # 정수 변환
+    weight = parse_weight(weight_text) # 실수 변환
+
+    # (3) 순금 함량 정보 (상세설명 하위 div[10])
+    # div[10]이 없을 수도 있으니 예외처리 필수
+    purity_info = "정보없음"
+    full_desc = text_at(kapao.DESCRIPTION_BOX_XPATH)
+    desc = text_at(kapao.DESCRIPTION_BOX_XPATH + "/div[10]")
+    if desc is not None:
+        purity_info = desc
+        # 만약 div[10]이 비어있으면 전체 설명에서 찾기 시도 (Backup Plan)
+        if not purity_info.strip() and full_desc:
+            # 간단히 앞부분만 자르거나 키워드 검색
+            purity_info = full_desc[:100]
+    elif full_desc is not None:
+        # div[10]이 없는 경우, 설명 전체 텍스트 가져오기
+        purity_info = full_desc[:200] # 너무 기니까 자름
+
+    return price, weight, purity_info
+
 # ==========================================
 # 3. 크롤링 메인 로직
 # ==========================================
-def collect_past_auctions():
-    options = webdriver.ChromeOptions()
-    options.add_argument('window-size=1920x1080')
-    options.add_argument("--log-level=3")
+DEFAULT_SEASONS = "12-20"
+DEFAULT_WORKERS = 2            # 동시에 수집할 회차 수 (= 브라우저 수)
+REQUESTS_PER_SECOND = 1.0      # 상세 페이지 HTTP 요청 속도 (워커 전체 합산)
+JEWELRY_INPUT_XPATH = "/html/body/div[4]/main/div[2]/div[2]/div/ul/li[2]/div/div/div[4]/label/input"
+SEARCH_BTN_XPATH = "/html/body/div[4]/main/div[2]/div[2]/div/button"
+
+def parse_seasons(text):
+    """ '12-20' / '12,14,16-18' → [12, 13, ...] (중복 제거, 오름차순) """
+    seasons = set()
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = (int(x) for x in part.split("-", 1))
+            seasons.update(range(min(start, end), max(start, end) + 1))
+        else:
+            seasons.add(int(part))
+    return sorted(seasons)
+
+def open_season_list(driver, season):
+    """ 브라우저로 회차 변경(set_ps) → '귀금속' 필터 → 검색, 결과 li 목록 반환 """
+    driver.get(kapao.LIST_URL)
     
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-    wait = WebDriverWait(driver, 10)
+    # 1. 회차 변경 (JS 실행)
+    waits.wait_present(driver, MENU_BTN_XPATH, "리스트 페이지 로딩")
+    driver.execute_script(f"set_ps('{season}', '{season}회차');")
+    # 회차 변경 요청(페이지 이동/AJAX)이 끝나고 메뉴 버튼이 다시 뜰 때까지
+    waits.wait_settled(driver, "회차 변경")
+    waits.wait_present(driver, MENU_BTN_XPATH, "회차 변경")
     
+    # 2. '귀금속' 카테고리 선택 (메뉴 열기 -> JS 강제 클릭)
+    # (1) 카테고리 메뉴 버튼(상위 버튼) 클릭해서 열기
     try:
-        # 시작 URL
-        base_url = "https://www.kapao.co.kr/ver2/p/item/item"
-        driver.get(base_url)
-        time.sleep(2)
-        
-        # 12회차 ~ 20회차 수집 (범위는 필요에 따라 수정)
-        for season in range(12, 21): 
-            print(f"\n====================================")
-            print(f" 🔄 [제 {season} 회차] 데이터 수집 시작")
-            print(f"====================================")
-            
-            driver.get(base_url)
-            time.sleep(2) # 페이지 로딩 대기
-            
-            # 1. 회차 변경 (JS 실행)
-            try:
-                driver.execute_script(f"set_ps('{season}', '{season}회차');")
-                time.sleep(2) # 페이지 로딩 대기 (필수)
-                
-                # -----------------------------------------------------------
-                # [수정된 부분] 2. '귀금속' 카테고리 선택 (메뉴 열기 -> JS 강제 클릭)
-                # -----------------------------------------------------------
-                
-                # (1) 카테고리 메뉴 버튼(상위 버튼) 클릭해서 열기
-                try:
-                    # 알려주신 Full XPath 사용
-                    menu_btn_xpath = "/html/body/div[4]/main/div[2]/div[2]/div/ul/li[2]/button"
-                    menu_btn = driver.find_element(By.XPATH, menu_btn_xpath)
-                    menu_btn.click()
-                    time.sleep(0.5) # 메뉴 열리는 애니메이션 대기
-                except Exception as e:
-                    # 메뉴가 이미 열려있거나 버튼을 못 찾아도, 일단 input 클릭 시도해봄
-                    print(f"   (메뉴 버튼 클릭 건너뜀/실패: {e})")
-                    pass
-
-                # (2) '귀금속' 체크박스(input) 찾아서 JS로 강제 클릭
-                target_input_xpath = "/html/body/div[4]/main/div[2]/div[2]/div/ul/li[2]/div/div/div[4]/label/input"
-                
-                # 화면에 안 보여도 DOM에 있으면 찾아냄 (presence_of_element_located)
-                jewelry_checkbox = wait.until(EC.presence_of_element_located((By.XPATH, target_input_xpath)))
-                
-                # JS로 클릭 (가장 확실한 방법)
-                driver.execute_script("arguments[0].click();", jewelry_checkbox)
-                
-                print(f"   >> '귀금속' 필터 적용 완료")
-                time.sleep(1.5) # 리스트 갱신 대기
-                
-                try:
-                    # 찾아주신 그 버튼 XPath
-                    search_btn_xpath = "/html/body/div[4]/main/div[2]/div[2]/div/button"
-                    search_btn = driver.find_element(By.XPATH, search_btn_xpath)
-                    
-                    # 그냥 클릭하거나, 혹시 안 되면 JS로 클릭
-                    #search_btn.click()
-                    driver.execute_script("arguments[0].click();", search_btn) # 클릭 안 되면 이거 주석 해제
-                    
-                    print(f"   >> 🔍 검색 버튼 클릭! 데이터 로딩 중...")
-                    time.sleep(2) # 리스트 갱신될 때까지 충분히 대기
-                    
-                except Exception as e:
-                    print(f"⚠️ 검색 버튼 클릭 실패: {e}")
-                    continue
-                
-            except Exception as e:
-                print(f"⚠️ {season}회차 이동/클릭 실패: {e}")
-                continue              
-
-            # 3. 리스트에서 상세 페이지 URL 수집
-            item_urls = []
-            try:
-                # 리스트 영역 (분석해주신 경로)
-                list_xpath = "/html/body/div[4]/main/div[2]/div[5]/ul/li"
-                li_elements = driver.find_elements(By.XPATH, list_xpath)
-                
-                if not li_elements:
-                    print("   >> 해당 회차에 귀금속 매물이 없습니다.")
-                    continue
-                
-                for li in li_elements:
-                    try:
-                        # a 태그의 href 가져오기
-                        a_tag = li.find_element(By.TAG_NAME, "a")
-                        url = a_tag.get_attribute("href")
-                        
-                        # 제목도 미리 가져오면 좋음 (로깅용)
-                        title = li.find_element(By.CLASS_NAME, "tit").text 
-                        item_urls.append((title, url))
-                    except:
-                        continue
-                        
-                print(f"   >> 총 {len(item_urls)}개의 매물 발견! 상세 수집 시작...")
-
-            except Exception as e:
-                print(f"❌ 리스트 파싱 오류: {e}")
-                continue
-
-            # -----------------------------------------------------------
-            # [수정됨] 4. 리스트에서 상세 페이지 URL 수집 (Wait 추가 & XPath 통일)
-            # -----------------------------------------------------------
-            item_urls = []
+        driver.find_element(By.XPATH, MENU_BTN_XPATH).click()
+    except Exception as e:
+        # 메뉴가 이미 열려있거나 버튼을 못 찾아도, 일단 input 클릭 시도해봄
+        print(f"   (메뉴 버튼 클릭 건너뜀/실패: {e})")
+
+    # (2) '귀금속' 체크박스(input) 찾아서 JS로 강제 클릭
+    # 화면에 안 보여도 DOM에 있으면 찾아냄 (메뉴 애니메이션 안 기다려도 됨)
+    jewelry_checkbox = waits.wait_present(driver, JEWELRY_INPUT_XPATH, "카테고리 메뉴")
+    driver.execute_script("arguments[0].click();", jewelry_checkbox)
+    waits.wait_selected(driver, JEWELRY_INPUT_XPATH, "카테고리 체크")
+    
+    # 3. 검색 → 이전 리스트가 사라지고 새 li 개수가 안정될 때까지 (0건이면 바로 통과)
+    search_btn = driver.find_element(By.XPATH, SEARCH_BTN_XPATH)
+    previous = waits.first_element(driver, LIST_XPATH)
+    driver.execute_script("arguments[0].click();", search_btn)
+    return waits.wait_list(driver, LIST_XPATH, "검색 결과 리스트", previous=previous)
+
+def read_item_urls(li_elements, season):
+    """ 리스트 li를 한 번만 훑어서 [(제목, 상세 URL), ...] """
+    item_urls = []
+    for idx, li in enumerate(li_elements):
+        try:
+            # li 바로 아래의 a 태그 (probe.py와 같은 구조: ./a)
+            url = li.find_element(By.XPATH, "./a").get_attribute("href")
             try:
-                # ★ 중요: probe.py와 동일한 XPath 사용
-                list_xpath = "/html/body/div[4]/main/div[2]/div[5]/ul/li"
-                
-                # ★ 핵심: 검색 버튼 누르고 리스트가 뜰 때까지 최대 10초 기다림
-                # (이게 없으면 로딩 중에 0개를 가져와버림)
-                wait.until(EC.presence_of_element_located((By.XPATH, list_xpath)))
-                
-                # 요소를 찾음
-                li_elements = driver.find_elements(By.XPATH, list_xpath)
-                
-                print(f"   >> 리스트 로딩 완료! 요소 개수: {len(li_elements)}개")
-
-                if not li_elements:
-                    print("   >> ⚠️ 로딩은 됐는데 매물이 없거나 XPath가 안 맞음.")
-                    continue
-                
-                for idx, li in enumerate(li_elements):
-                    try:
-                        # probe.py 방식 그대로 적용
-                        # li 바로 아래의 a 태그 찾기 (XPath: ./a)
-                        a_tag = li.find_element(By.XPATH, "./a")
-                        url = a_tag.get_attribute("href")
-                        
-                        # 제목 가져오기 (probe.py 방식 참고: ./a/div[2]/dl)
-                        # 혹시 구조가 다를 수 있으니 간단하게 a 태그 안의 텍스트로 시도하거나 class로 시도
-                        try:
-                            # 제목이 들어있는 class (보통 tit)
-                            title = li.find_element(By.CLASS_NAME, "tit").text
-                        except:
-                            title = f"{season}회차_{idx+1}번_물품"
-
-                        item_urls.append((title, url))
-                    except Exception as e:
-                        print(f"   (아이템 {idx+1} 파싱 건너뜀: {e})")
-                        continue
-                        
-                print(f"   >> ✅ 총 {len(item_urls)}개의 매물 URL 확보 완료. 상세 수집 시작...")
-
-            except Exception as e:
-                print(f"❌ 리스트 파싱 오류 (Wait 시간 초과 등): {e}")
-                # 리스트 못 찾으면 다음 회차로
-                continue
-
-            # 5. 상세 페이지 순회
-            for title, url in item_urls:
+                # 제목이 들어있는 class (보통 tit)
+                title = li.find_element(By.CLASS_NAME, "tit").text
+            except Exception:
+                title = f"{season}회차_{idx+1}번_물품"
+            item_urls.append((title, url))
+        except Exception as e:
+            print(f"   (아이템 {idx+1} 파싱 건너뜀: {e})")
+    return item_urls
+
+def crawl_season(driver, session, store, season, limiter=None):
+    """
+    회차 하나 수집. 체크포인트에 있는 URL은 상세 페이지를 다시 열지 않음
+    모든 상세 페이지를 처리했으면 회차 완료로 기록 → 재실행 시 회차 자체를 건너뜀
+    """
+    print(f"\n 🔄 [제 {season} 회차] 데이터 수집 시작")
+    li_elements = open_season_list(driver, season)
+    item_urls = read_item_urls(li_elements, season)
+
+    done = store.done_urls(season)
+    todo = [(title, url) for title, url in item_urls if url not in done]
+    print(f"   >> [{season}회차] 매물 {len(item_urls)}개 (이미 수집 {len(item_urls) - len(todo)}개) → 상세 {len(todo)}개")
+
+    # 상세 페이지는 서버 렌더링이라 HTTP로 바로 받음 (회차 쿠키는 브라우저에서 복사)
+    kapao.copy_cookies(driver, session)
+    # add()가 batch_size마다 알아서 flush하므로 회차 결과는 store 누적치의 차이로 셈
+    inserted_before, skipped_before = store.inserted, store.skipped
+    failed = 0
+    for title, url in todo:
+        try:
+            if limiter:
+                limiter.wait(url)
+            text_at = kapao.doc_text_at(kapao.get(session, url))
+            if text_at(kapao.PRICE_XPATH) is None:
+                # HTML에 정보가 없으면(JS 렌더링 등) 이 페이지만 브라우저로
+                driver.get(url)
+                waits.wait_present(driver, kapao.PRICE_XPATH, "상세 페이지 로딩")
+                text_at = kapao.driver_text_at(driver)
+
+            price, weight, purity_info = parse_detail(text_at)
+        except Exception as e:
+            failed += 1
+            print(f"❌ 상세 페이지 파싱 실패 ({url}): {e}")
+            continue
+
+        # 저장 + 체크포인트는 같은 트랜잭션으로 (N개마다 커밋)
+        store.add({
+            'season': season,
+            'title': title,
+            'price': price,
+            'weight': weight,
+            'purity_info': purity_info,
+            'url': url
+        })
+        print(f"   📄 [{season}회차] {title} | {weight}g | {price:,}원")
+
+    store.flush()
+    inserted, skipped = store.inserted - inserted_before, store.skipped - skipped_before
+    if not failed:
+        store.finish_season(season)
+    print(f"   💾 [{season}회차 저장완료] 신규 {inserted}개 / 이미 저장됨 {skipped}개 / 실패 {failed}개")
+    return inserted
+
+def _season_worker(pool, season, db_path, limiter):
+    """ 스레드 하나 = 브라우저 1개 + HTTP 세션 1개 + DB 연결 1개 """
+    with pool.driver() as driver, kapao.open_session() as session, HistoryStore(db_path) as store:
+        return crawl_season(driver, session, store, season, limiter)
+
+def collect_past_auctions(seasons=None, workers=DEFAULT_WORKERS, headless=False, rps=REQUESTS_PER_SECOND,
+                          db_path=None, fresh=False):
+    """
+    seasons 회차들을 workers개 브라우저로 동시에 수집 (끝난 회차/URL은 체크포인트로 건너뜀)
+    fresh=True면 체크포인트를 지우고 처음부터
+    """
+    seasons = seasons or parse_seasons(DEFAULT_SEASONS)
+    with HistoryStore(db_path) as store:
+        if fresh:
+            store.reset_checkpoints(seasons)
+        finished = store.finished_seasons()
+    pending = [season for season in seasons if season not in finished]
+    print(f"=== 📚 과거 공매 수집: 회차 {len(seasons)}개 중 완료 {len(seasons) - len(pending)}개 건너뜀, "
+          f"{len(pending)}개 수집 (동시 {workers}개) ===")
+    if not pending:
+        return
+
+    # 공용 드라이버 풀 (기본은 화면 보면서 확인하려고 headless 아님)
+    pool = get_pool(size=max(1, workers), headless=headless)
+    limiter = HostRateLimiter(rate=rps)
+    inserted = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = {
+                executor.submit(_season_worker, pool, season, db_path, limiter): season
+                for season in pending
+            }
+            for future in as_completed(futures):
+                season = futures[future]
                 try:
-                    driver.get(url)
-                    time.sleep(1) # 상세 페이지 로딩 대기
-                    
-                    # -------------------------------------------------
-                    # [상세 정보 추출] - 분석해주신 XPath 사용
-                    # -------------------------------------------------
-                    
-                    # (1) 공매가 (dl[2])
-                    # dl 태그 전체 텍스트 예: "공매가\n1,200,000원"
-                    price_xpath = "/html/body/div[4]/main/div[3]/div[1]/div[2]/dl[2]"
-                    price_text = driver.find_element(By.XPATH, price_xpath).text
-                    price = parse_price(price_text) # 정수 변환
-                    
-                    # (2) 중량 (dl[3])
-                    weight_xpath = "/html/body/div[4]/main/div[3]/div[1]/div[2]/dl[3]"
-                    weight_text = driver.find_element(By.XPATH, weight_xpath).text
-                    weight = parse_weight(weight_text) # 실수 변환
-                    
-                    # (3) 순금 함량 정보 (상세설명 하위 div[10])
-                    # div[10]이 없을 수도 있으니 예외처리 필수
-                    purity_info = "정보없음"
-                    try:
-                        desc_xpath = "/html/body/div[4]/main/div[3]/div[4]/div[1]/div[10]"
-                        purity_element = driver.find_element(By.XPATH, desc_xpath)
-                        purity_info = purity_element.text
-                        
-                        # 만약 div[10]이 비어있으면 전체 설명에서 찾기 시도 (Backup Plan)
-                        if not purity_info.strip():
-                             full_desc = driver.find_element(By.XPATH, "/html/body/div[4]/main/div[3]/div[4]/div[1]").text
-                             # 간단히 앞부분만 자르거나 키워드 검색
-                             purity_info = full_desc[:100] 
-                    except:
-                        # div[10]이 없는 경우, 설명 전체 텍스트 가져오기
-                        try:
-                            full_desc_xpath = "/html/body/div[4]/main/div[3]/div[4]/div[1]"
-                            purity_info = driver.find_element(By.XPATH, full_desc_xpath).text[:200] # 너무 기니까 자름
-                        except:
-                            pass
-
-                    # -------------------------------------------------
-                    # DB 저장
-                    # -------------------------------------------------
-                    item_data = {
-                        'season': season,
-                        'title': title,
-                        'price': price,
-                        'weight': weight,
-                        'purity_info': purity_info,
-                        'url': url
-                    }
-                    save_item_to_db(item_data)
-                    
-                    # 다시 목록으로 돌아갈 필요 없음 (URL로 바로 이동하므로)
-                    
+                    inserted += future.result()
                 except Exception as e:
-                    print(f"❌ 상세 페이지 파싱 실패 ({url}): {e}")
-                    continue
-
-    except Exception as e:
-        print(f"❌ 치명적 오류 발생: {e}")
-        
+                    # 실패한 회차는 체크포인트가 남아 있으니 다시 실행하면 이어서 수집
+                    print(f"⚠️ {season}회차 수집 실패 (재실행 시 이어서): {e}")
     finally:
-        driver.quit()
+        print(f"💾 이력 저장 합계: 신규 {inserted}개")
+        print(waits.stats.summary())
 
 if __name__ == "__main__":
-    init_history_db()
-    collect_past_auctions()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="kapao 과거 회차 공매 이력 수집")
+    parser.add_argument("--seasons", default=DEFAULT_SEASONS, help="수집할 회차 (예: 12-20 또는 12,14,16-18)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="동시에 수집할 회차 수 (브라우저 수)")
+    parser.add_argument("--rps", type=float, default=REQUESTS_PER_SECOND, help="상세 페이지 초당 요청 수 (전체 합산)")
+    parser.add_argument("--headless", action="store_true", help="브라우저 화면 없이 실행")
+    parser.add_argument("--fresh", action="store_true", help="체크포인트 무시하고 처음부터 다시 수집")
+    args = parser.parse_args()
+
+    collect_past_auctions(
+        parse_seasons(args.seasons), workers=args.workers, headless=args.headless,
+        rps=args.rps, fresh=args.fresh,
+    )
@@ -0,0 +1,117 @@
+import time
+from datetime import datetime, timezone
+
+from .db import get_db_connection
+
+# =========================================================
+# 금 시세 시계열 저장소 (gold_price_series = models.GoldPrice 테이블)
+# - 스키마/인덱스는 Django 마이그레이션이 관리, 여기서는 sqlite3로 직접 읽고 씀 (Django 없이 실행 가능)
+#   (예전 epoch 정수 테이블 / 날짜별 gold_price 변환도 0010 마이그레이션이 함 → 먼저 migrate)
+# - 시각 컬럼은 Django DateTimeField 형식(UTC 'YYYY-MM-DD HH:MM:SS') / 이 모듈의 API는 epoch 초 그대로
+# - started_at이 PK(인덱스)라서 "최신 시세" / "T 시점 시세"가 인덱스 한 번
+# - 같은 가격이 연속으로 들어오면 새 행 대신 구간(started_at ~ last_seen_at)만 늘림 (run-length)
+# - 셀레니움 없이 import 가능 → 다른 모듈(가치 평가, 백테스트)에서 조회용으로 사용
+# =========================================================
+
+DB_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def to_db_time(at):
+    """ epoch 초 → DateTimeField 저장 형식 (UTC) """
+    return datetime.fromtimestamp(int(at), timezone.utc).strftime(DB_TIME_FORMAT)
+
+
+def epoch_sql(column):
+    """ DateTimeField 컬럼 → epoch 초 SQL 식 """
+    return f"CAST(strftime('%s', {column}) AS INTEGER)"
+
+
+class PriceSeries:
+    """
+    with PriceSeries() as series:
+        series.record(98000)          # 지금 시각으로 관측 기록
+        series.latest()               # (가격, 관측 시각) or None
+        series.price_at(epoch_seconds)
+    """
+
+    def __init__(self, db_path=None, conn=None):
+        self._own_conn = conn is None
+        self.conn = conn or get_db_connection(db_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if self._own_conn:
+            self.conn.close()
+
+    def record(self, price, at=None, commit=True):
+        """
+        관측 1건 기록. 직전 구간과 가격이 같으면 구간만 연장하고 False, 새 구간이면 True
+        (at이 직전 구간보다 과거면 무시하고 False)
+        """
+        at = int(at if at is not None else time.time())
+        last = self.conn.execute(
+            f"SELECT started_at, {epoch_sql('last_seen_at')}, price FROM gold_price_series "
+            "ORDER BY started_at DESC LIMIT 1"
+        ).fetchone()
+        if last and at < last[1]:
+            return False
+        if last and last[2] == price:
+            self.conn.execute(
+                "UPDATE gold_price_series SET last_seen_at = ?, samples = samples + 1 WHERE started_at = ?",
+                (to_db_time(at), last[0]),
+            )
+            changed = False
+        else:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO gold_price_series (started_at, last_seen_at, price) VALUES (?, ?, ?)",
+                (to_db_time(at), to_db_time(at), price),
+            )
+            changed = True
+        if commit:
+            self.conn.commit()
+        return changed
+
+    def latest(self):
+        """ 가장 최근 시세 → (1g 가격, 마지막 관측 epoch) / 없으면 None """
+        row = self.conn.execute(
+            f"SELECT price, {epoch_sql('last_seen_at')} FROM gold_price_series ORDER BY started_at DESC LIMIT 1"
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def price_at(self, at):
+        """ at(epoch 초) 시점에 유효했던 1g 시세 (그 전 기록이 없으면 None) """
+        row = self.conn.execute(
+            "SELECT price FROM gold_price_series WHERE started_at <= ? ORDER BY started_at DESC LIMIT 1",
+            (to_db_time(at),),
+        ).fetchone()
+        return row[0] if row else None
+
+    def ranges(self, start=None, end=None):
+        """ [(started_at, last_seen_at, price), ...] 시간순 (백테스트 as-of 조인용) """
+        sql = f"SELECT {epoch_sql('started_at')}, {epoch_sql('last_seen_at')}, price FROM gold_price_series"
+        params = []
+        if start is not None:
+            sql += " WHERE last_seen_at >= ?"
+            params.append(to_db_time(start))
+        if end is not None:
+            sql += (" AND" if params else " WHERE") + " started_at <= ?"
+            params.append(to_db_time(end))
+        return self.conn.execute(sql + " ORDER BY started_at", params).fetchall()
+
+
+# ---------------------------------------------------------
+# 다른 모듈용 간단 조회
+# ---------------------------------------------------------
+def latest_price(db_path=None):
+    with PriceSeries(db_path) as series:
+        return series.latest()
+
+
+def price_at(at, db_path=None):
+    with PriceSeries(db_path) as series:
+        return series.price_at(at)
@@ -1,13 +1,8 @@
 import os
 import sys
-import time
-import random
-import re
+import argparse
 import django
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 
 # =========================================================
 # 1. Django 환경 설정 (DB 접속용)
@@ -19,221 +14,199 @@ sys.path.append(project_root)
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 django.setup()
 
-from make_gold.models import AuctionItem
+from make_gold.writer import ItemWriter
+from make_gold.incremental import select_changed
+from make_gold.browser import get_pool, is_crash
+from make_gold.crawler import crawl
+from make_gold.throttle import HostRateLimiter
+from make_gold import waits
 
 # =========================================================
-# 2. 도우미 함수들 (데이터 정제)
+# 2. 페이지 파싱 → kapao.py (HTTP/셀레니움 공용)
 # =========================================================
-def extract_weight(text):
-    """ 
-    '총 중량 : 3.75g' 같은 텍스트에서 숫자(3.75)만 float로 추출 
-    """
-    try:
-        # 숫자 + (점 + 숫자) 패턴 찾기
-        match = re.search(r"(\d+(\.\d+)?)", text)
-        if match:
-            return float(match.group(1))
-    except:
-        pass
-    return 0.0
-
+from make_gold import kapao
 
 # =========================================================
-# [함수 수정] 줄바꿈 무시하고 전체에서 순도 찾기
+# 3. 상세 페이지 처리 (워커 스레드에서 실행 → DB 접근 금지)
 # =========================================================
-def extract_purity(text):
-    """ 
-    줄바꿈이 포함된 긴 텍스트에서 순도(24K, 18K, Au995 등)를 찾아냄 
-    """
-    if not text:
-        return "UNKNOWN"
-
-    # 1. 분석하기 좋게 대문자로 변환
-    # (줄바꿈 문자는 놔둬도 re.search가 알아서 건너뛰며 찾음)
-    target_text = text.upper()
-    
-    # 2. 우선순위별 검사 (24K > 18K > 14K)
-    
-    # [24K / 순금] Au999, Au995, 999, 24K, 순금
-    if re.search(r'(24K|순금|AU99|999|995)', target_text):
-        return "24K"
-    
-    # [18K] Au750, 750, 18K
-    if re.search(r'(18K|AU750|750)', target_text):
-        return "18K"
-    
-    # [14K] Au585, 585, 14K
-    if re.search(r'(14K|AU585|585)', target_text):
-        return "14K"
-    
-    # [백금/은]
-    if re.search(r'(PT|PLATINUM|백금)', target_text):
-        return "PLATINUM"
-    if re.search(r'(AG|SILVER|은|그래뉼)', target_text):
-        return "SILVER"
-
-    return "UNKNOWN"
+DETAIL_WORKERS = 3             # 상세 페이지 동시 수집 워커 수
+REQUESTS_PER_SECOND = 0.5      # kapao 호스트당 초당 요청 수 (워커 전체 합산)
+SAVE_BATCH_SIZE = 50           # 이만큼 모이면 (또는 몇 초 지나면) 한 번에 저장
+
+
+def fetch_detail_browser(driver, target):
+    """ 워커용(셀레니움): 상세 페이지 열고 정보 dl이 뜨면 바로 파싱 """
+    driver.get(target['url'])
+    waits.wait_present(driver, kapao.DETAIL_INFO_XPATH, "상세 페이지 로딩")
+    return kapao.parse_detail(kapao.driver_text_at(driver), target)
+
+
+def item_fields(target, detail):
+    """ 리스트 요약 + 상세 정보 → ItemWriter에 넣을 한 행 """
+    return {
+        'url': target['url'],
+        'title': target['title'],
+        'price': target['price'],
+        'location': target['location'],
+        'image_url': target['image_url'],
+        
+        # [중요] 전체 내용을 다 저장해둠 (나중에 AI가 다시 분석 가능)
+        'description': detail['description'], 
+        'weight_g': detail['weight_g'],            
+        'purity': detail['purity'],            
+        'list_fingerprint': target['fingerprint'],
+    }
+
 
 # =========================================================
-# 3. 메인 크롤러 로직
+# 4. 메인 크롤러 로직
 # =========================================================
-def run_scraper():
-    print("=== 🛸 [Probe] 정찰 및 상세 성분 수집을 시작합니다 ===")
-    
-    options = webdriver.ChromeOptions()
-    options.add_argument('--headless') # 브라우저 안 띄우려면 주석 해제
-    options.add_argument('window-size=1920x1080')
-    
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-    
-    # 수집할 타겟 리스트 (1차 수집 정보)
+def collect_list_http():
+    """ [Phase 1] 검색 폼을 HTTP로 제출해서 리스트 확보 (브라우저 없음) """
+    with kapao.open_session() as session:
+        scraped_targets = kapao.fetch_list(session)
+    print(f">> 발견된 매물: {len(scraped_targets)}개 (상세 수집 대기중)")
+    return scraped_targets
+
+
+def collect_list(driver):
+    """ [Phase 1] 셀레니움으로 리스트 확보 (검색 실패 시 None) """
     scraped_targets = []
 
+    driver.get(kapao.LIST_URL)
+
+    # '귀금속' 카테고리 체크 및 검색
     try:
-        # --- [Phase 1] 리스트 페이지에서 목록 확보 ---
-        url = "https://www.kapao.co.kr/ver2/p/item/item"
-        driver.get(url)
-        time.sleep(2)
+        target_xpath = f"//*[@id='cate-info']//label[contains(., '{kapao.CATEGORY}')]"
+        checkbox = waits.wait_present(driver, target_xpath, "리스트 페이지 로딩")
+        driver.execute_script("arguments[0].click();", checkbox)
+        waits.wait_selected(driver, target_xpath + "//input", "카테고리 체크")
+        
+        # 검색 전 리스트 첫 항목을 잡아두고, 그게 바뀐 뒤 li 개수가 안정될 때까지 대기
+        previous = waits.first_element(driver, kapao.LIST_XPATH)
+        search_form = driver.find_element(By.ID, "frm_item_search")
+        search_form.submit()
+        print(">> 리스트 갱신 중...")
+        items = waits.wait_list(driver, kapao.LIST_XPATH, "검색 결과 리스트", previous=previous)
+    except Exception as e:
+        print(f"!! 검색 설정 실패: {e}")
+        return None
 
-        # '귀금속' 카테고리 체크 및 검색
+    print(f">> 발견된 매물: {len(items)}개 (상세 수집 대기중)")
+
+    # 리스트 루프: URL과 기본 정보만 빠르게 저장
+    for item in items:
         try:
-            target_xpath = "//*[@id='cate-info']//label[contains(., '귀금속')]"
-            checkbox = driver.find_element(By.XPATH, target_xpath)
-            driver.execute_script("arguments[0].click();", checkbox)
-            time.sleep(1)
+            a_tag = item.find_element(By.XPATH, "./a")
+            link = a_tag.get_attribute("href")
             
-            search_form = driver.find_element(By.ID, "frm_item_search")
-            search_form.submit()
-            print(">> 리스트 갱신 중...")
-            time.sleep(3) 
+            # 이미지
+            try: img_src = item.find_element(By.XPATH, "./a/div[1]/div/img").get_attribute("src")
+            except: img_src = ""
+
+            # 리스트 상의 요약 텍스트 파싱
+            dl_tag = item.find_element(By.XPATH, "./a/div[2]/dl")
+            raw_text = dl_tag.text 
+
+            target = {"url": link, "image_url": img_src, "list_text": raw_text}
+            target.update(kapao.parse_summary(raw_text))
+            scraped_targets.append(target)
         except Exception as e:
-            print(f"!! 검색 설정 실패: {e}")
-            return
+            print(f"   ⚠️ 리스트 파싱 건너뜀: {e}")
+            continue
+
+    return scraped_targets
+
 
-        # 리스트 아이템 가져오기
-        items = driver.find_elements(By.XPATH, "/html/body/div[4]/main/div[2]/div[5]/ul/li")
-        print(f">> 발견된 매물: {len(items)}개 (상세 수집 대기중)")
+def run_scraper(workers=DETAIL_WORKERS, rps=REQUESTS_PER_SECOND, use_browser=False, batch_size=SAVE_BATCH_SIZE,
+                refresh_days=None):
+    """
+    기본은 HTTP(requests + lxml)로 수집, use_browser=True면 전부 크롬으로
+    HTTP로 리스트가 안 나오면(검색이 JS로만 될 때) 리스트만 크롬으로 다시 시도
+    refresh_days: 요약이 그대로여도 다시 수집하는 기한 (None이면 settings, 0이면 전부)
+    """
+    print("=== 🛸 [Probe] 정찰 및 상세 성분 수집을 시작합니다 ===")
 
-        # 리스트 루프: URL과 기본 정보만 빠르게 저장
-        for item in items:
+    try:
+        # --- [Phase 1] 리스트 페이지에서 목록 확보 ---
+        scraped_targets = None
+        if not use_browser:
             try:
-                a_tag = item.find_element(By.XPATH, "./a")
-                link = a_tag.get_attribute("href")
-                
-                # 이미지
-                try: img_src = item.find_element(By.XPATH, "./a/div[1]/div/img").get_attribute("src")
-                except: img_src = ""
-
-                # 리스트 상의 요약 텍스트 파싱
-                dl_tag = item.find_element(By.XPATH, "./a/div[2]/dl")
-                raw_text = dl_tag.text 
-                
-                title = "제목 없음"
-                price = 0
-                location = "미분류"
-                
-                lines = raw_text.split('\n')
-                for line in lines:
-                    if "물품명" in line: title = line.replace("물품명", "").strip()
-                    if "감정평가액" in line or "최저입찰가" in line: 
-                        # 가격 숫자만 추출
-                        nums = re.findall(r'\d+', line.replace(",", ""))
-                        if nums: price = int(nums[-1])
-                    if "보관장소" in line: location = line.replace("보관장소", "").strip()
-
-                scraped_targets.append({
-                    "url": link,
-                    "title": title,
-                    "price": price,
-                    "location": location,
-                    "image_url": img_src,
-                    "list_text": raw_text
-                })
+                scraped_targets = collect_list_http()
             except Exception as e:
-                print(f"   ⚠️ 리스트 파싱 건너뜀: {e}")
-                continue
+                print(f"!! HTTP 리스트 수집 실패 → 브라우저로 재시도: {e}")
+        if not scraped_targets:
+            try:
+                with get_pool(headless=True).driver() as driver:
+                    scraped_targets = collect_list(driver)
+            except Exception as e:
+                print(f"!! 치명적 에러 발생: {e}")
+                return
 
-        # --- [Phase 2] 상세 페이지 순회 (방문판매) ---
-        print(f"\n>> 🔍 상세 페이지 진입 시작 ({len(scraped_targets)}개)")
+        if not scraped_targets:
+            return
+
+        # --- [Phase 1.5] 리스트 요약이 그대로인 물건은 상세 페이지 건너뜀 ---
+        scraped_targets, changes = select_changed(scraped_targets, max_age_days=refresh_days)
+        print(f">> ♻️ {changes.summary()}")
+        if not scraped_targets:
+            return
+
+        # --- [Phase 2] 상세 페이지 동시 순회 ---
+        # 워커마다 세션(HTTP or 브라우저) 1개, 요청 간격은 호스트별 속도 제한기로 통제
+        mode = "브라우저" if use_browser else "HTTP"
+        print(f"\n>> 🔍 상세 페이지 진입 시작 ({len(scraped_targets)}개 / {mode} 워커 {workers}개 / 초당 {rps}회)")
+        limiter = HostRateLimiter(rate=rps)
+        total = len(scraped_targets)
+
+        if use_browser:
+            pool = get_pool(size=max(1, workers), headless=True)
+            fetch, open_session, is_broken = fetch_detail_browser, pool.driver, is_crash
+        else:
+            fetch, open_session, is_broken = kapao.fetch_detail, kapao.open_session, None
         
-        for idx, target in enumerate(scraped_targets):
-            current_url = target['url']
-            
-            try:
-                print(f"[{idx+1}/{len(scraped_targets)}] 이동: {target['title'][:10]}...", end="")
-                
-                driver.get(current_url)
-                time.sleep(random.uniform(1.5, 3.5)) # 랜덤 휴식
-
-                # --- 데이터 추출 ---
-                weight_g = 0.0
-                full_description = target['list_text'] # 기본값
-                purity_val = "UNKNOWN"
-
-                # 1. 무게 추출
-                try:
-                    weight_element = driver.find_element(By.XPATH, "/html/body/div[4]/main/div[3]/div[1]/div[2]/dl[3]/dd/span")
-                    weight_g = extract_weight(weight_element.text)
-                    if weight_g > 0:
-                        print(f" -> ⚖️ {weight_g}g", end="")
-                except:
-                    pass
-
-                # 2. 상세 설명 및 순도 추출 (★ 핵심 수정 부분)
-                # div 위치가 9번일 수도, 13번일 수도 있으니 리스트로 순회하며 찾음
-                possible_xpaths = [
-                    "/html/body/div[4]/main/div[3]/div[4]/div[1]/div[13]", # 네가 새로 발견한 곳
-                    "/html/body/div[4]/main/div[3]/div[4]/div[1]/div[9]",  # 아까 발견한 곳
-                    "/html/body/div[4]/main/div[3]/div[4]/div[1]"          # 전체 박스 (최후의 수단)
-                ]
-
-                for xpath in possible_xpaths:
-                    try:
-                        element = driver.find_element(By.XPATH, xpath)
-                        text = element.text.strip()
-                        
-                        # 내용이 비어있지 않으면 이걸 상세 설명으로 채택!
-                        if text:
-                            full_description = text
-                            # 전체 텍스트 안에서 순도 검색 (줄바꿈 포함)
-                            purity_found = extract_purity(full_description)
-                            
-                            if purity_found != "UNKNOWN":
-                                purity_val = purity_found
-                            break # 찾았으면 루프 탈출
-                    except:
-                        continue
-
-                if purity_val != "UNKNOWN":
-                    print(f" / 🥇 {purity_val}", end="")
-
-                # --- DB 저장 ---
-                AuctionItem.objects.update_or_create(
-                    url=current_url,
-                    defaults={
-                        'title': target['title'],
-                        'price': target['price'],
-                        'location': target['location'],
-                        'image_url': target['image_url'],
-                        
-                        # [중요] 전체 내용을 다 저장해둠 (나중에 AI가 다시 분석 가능)
-                        'description': full_description, 
-                        'weight_g': weight_g,            
-                        'purity': purity_val,            
-                    }
-                )
-                print(" [저장완료]")
+        results = crawl(
+            scraped_targets, fetch, open_session,
+            workers=workers, limiter=limiter, is_broken=is_broken,
+        )
+        # 결과는 이 스레드 하나에서만 모아서 묶음 저장 (N개 or N초마다, 끝날 때 나머지)
+        with ItemWriter(batch_size=batch_size) as writer:
+            save_results(results, total, writer)
 
-            except Exception as e:
-                print(f"\n   ⚠️ 상세 페이지 에러 ({current_url}): {e}")
-                continue
-                
-    except Exception as e:
-        print(f"!! 치명적 에러 발생: {e}")
-    
     finally:
-        driver.quit()
+        print(waits.stats.summary())
         print("\n=== 🏁 정찰 종료 ===")
 
+
+def save_results(results, total, writer):
+    """ crawl() 결과를 받아 writer 버퍼에 넣음 (DB 쓰기는 writer가 묶어서) """
+    for idx, (target, detail, error) in enumerate(results, start=1):
+        if target is None:
+            print(f"   ⚠️ 워커 종료: {error}")
+            continue
+        if error:
+            print(f"[{idx}/{total}] ⚠️ 상세 페이지 에러 ({target['url']}): {error}")
+            continue
+
+        info = f" -> ⚖️ {detail['weight_g']}g" if detail['weight_g'] > 0 else ""
+        if detail['purity'] != "UNKNOWN":
+            info += f" / 🥇 {detail['purity']}"
+        print(f"[{idx}/{total}] {target['title'][:10]}...{info}")
+
+        # 묶음 저장이 실패해도 writer가 한 건씩 다시 저장 → 실패 건수는 저장 합계에 나옴
+        writer.add(item_fields(target, detail))
+
 if __name__ == "__main__":
-    run_scraper()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="kapao 귀금속 매물 수집")
+    parser.add_argument("--workers", type=int, default=DETAIL_WORKERS, help="상세 페이지 동시 수집 워커 수")
+    parser.add_argument("--rps", type=float, default=REQUESTS_PER_SECOND, help="kapao 초당 요청 수 (전체 합산)")
+    parser.add_argument("--browser", action="store_true", help="HTTP 대신 크롬으로 리스트/상세 페이지 수집")
+    parser.add_argument("--batch-size", type=int, default=SAVE_BATCH_SIZE, help="한 번에 묶어서 저장할 개수")
+    parser.add_argument("--refresh-days", type=int, default=None, help="요약이 그대로여도 N일 지나면 다시 수집 (기본: settings)")
+    parser.add_argument("--full", action="store_true", help="변경 여부와 상관없이 전부 다시 수집")
+    args = parser.parse_args()
+
+    run_scraper(
+        workers=args.workers, rps=args.rps, use_browser=args.browser, batch_size=args.batch_size,
+        refresh_days=0 if args.full else args.refresh_days,
+    )
@@ -0,0 +1,44 @@
+# =========================================================
+# 보관장소(location) 텍스트 → 광역 지역명 정규화
+# 예: "서울특별시 강남구 ..." -> "서울", "경상남도 창원시" -> "경남"
+# =========================================================
+
+# (정규화된 지역명, 원문에 나올 수 있는 표기들)
+REGION_ALIASES = (
+    ("서울", ("서울특별시", "서울시", "서울")),
+    ("부산", ("부산광역시", "부산시", "부산")),
+    ("대구", ("대구광역시", "대구시", "대구")),
+    ("인천", ("인천광역시", "인천시", "인천")),
+    ("광주", ("광주광역시", "광주시", "광주")),
+    ("대전", ("대전광역시", "대전시", "대전")),
+    ("울산", ("울산광역시", "울산시", "울산")),
+    ("세종", ("세종특별자치시", "세종시", "세종")),
+    ("경기", ("경기도", "경기")),
+    ("강원", ("강원특별자치도", "강원도", "강원")),
+    ("충북", ("충청북도", "충북")),
+    ("충남", ("충청남도", "충남")),
+    ("전북", ("전북특별자치도", "전라북도", "전북")),
+    ("전남", ("전라남도", "전남")),
+    ("경북", ("경상북도", "경북")),
+    ("경남", ("경상남도", "경남")),
+    ("제주", ("제주특별자치도", "제주도", "제주")),
+)
+
+REGIONS = tuple(region for region, _ in REGION_ALIASES)
+
+
+def normalize_region(location):
+    """
+    보관장소 문자열에서 가장 앞에 나오는 지역 표기를 찾아 정규화된 지역명 반환
+    (못 찾으면 빈 문자열)
+    """
+    if not location:
+        return ""
+
+    best_region, best_pos = "", len(location)
+    for region, aliases in REGION_ALIASES:
+        for alias in aliases:
+            pos = location.find(alias)
+            if pos != -1 and pos < best_pos:
+                best_region, best_pos = region, pos
+    return best_region
@@ -0,0 +1,151 @@
+import re
+
+# =========================================================
+# 로컬 규칙 엔진 (LLM 호출 전 1차 분류)
+# - 정규식은 모듈 로딩 때 한 번만 컴파일
+# - 설명이 명확하면 material / purity / weight_g를 바로 채우고
+#   애매한(신뢰도 낮은) 것만 AI(agent.py)로 넘김
+# =========================================================
+
+# --- probe.py에서 쓰던 기존 규칙 (순서 = 우선순위) ---
+_FIRST_NUMBER = re.compile(r"(\d+(\.\d+)?)")
+
+PURITY_RULES = (
+    # [24K / 순금] Au999, Au995, 999, 24K, 순금
+    ("24K", re.compile(r"(24K|순금|AU99|999|995)")),
+    # [18K] Au750, 750, 18K
+    ("18K", re.compile(r"(18K|AU750|750)")),
+    # [14K] Au585, 585, 14K
+    ("14K", re.compile(r"(14K|AU585|585)")),
+    # [백금/은]
+    ("PLATINUM", re.compile(r"(PT|PLATINUM|백금)")),
+    ("SILVER", re.compile(r"(AG|SILVER|은|그래뉼)")),
+)
+
+
+def extract_weight(text):
+    """
+    '총 중량 : 3.75g' 같은 텍스트에서 숫자(3.75)만 float로 추출
+    """
+    try:
+        # 숫자 + (점 + 숫자) 패턴 찾기
+        match = _FIRST_NUMBER.search(text)
+        if match:
+            return float(match.group(1))
+    except:
+        pass
+    return 0.0
+
+
+def extract_purity(text):
+    """
+    줄바꿈이 포함된 긴 텍스트에서 순도(24K, 18K, Au995 등)를 찾아냄
+    """
+    if not text:
+        return "UNKNOWN"
+
+    # 대문자로 바꾼 뒤 우선순위별 검사 (24K > 18K > 14K > 백금 > 은)
+    target_text = text.upper()
+    for purity, pattern in PURITY_RULES:
+        if pattern.search(target_text):
+            return purity
+    return "UNKNOWN"
+
+
+# --- 1차 분류기용 엄격한 규칙 (대문자로 바꾼 텍스트 기준) ---
+# 한글에 바로 붙어 쓰는 경우(24K반지)가 많아서 \b 대신 영문/숫자 경계만 검사
+# 확실한 표기: 24K / Au999 / 순금 처럼 단위나 접두어가 붙은 것만
+STRONG_PURITY = (
+    ("24K", re.compile(r"(?<![\d.])24\s*K(?![A-Z])|(?<![A-Z])AU\s*99[59](?:\.9+)?(?!\d)|순금|(?<![\d.,])99\.9+\s*%|(?<![\d.,])999(?:\.9)?(?![\d,])")),
+    ("18K", re.compile(r"(?<![\d.])18\s*K(?![A-Z])|(?<![A-Z])AU\s*750(?!\d)")),
+    ("14K", re.compile(r"(?<![\d.])14\s*K(?![A-Z])|(?<![A-Z])AU\s*585(?!\d)")),
+)
+
+# 숫자(1,000.5 같은 콤마 포함) + 무게 단위 (g / 그램 / 돈 / 냥 / kg)
+WEIGHT_PATTERN = re.compile(
+    r"(?<![\d.,])(\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?)\s*(KG|GRAM|G|그램|돈|냥)(?![A-Z])"
+)
+UNIT_TO_GRAMS = {"G": 1.0, "GRAM": 1.0, "그램": 1.0, "돈": 3.75, "냥": 37.5, "KG": 1000.0}
+
+SILVER_PATTERN = re.compile(r"(?<![A-Z])(?:SILVER|AG\s*9\d\d)|순은|실버")
+GOLD_PATTERN = re.compile(r"금|GOLD")
+# 금 외 구성이 섞이면 무게/소재 판단이 애매해짐 → AI로
+MIXED_PATTERN = re.compile(r"다이아|DIAMOND|큐빅|(?<![A-Z])CZ(?![A-Z])|보석|진주|백금|PLATINUM|(?<![A-Z])PT\s*\d+|도금|(?<![A-Z])GP(?![A-Z])|금장")
+# 여러 개 묶음(× 2개, 3점, 일괄, 세트 ...)은 총중량 계산이 애매함 → AI로
+MULTI_PATTERN = re.compile(r"[×X*]\s*(?:[2-9]|\d{2,})(?!\d)|(?<![\d.])(?:[2-9]|\d{2,})\s*(?:개|점|EA)(?![A-Z])|일괄|세트|\s외\s")
+
+CONFIDENCE_THRESHOLD = 0.8
+
+
+def find_weights(text):
+    """ (대문자) 텍스트 속 무게 표기를 전부 g로 환산 (중복 제거, 등장 순서 유지) """
+    weights = []
+    for number, unit in WEIGHT_PATTERN.findall(text):
+        grams = round(float(number.replace(",", "")) * UNIT_TO_GRAMS[unit], 3)
+        if grams > 0 and grams not in weights:
+            weights.append(grams)
+    return weights
+
+
+def find_purities(text):
+    """ (대문자) 텍스트에서 확실한 순도 표기만 모아서 반환 (예: {'24K'}) """
+    return {purity for purity, pattern in STRONG_PURITY if pattern.search(text)}
+
+
+def classify(description):
+    """
+    설명 텍스트만으로 스펙 추정
+    반환: {"material", "purity", "weight_g", "risk_factor", "confidence"}
+    confidence >= CONFIDENCE_THRESHOLD 이면 AI 호출 없이 써도 됨
+    """
+    text = (description or "").upper()
+    purities = find_purities(text)
+    weights = find_weights(text)
+    mixed = bool(MIXED_PATTERN.search(text) or MULTI_PATTERN.search(text))
+
+    confidence = 0.0
+
+    # 1. 순도: 한 종류만 확실하게 나와야 점수
+    purity = "UNKNOWN"
+    if len(purities) == 1:
+        purity = next(iter(purities))
+        confidence += 0.5
+    elif not purities:
+        fallback = extract_purity(text)
+        if fallback in ("24K", "18K", "14K"):
+            # 숫자만 있는 애매한 표기(750, 585 등)
+            purity = fallback
+            confidence += 0.2
+
+    # 2. 무게: 단위가 붙은 값이 한 종류여야 점수
+    weight_g = weights[0] if weights else 0.0
+    if len(weights) == 1:
+        confidence += 0.5
+    elif len(weights) > 1:
+        confidence += 0.1
+
+    # 3. 소재
+    if purity != "UNKNOWN":
+        material = "GOLD"
+    elif SILVER_PATTERN.search(text):
+        material = "SILVER"
+    elif GOLD_PATTERN.search(text):
+        material = "GOLD"
+    else:
+        material = "OTHERS"
+
+    if mixed:
+        confidence = min(confidence, 0.5)
+
+    confidence = round(confidence, 2)
+    return {
+        "material": material,
+        "purity": purity,
+        "weight_g": weight_g,
+        "risk_factor": "LOW" if confidence >= CONFIDENCE_THRESHOLD else "HIGH",
+        "confidence": confidence,
+    }
+
+
+def is_confident(result):
+    return result["confidence"] >= CONFIDENCE_THRESHOLD
@@ -0,0 +1,105 @@
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+
+from .migrations._search_sql import PG_SEARCH_VECTOR
+
+# =========================================================
+# 전문 검색(Full-text Search) 백엔드
+# - SQLite     : FTS5 가상 테이블 (trigram 토크나이저 → 한글 부분 문자열 매칭)
+# - PostgreSQL : UPPER(컬럼) pg_trgm GIN 인덱스로 icontains 가속 + tsvector 식 GIN 인덱스로 단어 매칭/랭킹
+# 인덱스 동기화는 DB 트리거가 담당하므로 save()/bulk upsert 모두 자동 반영됨
+# (SQLite에서 gold_items를 새로 만드는 마이그레이션 - NOT NULL 컬럼 추가 등 - 은 트리거를 지우므로
+#  같은 마이그레이션 끝에서 트리거를 다시 만들고 rebuild 해야 함: migrations/_search_sql.py 참고)
+# =========================================================
+FTS_TABLE = "gold_items_fts"
+
+# trigram 토크나이저는 3글자 미만 검색어를 인덱스로 찾지 못함 → LIKE로 대체
+MIN_TRIGRAM_LEN = 3
+
+
+def split_terms(query):
+    """ 검색어를 공백 기준으로 잘라서 단어 리스트로 """
+    return [term for term in query.split() if term]
+
+
+def _like_filter(queryset, terms):
+    """ 인덱스를 못 타는 짧은 검색어용 (제목 OR 설명 포함) """
+    for term in terms:
+        queryset = queryset.filter(
+            Q(title__icontains=term) |
+            Q(description__icontains=term)
+        )
+    return queryset
+
+
+def _fts_phrase(term):
+    """ FTS5 문법 문자(*, -, : 등)가 섞여도 안전하도록 큰따옴표 구문으로 감싸기 """
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _search_sqlite(queryset, terms):
+    long_terms = [t for t in terms if len(t) >= MIN_TRIGRAM_LEN]
+    short_terms = [t for t in terms if len(t) < MIN_TRIGRAM_LEN]
+
+    if long_terms:
+        match = " AND ".join(_fts_phrase(t) for t in long_terms)
+        table = queryset.model._meta.db_table
+        # 일치하는 rowid만 남기고, 관련도는 행마다 같은 MATCH에서 rank만 읽음
+        # rank 컬럼 = bm25(제목 가중치 10, 설명 가중치 1) → 값이 작을수록 관련도 높음
+        matches = RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match])
+        rank = RawSQL(
+            f'SELECT rank FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s AND rowid = "{table}"."id"', [match]
+        )
+        queryset = (
+            queryset.filter(id__in=matches)
+            .annotate(search_rank=rank)
+            .order_by("search_rank", "-created_at", "-id")
+        )
+
+    return _like_filter(queryset, short_terms)
+
+
+def _search_postgres(queryset, query, terms):
+    # psycopg2가 있는 환경에서만 import 가능
+    from django.contrib.postgres.search import TrigramWordSimilarity
+
+    # 단어 일치는 tsvector 식 인덱스, 부분 문자열(ILIKE)은 UPPER() trigram 인덱스 → 플래너가 BitmapOr로 합침
+    tsquery = "websearch_to_tsquery('simple', %s)"
+    matches = RawSQL(f"{PG_SEARCH_VECTOR} @@ {tsquery}", [query], output_field=BooleanField())
+    substring = Q()
+    for term in terms:
+        substring &= Q(title__icontains=term) | Q(description__icontains=term)
+    queryset = queryset.alias(search_match=matches).filter(Q(search_match=True) | substring)
+
+    rank = (
+        RawSQL(f"ts_rank({PG_SEARCH_VECTOR}, {tsquery})", [query], output_field=FloatField()) +
+        TrigramWordSimilarity(query, "title")
+    )
+    return queryset.annotate(search_rank=rank).order_by("-search_rank", "-created_at", "-id")
+
+
+def search_items(queryset, query):
+    """
+    검색어(query)로 AuctionItem 쿼리셋을 걸러내고 관련도 순으로 정렬
+    (검색어가 비어있으면 그대로 반환)
+    """
+    terms = split_terms(query)
+    if not terms:
+        return queryset
+
+    vendor = connections[queryset.db].vendor
+    if vendor == "sqlite":
+        return _search_sqlite(queryset, terms)
+    if vendor == "postgresql":
+        return _search_postgres(queryset, query, terms)
+    return _like_filter(queryset, terms)
+
+
+def rebuild_index(using="default"):
+    """ FTS 인덱스를 원본 테이블(gold_items) 기준으로 다시 만들기 """
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES('rebuild')")
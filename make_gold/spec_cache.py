@@ -0,0 +1,141 @@
+import hashlib
+import re
+import threading
+import unicodedata
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from .models import SpecCache
+
+# =========================================================
+# AI 스펙 추출 결과 캐시
+# - 키: sha256(프롬프트 버전 + 모델명 + 정규화된 설명)
+# - 같은 보일러플레이트 설명은 한 번만 API 호출
+# - TTL(생성 후 N일) + LRU(최대 개수 초과 시 오래 안 쓴 것부터) 정리
+# =========================================================
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_description(description):
+    """ 전각/반각, 공백, 대소문자 차이를 없애서 같은 설명이면 같은 키가 나오게 """
+    text = unicodedata.normalize("NFKC", description or "")
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+
+def make_key(description, prompt_version, model_name):
+    raw = f"{prompt_version}\0{model_name}\0{normalize_description(description)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _ttl():
+    return timedelta(days=getattr(settings, "SPEC_CACHE_TTL_DAYS", 90))
+
+
+class CacheStats:
+    """ 적중/미스 카운터 + 미스 때 걸린 시간 (절약 효과 추정용) """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.hits = 0
+        self.misses = 0
+        self.miss_seconds = 0.0
+
+    def record_hits(self, count=1):
+        with self._lock:
+            self.hits += count
+
+    def record_miss(self, seconds=0.0):
+        with self._lock:
+            self.misses += 1
+            self.miss_seconds += seconds
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def saved_seconds(self):
+        """ 적중 건수 × 평균 API 응답 시간 """
+        if not self.misses:
+            return 0.0
+        return self.hits * (self.miss_seconds / self.misses)
+
+    def summary(self):
+        return (
+            f"캐시 적중 {self.hits} / 미스 {self.misses} (적중률 {self.hit_rate:.0%}), "
+            f"절약된 API 호출 {self.hits}회, 절약 시간 약 {self.saved_seconds:.1f}초"
+        )
+
+
+stats = CacheStats()
+
+
+def get_many(keys):
+    """ 키 여러 개를 쿼리 한 번으로 조회 → {key: result} (만료된 건 제외) """
+    keys = set(keys)
+    if not keys:
+        return {}
+
+    fresh_after = timezone.now() - _ttl()
+    found = dict(
+        SpecCache.objects
+        .filter(key__in=keys, created_at__gte=fresh_after)
+        .values_list("key", "result")
+    )
+    if found:
+        # LRU 갱신 + 누적 적중 횟수
+        SpecCache.objects.filter(key__in=found.keys()).update(
+            hits=F("hits") + 1, last_used_at=timezone.now()
+        )
+    return found
+
+
+def get(key):
+    return get_many([key]).get(key)
+
+
+def put_many(entries, prompt_version, model_name):
+    """ entries: {key: result} 저장 (이미 있으면 결과 덮어쓰기) """
+    if not entries:
+        return
+    now = timezone.now()
+    SpecCache.objects.bulk_create(
+        [
+            SpecCache(
+                key=key, result=result, model_name=model_name,
+                prompt_version=prompt_version, created_at=now, last_used_at=now,
+            )
+            for key, result in entries.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["key"],
+        update_fields=["result", "model_name", "prompt_version", "created_at", "last_used_at"],
+    )
+
+
+def put(key, result, prompt_version, model_name):
+    put_many({key: result}, prompt_version, model_name)
+
+
+def evict():
+    """ TTL 지난 것 삭제 후, 최대 개수를 넘으면 오래 안 쓴 것부터 삭제. 삭제 건수 반환 """
+    deleted, _ = SpecCache.objects.filter(created_at__lt=timezone.now() - _ttl()).delete()
+
+    max_entries = getattr(settings, "SPEC_CACHE_MAX_ENTRIES", 50000)
+    cutoff = (
+        SpecCache.objects.order_by("-last_used_at")
+        .values_list("last_used_at", flat=True)[max_entries:max_entries + 1]
+    )
+    cutoff = list(cutoff)
+    if cutoff:
+        lru_deleted, _ = SpecCache.objects.filter(last_used_at__lte=cutoff[0]).delete()
+        deleted += lru_deleted
+    return deleted
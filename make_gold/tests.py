@@ -1,3 +1,1741 @@
-from django.test import TestCase
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from decimal import Decimal
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+from asgiref.sync import sync_to_async
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import AsyncRequestFactory, RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from . import rules, spec_cache
+from .browser import DriverPool
+from .models import AuctionItem, SpecCache
+from .throttle import HostRateLimiter, TokenBucket, call_with_retry
+
+# 페이지 캐시를 쓰는 테스트는 메모리 캐시로 (settings의 FileBasedCache = 개발 서버의 .cache를 지우지 않도록)
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def use_database(test, alias, path):
+    """ 테스트 동안만 쓰는 SQLite 파일 DB 별칭 등록 (테스트가 끝나면 닫고 지움) """
+    from django.conf import settings
+    from django.db import connections
+
+    databases = {"default": settings.DATABASES["default"], alias: {**settings.DATABASES["default"], "NAME": path}}
+    connections.settings[alias] = connections.configure_settings(databases)[alias]
+    test.addCleanup(connections.settings.pop, alias)
+    # 테스트 중에 만든 별칭이라 TestCase의 DB 접근 검사에 추가
+    patcher = mock.patch.object(type(test), "databases", {*test.databases, alias})
+    patcher.start()
+    test.addCleanup(patcher.stop)
+    # 같은 별칭을 다음 테스트에서 다른 파일로 다시 쓸 수 있도록 연결 객체도 버림
+    test.addCleanup(connections.__delitem__, alias)
+    test.addCleanup(connections[alias].close)
+    return connections[alias]
+
+
+def create_model_tables(test, path, *models):
+    """ 임시 SQLite 파일에 모델 테이블 생성 (migrate를 마친 DB와 같은 모양 - sqlite3로 직접 쓰는 수집기 테스트용) """
+    conn = use_database(test, "model_tables", path)
+    with conn.schema_editor() as editor:
+        for model in models:
+            editor.create_model(model)
+    conn.close()
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class QueryPlanTests(TestCase):
+    """ 리스트 뷰 / AI 배치 / 가치 조회 쿼리가 gold_items 전체 스캔을 하지 않는지 확인 """
+
+    # "SCAN gold_items" 뒤에 USING (COVERING) INDEX가 없으면 풀스캔
+    FULL_SCAN = re.compile(r"\bSCAN gold_items\b(?! USING)")
+
+    @classmethod
+    def setUpTestData(cls):
+        for idx, location in enumerate(["서울특별시 강남구", "경기도 수원시", "부산광역시 해운대구"]):
+            AuctionItem.objects.create(
+                url=f"https://example.com/item/{idx}",
+                title=f"순금 반지 {idx}",
+                location=location,
+                description="순금 24K 3.75g",
+                purity="24K",
+                weight_g=3.75,
+            )
+
+    def setUp(self):
+        cache.clear()
+
+    def explain(self, sql, params=()):
+        with connection.cursor() as cursor:
+            cursor.execute("EXPLAIN QUERY PLAN " + sql, params)
+            return "\n".join(row[-1] for row in cursor.fetchall())
+
+    def assertUsesIndex(self, sql, params=()):
+        plan = self.explain(sql, params)
+        self.assertIsNone(self.FULL_SCAN.search(plan), f"full scan:\n{sql}\n{plan}")
+        self.assertNotIn("USE TEMP B-TREE FOR ORDER BY", plan, f"sort without index:\n{sql}\n{plan}")
+
+    def assertViewUsesIndexes(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        queries = [q["sql"] for q in ctx.captured_queries if '"gold_items"' in q["sql"]]
+        self.assertTrue(queries)
+        for sql in queries:
+            # 캡처된 SQL은 파라미터가 이미 치환되어 있음
+            self.assertUsesIndex(sql)
+
+    def test_default_listing(self):
+        self.assertViewUsesIndexes("/")
+
+    def test_listing_next_page(self):
+        response = self.client.get("/?size=1")
+        self.assertViewUsesIndexes("/?" + response.context["next_query"])
+
+    def test_region_buttons(self):
+        for region in ["서울", "경기", "부산"]:
+            self.assertViewUsesIndexes(f"/?region={region}")
+
+        self.assertEqual(AuctionItem.objects.in_region("경기").count(), 1)
+
+    def test_pending_analysis(self):
+        sql, params = AuctionItem.objects.pending_analysis().query.sql_with_params()
+        self.assertUsesIndex(sql, params)
+
+    def test_value_lookup(self):
+        queryset = AuctionItem.objects.filter(purity="24K", weight_g__gte=3).order_by()
+        sql, params = queryset.query.sql_with_params()
+        self.assertUsesIndex(sql, params)
+
+    def test_search_index_stays_in_sync(self):
+        from .search import search_items
+
+        item = AuctionItem.objects.create(url="https://example.com/item/new", title="백금 목걸이", location="서울")
+        self.assertEqual(list(search_items(AuctionItem.objects.all(), "백금 목걸이")), [item])
+        item.title = "은수저 세트"
+        item.save()
+        self.assertEqual(list(search_items(AuctionItem.objects.all(), "백금 목걸이")), [])
+        self.assertEqual(list(search_items(AuctionItem.objects.all(), "은수저")), [item])
+
+    def test_search_triggers_survive_table_rebuilds(self):
+        """ 0004 / 0006은 SQLite에서 gold_items를 새로 만듦 → 각 마이그레이션 직후에도 트리거가 있어야 함 """
+        from django.db import connections
+        from django.db.migrations.executor import MigrationExecutor
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        alias = "migration_check"
+        use_database(self, alias, os.path.join(tmp.name, "migrate.sqlite3"))
+
+        def triggers():
+            with connections[alias].cursor() as cursor:
+                cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'gold_items'")
+                return sorted(row[0] for row in cursor.fetchall())
+
+        def search(title):
+            with connections[alias].cursor() as cursor:
+                cursor.execute("SELECT rowid FROM gold_items_fts WHERE gold_items_fts MATCH %s", [f'"{title}"'])
+                return [row[0] for row in cursor.fetchall()]
+
+        expected = ["gold_items_fts_ad", "gold_items_fts_ai", "gold_items_fts_au"]
+        migrated = []
+        for target in ("0003_auctionitem_search_index", "0004_auctionitem_region_and_indexes",
+                       "0006_auctionitem_list_fingerprint"):
+            executor = MigrationExecutor(connections[alias])
+            executor.migrate([("make_gold", target)])
+            self.assertEqual(triggers(), expected, target)
+            if migrated:
+                # 앞 단계에서 넣은 행도 rebuild로 다시 색인됨
+                self.assertEqual(search(migrated[-1][1]), [migrated[-1][0]], target)
+            # 그 시점의 모델 모양으로 한 행 추가 → 트리거가 바로 색인해야 함
+            Item = executor.loader.project_state(("make_gold", target)).apps.get_model("make_gold", "AuctionItem")
+            item = Item.objects.using(alias).create(url=f"https://example.com/m/{target}", title=f"금반지 {target}")
+            migrated.append((item.pk, item.title))
+            self.assertEqual(search(migrated[-1][1]), [migrated[-1][0]], target)
+
+    def test_discount_sort(self):
+        AuctionItem.objects.update(discount_pct=10.0)
+        self.assertViewUsesIndexes("/?sort=discount&min_discount=5")
+        response = self.client.get("/?sort=discount&size=1")
+        self.assertViewUsesIndexes("/?" + response.context["next_query"])
+
+
+class SearchTests(TestCase):
+    """ search_items: FTS5 매칭 / 관련도 정렬 / 짧은 검색어 LIKE 대체 / 트리거 동기화 """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.title_hit = AuctionItem.objects.create(
+            url="https://example.com/s/1", title="순금 금목걸이 10돈", location="서울", description="선물용",
+        )
+        cls.desc_hit = AuctionItem.objects.create(
+            url="https://example.com/s/2", title="은 팔찌", location="서울", description="금목걸이와 세트 구성",
+        )
+        cls.miss = AuctionItem.objects.create(
+            url="https://example.com/s/3", title="백금 반지", location="부산", description="PT950",
+        )
+
+    def search(self, query):
+        from .search import search_items
+        return list(search_items(AuctionItem.objects.all(), query))
+
+    def test_matches_title_and_description(self):
+        self.assertCountEqual(self.search("금목걸이"), [self.title_hit, self.desc_hit])
+        self.assertEqual(self.search("PT950"), [self.miss])
+        self.assertEqual(self.search("다이아몬드"), [])
+
+    def test_title_match_ranks_first(self):
+        # 제목 가중치(10) > 설명 가중치(1) → 제목에 있는 매물이 먼저 (생성 순서와 반대)
+        self.assertEqual(self.search("금목걸이"), [self.title_hit, self.desc_hit])
+
+    def test_rank_is_annotated(self):
+        from .search import search_items
+        items = search_items(AuctionItem.objects.all(), "금목걸이")
+        self.assertIn("search_rank", items.query.annotations)
+        ranks = [item.search_rank for item in items]
+        self.assertEqual(ranks, sorted(ranks))
+
+    def test_short_terms_use_icontains(self):
+        from .search import search_items
+        # 2글자 검색어는 trigram 인덱스로 못 찾음 → 제목/설명 LIKE
+        self.assertEqual(self.search("팔찌"), [self.desc_hit])
+        self.assertCountEqual(self.search("목걸"), [self.title_hit, self.desc_hit])
+        self.assertNotIn("gold_items_fts", str(search_items(AuctionItem.objects.all(), "목걸").query))
+        # 긴 검색어(FTS)와 짧은 검색어(LIKE)는 AND
+        self.assertEqual(self.search("금목걸이 선물"), [self.title_hit])
+
+    def test_fts_syntax_is_quoted(self):
+        self.assertEqual(self.search('PT950" OR "'), [])
+        self.assertEqual(self.search("금목걸*"), [])
+
+    def test_index_follows_insert_update_delete(self):
+        item = AuctionItem.objects.create(url="https://example.com/s/4", title="금거북이 기념품", location="서울")
+        self.assertEqual(self.search("금거북이"), [item])
+        AuctionItem.objects.filter(pk=item.pk).update(title="금두꺼비 기념품")
+        self.assertEqual(self.search("금거북이"), [])
+        self.assertEqual(self.search("금두꺼비"), [item])
+        item.delete()
+        self.assertEqual(self.search("금두꺼비"), [])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PaginationTests(TestCase):
+    """ pagination.py: 키셋 커서 / 검색 결과 창 / COUNT 캐시 """
+
+    @classmethod
+    def setUpTestData(cls):
+        AuctionItem.objects.bulk_create([
+            AuctionItem(url=f"https://example.com/p/{no}", title=f"금 {no}", location="서울") for no in range(7)
+        ])
+        # 같은 시각에 저장된 행이 여러 개 → id로 순서를 끊어야 함
+        moment = timezone.now()
+        AuctionItem.objects.filter(id__in=list(AuctionItem.objects.values_list("id", flat=True)[:5])).update(created_at=moment)
+
+    def setUp(self):
+        cache.clear()
+
+    def walk(self, page, *args):
+        """ 커서를 따라 끝까지 → 페이지별 id 목록 """
+        pages, cursor = [], None
+        while True:
+            rows, cursor = page(AuctionItem.objects.all(), cursor, *args)
+            pages.append([row.id for row in rows])
+            if cursor is None:
+                return pages
+
+    def test_keyset_cursor_round_trips_through_ties(self):
+        from .pagination import decode_cursor, encode_cursor, keyset_page
+
+        pages = self.walk(keyset_page, 2)
+        expected = list(AuctionItem.objects.order_by("-created_at", "-id").values_list("id", flat=True))
+        self.assertEqual([len(page) for page in pages], [2, 2, 2, 1])
+        self.assertEqual(sum(pages, []), expected)        # 중복/누락 없음
+
+        position = {"c": timezone.now().isoformat(), "i": 42}
+        self.assertEqual(decode_cursor(encode_cursor(position)), position)
+        # 깨진 커서는 첫 페이지
+        self.assertEqual(keyset_page(AuctionItem.objects.all(), "@@not-base64", 2)[0],
+                         keyset_page(AuctionItem.objects.all(), None, 2)[0])
+
+    def test_window_is_capped(self):
+        from .pagination import encode_cursor, window_page
+
+        pages = self.walk(window_page, 2, 5)
+        self.assertEqual([len(page) for page in pages], [2, 2, 1])     # 7개 중 창 크기 5개까지만
+
+        # 창 밖 offset을 직접 넣어도 창 끝으로 보정
+        rows, cursor = window_page(AuctionItem.objects.all(), encode_cursor({"o": 100}), 2, 5)
+        self.assertEqual((rows, cursor), ([], None))
+
+    def test_count_is_served_from_cache(self):
+        from .pagination import cached_count
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(cached_count(AuctionItem.objects.all(), "all"), 7)
+        self.assertEqual(sum("COUNT(" in q["sql"] for q in queries.captured_queries), 1)
+
+        AuctionItem.objects.create(url="https://example.com/p/new", title="금", location="서울")
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(cached_count(AuctionItem.objects.all(), "all"), 7)   # 만료 전까지는 캐시 값
+        self.assertFalse(queries.captured_queries)
+
+        # limit이 있으면 그 개수까지만 셈
+        self.assertEqual(cached_count(AuctionItem.objects.all(), "window", limit=5), 5)
+
+
+class FakeSpecClient:
+    """ Gemini 대신 쓰는 가짜 모델: 지연(latency)을 넣고 동시 호출 수를 기록 """
+
+    model_name = "fake-model"
+    SPEC = {"material": "GOLD", "purity": "24K", "weight_g": "3.75", "risk_factor": "LOW"}
+
+    def __init__(self, latency=0.05, fail_first=0, broken_ids=()):
+        self.latency = latency
+        self.fail_first = fail_first
+        self.broken_ids = {str(i) for i in broken_ids}  # 묶음 응답에서 깨뜨릴 id
+        self.prompts = []
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt):
+        with self._lock:
+            self.calls += 1
+            call_no = self.calls
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.latency)
+            if call_no <= self.fail_first:
+                raise ConnectionError("fake 503")
+            self.prompts.append(prompt)
+            ids = re.findall(r"### id=(\d+)", prompt)
+            if not ids:
+                return json.dumps(self.SPEC)
+            rows = [
+                {"id": item_id, "weight_g": "?"} if item_id in self.broken_ids else {"id": int(item_id), **self.SPEC}
+                for item_id in ids
+            ]
+            return "```json\n" + json.dumps(rows) + "\n```"
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class ThrottleTests(TestCase):
+    def test_token_bucket_waits_for_refill(self):
+        now = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0], sleep=sleep)
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertEqual(bucket.acquire(), 0.0)
+        # 버스트를 다 쓰면 0.5초(1/rate)씩 기다려야 함
+        self.assertAlmostEqual(bucket.acquire(), 0.5)
+        self.assertEqual(sleeps, [0.5])
+
+    def test_call_with_retry_gives_up_after_attempts(self):
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            raise TimeoutError("slow")
+
+        with self.assertRaises(TimeoutError):
+            call_with_retry(flaky, retry_on=(TimeoutError,), attempts=3, sleep=lambda s: None)
+        self.assertEqual(len(calls), 3)
+
+
+class BatchAnalysisTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        AuctionItem.objects.bulk_create([
+            AuctionItem(url=f"https://example.com/item/{idx}", title=f"금반지 {idx}", location="서울", description=f"금반지 {idx}호 (사진 참조)")
+            for idx in range(12)
+        ])
+
+    def test_concurrent_batch_is_bounded_and_bulk_written(self):
+        from . import agent
+        client = FakeSpecClient(latency=0.05)
+
+        with CaptureQueriesContext(connection) as ctx:
+            agent.run_batch_analysis(client=client, workers=4, rpm=60000, write_chunk=5, max_batch_items=1)
+        updates = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+
+        self.assertEqual(client.calls, 12)
+        # 동시 요청 수로 병렬 여부 확인 (걸린 시간은 머신 부하에 따라 흔들려서 보지 않음)
+        self.assertLessEqual(client.max_active, 4)
+        self.assertGreater(client.max_active, 1)
+        # 5개씩 묶어서 bulk_update → UPDATE 3번
+        self.assertEqual(len(updates), 3)
+        self.assertFalse(AuctionItem.objects.pending_analysis().exists())
+        self.assertEqual(AuctionItem.objects.filter(purity="24K", weight_g=3.75).count(), 12)
+
+    def test_descriptions_are_packed_into_batched_prompts(self):
+        from . import agent
+        broken = AuctionItem.objects.order_by("id")[3]
+        client = FakeSpecClient(latency=0, broken_ids=[broken.pk])
+
+        agent.run_batch_analysis(client=client, workers=2, rpm=60000, max_batch_items=5)
+
+        # 12개 → 5/5/2개 묶음 3번 + 스키마가 깨진 1개만 단건 재시도
+        self.assertEqual(client.calls, 4)
+        self.assertEqual(sum("### id=" in prompt for prompt in client.prompts), 3)
+        self.assertEqual(AuctionItem.objects.filter(risk_factor="LOW", weight_g=3.75).count(), 12)
+
+    def test_failed_items_stay_pending(self):
+        from . import agent
+        broken = AuctionItem.objects.order_by("id")[3]
+        # 묶음 응답이 깨지고 단건 재시도도 계속 실패하는 물건
+        client = FakeSpecClient(latency=0, broken_ids=[broken.pk])
+        client.generate = partial(self.fail_single, client.generate, broken.description)
+
+        agent.run_batch_analysis(client=client, workers=2, rpm=60000, max_batch_items=5)
+        self.assertEqual(list(AuctionItem.objects.pending_analysis()), [broken])
+
+        # 다음 실행에서 다시 분석 (실패 결과가 캐시되지도 않음)
+        agent.run_batch_analysis(client=FakeSpecClient(latency=0), workers=2, rpm=60000)
+        self.assertFalse(AuctionItem.objects.pending_analysis().exists())
+        broken.refresh_from_db()
+        self.assertEqual((broken.risk_factor, broken.weight_g), ("LOW", 3.75))
+
+    @staticmethod
+    def fail_single(generate, description, prompt):
+        if description in prompt and "### id=" not in prompt:
+            raise ValueError("unparseable")
+        return generate(prompt)
+
+    def test_batches_respect_token_budget(self):
+        from . import agent
+        entries = [(idx, "가" * 400) for idx in range(6)]
+        batches = agent.pack_batches(entries, token_budget=700, max_items=10)
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 2])
+        # 예산보다 큰 설명도 혼자서는 보냄
+        self.assertEqual(agent.pack_batches([(1, "가" * 5000)], token_budget=700), [[(1, "가" * 5000)]])
+
+    def test_batch_response_validation(self):
+        from . import agent
+        text = json.dumps([
+            {"id": 1, **FakeSpecClient.SPEC},
+            {"id": 2, "material": "GOLD"},            # 필드 누락
+            {"id": 99, **FakeSpecClient.SPEC},        # 요청하지 않은 id
+        ])
+        self.assertEqual(list(agent.parse_batch_response(text, [1, 2, 3])), [1])
+        with self.assertRaises(ValueError):
+            agent.parse_batch_response('{"id": 1}', [1])
+
+    def test_transient_errors_are_retried(self):
+        from . import agent
+        client = FakeSpecClient(latency=0, fail_first=2)
+        with mock.patch.object(agent, "RETRY_BASE_DELAY", 0.001):
+            result = agent.analyze_spec("금반지 (사진 참조)", client=client)
+        self.assertEqual(result["risk_factor"], "LOW")
+        self.assertEqual(client.calls, 3)
+
+
+class SpecCacheTests(TestCase):
+    def setUp(self):
+        spec_cache.stats.reset()
+
+    def test_same_description_skips_network(self):
+        from . import agent
+        client = FakeSpecClient(latency=0)
+
+        first = agent.analyze_spec("Gold  반지\n(사진 참조)", client=client)
+        # 공백/대소문자만 다른 설명은 같은 키
+        second = agent.analyze_spec(" gold 반지 (사진 참조) ", client=client)
+
+        self.assertEqual(first, second)
+        self.assertEqual(client.calls, 1)
+        self.assertEqual((spec_cache.stats.hits, spec_cache.stats.misses), (1, 1))
+        self.assertEqual(SpecCache.objects.get().hits, 1)
+
+    def test_key_depends_on_prompt_version_and_model(self):
+        key = spec_cache.make_key("순금 1돈", "v1", "gemini")
+        self.assertNotEqual(key, spec_cache.make_key("순금 1돈", "v2", "gemini"))
+        self.assertNotEqual(key, spec_cache.make_key("순금 1돈", "v1", "other"))
+
+    def test_batch_calls_once_per_distinct_description(self):
+        from . import agent
+        AuctionItem.objects.bulk_create([
+            AuctionItem(url=f"https://example.com/dup/{idx}", title="골드바", location="서울", description="골드바 10g")
+            for idx in range(5)
+        ])
+        client = FakeSpecClient(latency=0)
+        agent.run_batch_analysis(client=client, workers=2, rpm=60000)
+        self.assertEqual(client.calls, 1)
+
+        # 다시 분석 대기로 돌려도 API 호출 없이 캐시로 처리
+        AuctionItem.objects.update(risk_factor="UNKNOWN")
+        agent.run_batch_analysis(client=client, workers=2, rpm=60000)
+        self.assertEqual(client.calls, 1)
+        # 통계는 실행마다 새로 셈 → 두 번째 실행의 5개 적중만
+        self.assertEqual((spec_cache.stats.hits, spec_cache.stats.misses), (5, 0))
+
+    def test_evict_expired_and_least_recently_used(self):
+        spec_cache.put_many({f"k{idx}": {"purity": "24K"} for idx in range(4)}, "v1", "fake")
+        SpecCache.objects.filter(key="k0").update(created_at=timezone.now() - timedelta(days=365))
+        SpecCache.objects.filter(key="k1").update(last_used_at=timezone.now() - timedelta(days=1))
+
+        with self.settings(SPEC_CACHE_MAX_ENTRIES=2):
+            self.assertEqual(spec_cache.evict(), 2)
+        self.assertEqual(set(SpecCache.objects.values_list("key", flat=True)), {"k2", "k3"})
+
+
+class RuleEngineTests(TestCase):
+    CORPUS = os.path.join(os.path.dirname(__file__), "testdata", "spec_corpus.jsonl")
+
+    def test_confident_results_match_corpus(self):
+        with open(self.CORPUS, encoding="utf-8") as f:
+            corpus = [json.loads(line) for line in f]
+
+        confident = 0
+        for row in corpus:
+            result = rules.classify(row["description"])
+            if rules.is_confident(result):
+                confident += 1
+                self.assertEqual(
+                    (result["material"], result["purity"], result["weight_g"]),
+                    (row["material"], row["purity"], row["weight_g"]),
+                    row["description"],
+                )
+        # 코퍼스의 절반 이상은 AI 없이 처리
+        self.assertGreaterEqual(confident, len(corpus) // 2)
+
+    def test_units_and_ambiguity(self):
+        self.assertEqual(rules.classify("24K반지 2돈")["weight_g"], 7.5)
+        self.assertEqual(rules.classify("순금 골드바 1kg (1,000g)")["weight_g"], 1000.0)
+        self.assertFalse(rules.is_confident(rules.classify("18K 반지, 14K 목걸이 혼합 7.5g")))
+        self.assertFalse(rules.is_confident(rules.classify("24K 골드바 10g × 2개")))
+        self.assertFalse(rules.is_confident(rules.classify("18K 다이아몬드 반지 3.2g")))
+
+    def test_batch_sends_only_ambiguous_items_to_llm(self):
+        from . import agent
+        AuctionItem.objects.create(url="https://example.com/r/1", title="돌반지", location="서울", description="순금 돌반지 1돈 (3.75g)")
+        AuctionItem.objects.create(url="https://example.com/r/2", title="반지", location="서울", description="금반지 (사진 참조)")
+        client = FakeSpecClient(latency=0)
+
+        agent.run_batch_analysis(client=client, workers=1, rpm=60000)
+
+        self.assertEqual(client.calls, 1)
+        self.assertNotIn("돌반지", client.prompts[0])
+        self.assertEqual(AuctionItem.objects.get(url__endswith="/r/1").weight_g, 3.75)
+
+
+class FakeDriver:
+    """ 크롬 대신 쓰는 가짜 드라이버 """
+
+    def __init__(self):
+        self.visited = []
+        self.closed = False
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def quit(self):
+        self.closed = True
+
+
+class DriverPoolTests(TestCase):
+    def test_reuses_then_recycles_after_max_pages(self):
+        pool = DriverPool(size=1, max_pages=2, factory=FakeDriver)
+
+        with pool.driver() as first:
+            first.get("https://example.com/1")
+        with pool.driver() as again:
+            again.get("https://example.com/2")
+
+        self.assertIs(first, again)
+        self.assertTrue(first.closed)  # 2페이지 채워서 반납 때 종료
+        with pool.driver() as fresh:
+            self.assertIsNot(fresh, first)
+        self.assertEqual(pool.launched, 2)
+
+    def test_sampler_replaces_browser_after_max_pages(self):
+        from . import gold_price
+        pool = DriverPool(size=1, max_pages=2, factory=FakeDriver)
+        drivers = []
+
+        def read_price(driver):
+            drivers.append(driver)
+            driver.get("https://example.com/price")
+            return 100000
+
+        with mock.patch.object(gold_price, "get_pool", return_value=pool), \
+                mock.patch.object(gold_price, "PriceSeries"), \
+                mock.patch.object(gold_price, "save_to_db"), \
+                mock.patch.object(gold_price, "read_price", side_effect=read_price):
+            gold_price.run_sampler(interval=0, count=5)
+
+        # 한 번 빌린 채로 돌아도 2페이지마다 새 브라우저
+        self.assertEqual(len(set(map(id, drivers))), 3)
+        self.assertEqual((pool.launched, pool.recycled), (3, 2))
+        self.assertTrue(drivers[0].closed)
+
+    def test_acquire_skips_expired_idle_browser(self):
+        pool = DriverPool(size=1, max_pages=2, factory=FakeDriver)
+        with pool.driver() as first:
+            first.get("https://example.com/1")
+        # 반납 뒤에 한도를 채운 브라우저는 다시 빌려주지 않음
+        first.get("https://example.com/2")
+        with pool.driver() as second:
+            self.assertIsNot(second, first)
+        self.assertTrue(first.closed)
+
+    def test_crashed_browser_is_discarded(self):
+        from selenium.common.exceptions import NoSuchElementException, WebDriverException
+        pool = DriverPool(size=1, factory=FakeDriver)
+
+        with self.assertRaises(NoSuchElementException):
+            with pool.driver() as driver:
+                raise NoSuchElementException("no element")
+        self.assertFalse(driver.closed)  # 요소 못 찾은 건 크래시 아님
+
+        with self.assertRaises(WebDriverException):
+            with pool.driver() as driver:
+                raise WebDriverException("chrome not reachable")
+        self.assertTrue(driver.closed)
+
+    def test_size_bounds_concurrent_checkouts(self):
+        pool = DriverPool(size=2, factory=FakeDriver)
+        pool.warm()
+        first, second = pool.acquire(), pool.acquire()
+
+        with self.assertRaises(TimeoutError):
+            pool.acquire(timeout=0.01)
+
+        pool.release(first)
+        self.assertIs(pool.acquire(timeout=0.01), first)
+        self.assertEqual(pool.launched, 2)
+
+
+KAPAO_FIXTURES = os.path.join(os.path.dirname(__file__), "testdata", "kapao")
+
+
+class QuietFixtureHandler(SimpleHTTPRequestHandler):
+    def do_GET(self):
+        self.server.paths.append(self.path)
+        super().do_GET()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServerMixin:
+    """ 저장해둔 kapao HTML을 로컬 HTTP 서버로 띄움 """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        handler = partial(QuietFixtureHandler, directory=KAPAO_FIXTURES)
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        cls.server.paths = []
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}/"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+
+class CrawlerTests(FixtureServerMixin, TestCase):
+    WEIGHT = re.compile(r"<dt>중량</dt><dd><span>([^<]+)</span>")
+
+    def targets(self, repeat=2):
+        return [
+            {"url": f"{self.base_url}view_{no}.html?r={r}", "no": no}
+            for r in range(repeat) for no in (101, 102, 103)
+        ]
+
+    def test_workers_share_host_rate_limit_and_single_writer(self):
+        import requests
+        from .crawler import crawl
+
+        sessions, fetch_threads, stamps = [], set(), []
+
+        @contextmanager
+        def open_session():
+            with requests.Session() as session:
+                sessions.append(session)
+                yield session
+
+        def fetch(session, target):
+            fetch_threads.add(threading.get_ident())
+            stamps.append(time.monotonic())
+            response = session.get(target["url"], timeout=5)
+            response.raise_for_status()
+            return self.WEIGHT.search(response.content.decode("utf-8")).group(1)
+
+        rate = 20.0
+        writer_threads, weights = set(), {}
+        for target, weight, error in crawl(
+            self.targets(), fetch, open_session, workers=3, limiter=HostRateLimiter(rate),
+        ):
+            self.assertIsNone(error)
+            writer_threads.add(threading.get_ident())
+            weights[target["url"]] = weight
+
+        self.assertEqual(len(weights), 6)
+        self.assertEqual(weights[f"{self.base_url}view_101.html?r=1"], "3.75g")
+        self.assertEqual(len(sessions), 3)
+        # 결과는 호출한 스레드 하나에서만 처리, fetch는 워커 스레드에서
+        self.assertEqual(writer_threads, {threading.get_ident()})
+        self.assertNotIn(threading.get_ident(), fetch_threads)
+        # 워커 3개가 같이 돌아도 호스트 전체 요청 간격은 1/rate 이상
+        stamps.sort()
+        self.assertGreaterEqual(stamps[-1] - stamps[0], (len(stamps) - 1) / rate * 0.9)
+
+    def test_broken_session_is_reopened(self):
+        from .crawler import crawl
+
+        class Crash(Exception):
+            pass
+
+        opened = []
+
+        @contextmanager
+        def open_session():
+            opened.append(object())
+            yield len(opened)
+
+        def fetch(session, target):
+            if session == 1 and target["no"] == 102:
+                raise Crash("browser died")
+            return session
+
+        results = list(crawl(
+            self.targets(repeat=1), fetch, open_session, workers=1,
+            is_broken=lambda e: isinstance(e, Crash),
+        ))
+
+        self.assertEqual(len(opened), 2)
+        self.assertEqual([error is None for _, _, error in results], [True, False, True])
+        self.assertEqual(results[-1][1], 2)  # 새 세션으로 이어서 처리
+
+
+class KapaoHttpTests(FixtureServerMixin, TestCase):
+    def test_search_form_is_submitted_and_cards_parsed(self):
+        from . import kapao
+
+        with kapao.open_session() as session:
+            targets = kapao.fetch_list(session, url=self.base_url + "list.html")
+
+        self.assertIn("cate%5B%5D=05", self.server.paths[-1])   # '귀금속'만 체크
+        self.assertIn("ps=20", self.server.paths[-1])           # hidden 값 유지
+        self.assertEqual(len(targets), 3)
+        first = targets[0]
+        self.assertEqual(first["url"], self.base_url + "view_101.html")
+        self.assertEqual(first["image_url"], self.base_url + "upload/item/101.jpg")
+        self.assertEqual(
+            (first["title"], first["price"], first["location"]),
+            ("순금 반지 3.75g", 420000, "서울 중부경찰서"),
+        )
+
+    def test_detail_fields_match_browser_parser(self):
+        from . import kapao
+        from .past_collector import parse_detail as parse_history_detail
+
+        target = {"url": self.base_url + "view_101.html", "list_text": "요약"}
+        with kapao.open_session() as session:
+            detail = kapao.fetch_detail(session, target)
+            history = parse_history_detail(kapao.doc_text_at(kapao.get(session, target["url"])))
+
+        self.assertEqual(detail["weight_g"], 3.75)
+        self.assertEqual(detail["purity"], "24K")
+        self.assertEqual(detail["description"], "24K 순금 반지 1돈\n중량 3.75g (감정서 포함)")
+        self.assertEqual(history, (420000, 3.75, "함량 : 순금 99.9%"))
+
+
+class ItemWriterTests(TestCase):
+    def row(self, no, **overrides):
+        item = {
+            "url": f"https://example.com/w/{no}", "title": f"금반지 {no}", "price": 100000 * no,
+            "location": "서울 중부경찰서", "image_url": "", "description": "24K 반지",
+            "weight_g": 3.75, "purity": "24K", "list_fingerprint": f"fp-{no}",
+        }
+        item.update(overrides)
+        return item
+
+    def test_flush_reports_inserted_updated_unchanged(self):
+        from .writer import ItemWriter
+        AuctionItem.objects.create(**self.row(1))
+        AuctionItem.objects.create(**self.row(2))
+        AuctionItem.objects.filter(url__endswith="/w/2").update(risk_factor="LOW")
+        before = AuctionItem.objects.get(url__endswith="/w/1").updated_at
+
+        writer = ItemWriter(batch_size=10, verbose=False)
+        writer.add(self.row(1))                                   # 그대로
+        writer.add(self.row(2, price=1, location="부산 해운대"))    # 변경
+        writer.add(self.row(3))                                   # 신규
+        with CaptureQueriesContext(connection) as queries:
+            report = writer.flush()
+
+        self.assertEqual((report.inserted, report.updated, report.unchanged), (1, 1, 1))
+        # SAVEPOINT 제외하면 시세 SELECT 1번 + 기존 행 SELECT 1번 + upsert 1번 + 그대로인 행 확인 시각 UPDATE 1번
+        statements = [q["sql"].split()[0] for q in queries.captured_queries]
+        self.assertEqual(
+            [sql for sql in statements if sql not in ("SAVEPOINT", "RELEASE", "ROLLBACK")],
+            ["SELECT", "SELECT", "INSERT", "UPDATE"],
+        )
+
+        changed = AuctionItem.objects.get(url__endswith="/w/2")
+        self.assertEqual((changed.price, changed.region), (1, "부산"))
+        self.assertEqual(changed.risk_factor, "LOW")              # AI 결과는 유지
+        self.assertEqual(AuctionItem.objects.get(url__endswith="/w/3").region, "서울")
+        unchanged = AuctionItem.objects.get(url__endswith="/w/1")
+        self.assertEqual(unchanged.updated_at, before)
+        self.assertIsNotNone(unchanged.fingerprinted_at)
+
+    def test_flushes_on_size_time_and_close(self):
+        from .writer import ItemWriter
+        now = [0.0]
+
+        with ItemWriter(batch_size=2, flush_seconds=5, clock=lambda: now[0], verbose=False) as writer:
+            self.assertIsNone(writer.add(self.row(1)))
+            self.assertEqual(writer.add(self.row(2)).inserted, 2)   # 개수
+            self.assertIsNone(writer.add(self.row(3)))
+            now[0] = 6.0
+            self.assertEqual(writer.add(self.row(4)).inserted, 2)   # 시간
+            writer.add(self.row(5))
+        # 블록 종료 시 남은 1개
+        self.assertEqual(writer.flushes, 3)
+        self.assertEqual(writer.totals.inserted, 5)
+        self.assertEqual(AuctionItem.objects.count(), 5)
+
+    def test_failed_batch_is_saved_row_by_row(self):
+        from .writer import ItemWriter
+        AuctionItem.objects.create(**self.row(1))
+
+        writer = ItemWriter(batch_size=10, verbose=False)
+        writer.add(self.row(1, price=7))
+        writer.add(self.row(2, price="가격 문의"))   # 이 행 때문에 묶음 upsert가 통째로 실패
+        writer.add(self.row(3))
+        report = writer.flush()
+
+        self.assertEqual((report.inserted, report.updated, report.failed), (1, 1, 1))
+        self.assertIn("실패 1", writer.totals.summary())
+        self.assertEqual(AuctionItem.objects.get(url__endswith="/w/1").price, 7)
+        self.assertEqual(AuctionItem.objects.get(url__endswith="/w/3").region, "서울")
+        self.assertFalse(AuctionItem.objects.filter(url__endswith="/w/2").exists())
+
+
+class IncrementalCrawlTests(TestCase):
+    def target(self, no, list_text):
+        return {"url": f"https://example.com/inc/{no}", "list_text": list_text}
+
+    def test_only_new_changed_or_expired_items_are_fetched(self):
+        from .incremental import fingerprint, select_changed
+        now = timezone.now()
+        for no, text, fetched in [
+            (1, "물품명 금반지\n최저입찰가 100,000원", now - timedelta(days=1)),
+            (2, "물품명 목걸이\n최저입찰가 200,000원", now - timedelta(days=1)),
+            (3, "물품명 팔찌\n최저입찰가 300,000원", now - timedelta(days=30)),
+        ]:
+            AuctionItem.objects.create(
+                url=f"https://example.com/inc/{no}", title="-", location="서울",
+                list_fingerprint=fingerprint(text), fingerprinted_at=fetched,
+            )
+
+        targets = [
+            self.target(1, "물품명 금반지\n최저입찰가   100,000원"),   # 공백만 다름 → 건너뜀
+            self.target(2, "물품명 목걸이\n최저입찰가 150,000원"),     # 가격 변경
+            self.target(3, "물품명 팔찌\n최저입찰가 300,000원"),       # 그대로지만 기한 만료
+            self.target(4, "물품명 새 물건"),                          # 신규
+        ]
+        with self.assertNumQueries(1):
+            selected, report = select_changed(targets, max_age_days=7, now=now)
+
+        self.assertEqual([t["url"][-1] for t in selected], ["2", "3", "4"])
+        self.assertEqual((report.new, report.changed, report.expired, report.skipped), (1, 1, 1, 1))
+        self.assertEqual(targets[0]["fingerprint"], AuctionItem.objects.get(url__endswith="/1").list_fingerprint)
+
+        selected, report = select_changed(targets, max_age_days=0, now=now)
+        self.assertEqual(len(selected), 4)   # --full
+
+
+class HistoryStoreTests(TestCase):
+    def setUp(self):
+        from .models import AuctionHistory
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db_path = os.path.join(tmp.name, "history.sqlite3")
+        create_model_tables(self, self.db_path, AuctionHistory)
+
+    def item(self, no, season=15):
+        return {"season": season, "title": f"금반지 {no}", "price": 1000 * no, "weight": 3.75,
+                "purity_info": "24K", "url": f"https://example.com/h/{no}"}
+
+    def test_duplicates_are_skipped_by_unique_index(self):
+        from .past_collector import HistoryStore
+
+        with HistoryStore(self.db_path, batch_size=100) as store:
+            for no in (1, 2, 3):
+                store.add(self.item(no))
+            self.assertEqual(store.flush(), (3, 0))
+            for no in (2, 3, 4):
+                store.add(self.item(no, season=16))
+            self.assertEqual(store.flush(), (1, 2))
+            journal = store.conn.execute("PRAGMA journal_mode").fetchone()[0]
+            plan = " ".join(
+                row[-1] for row in store.conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT 1 FROM auction_history WHERE url = ?", ("x",)
+                )
+            )
+
+        self.assertEqual(journal, "wal")
+        self.assertIn("(url=?)", plan)
+        with sqlite3.connect(self.db_path) as conn:
+            self.assertEqual(conn.execute("SELECT count(*) FROM auction_history").fetchone()[0], 4)
+
+
+class SqliteTuningTests(TestCase):
+    """ 수집기(쓰기)와 웹 서버(읽기)가 같은 파일을 동시에 쓸 때 "database is locked"가 안 나는지 """
+
+    WRITERS = 4
+    READERS = 4
+    ROUNDS = 25
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db_path = os.path.join(tmp.name, "shared.sqlite3")
+
+    def run_threads(self, write, read):
+        """ 쓰기 스레드 WRITERS개가 끝날 때까지 읽기 스레드 READERS개가 계속 읽음 → 스레드에서 난 예외 목록 """
+        errors, writing = [], threading.Event()
+        writing.set()
+
+        def guarded(func, *args):
+            try:
+                func(*args)
+            except Exception as e:
+                errors.append(e)
+
+        def reader(no):
+            while writing.is_set():
+                read(no)
+
+        writers = [threading.Thread(target=guarded, args=(write, no)) for no in range(self.WRITERS)]
+        readers = [threading.Thread(target=guarded, args=(reader, no)) for no in range(self.READERS)]
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        writing.clear()
+        for thread in readers:
+            thread.join()
+        return errors
+
+    def pragma(self, cursor, name):
+        cursor.execute(f"PRAGMA {name}")
+        return cursor.fetchone()[0]
+
+    def test_django_connections_get_pragmas(self):
+        with connection.cursor() as cursor:
+            values = {
+                name: self.pragma(cursor, name)
+                for name in ("busy_timeout", "synchronous", "cache_size")
+            }
+        # 테스트 DB는 메모리라 journal_mode / mmap_size는 파일 DB에서만 의미 있음 (아래 병렬 테스트에서 확인)
+        self.assertEqual(values["busy_timeout"], 30000)
+        self.assertEqual(values["synchronous"], 1)      # NORMAL
+        self.assertEqual(values["cache_size"], -64000)
+
+    def test_collector_connections_in_parallel(self):
+        from .db import get_db_connection
+        from .models import AuctionHistory, GoldPrice
+        from .past_collector import HistoryStore
+        from .prices import PriceSeries
+
+        create_model_tables(self, self.db_path, AuctionHistory, GoldPrice)
+        HistoryStore(self.db_path).close()   # 체크포인트 테이블 준비
+
+        def write(no):
+            with HistoryStore(self.db_path, batch_size=5) as store, PriceSeries(self.db_path) as series:
+                for round_no in range(self.ROUNDS):
+                    store.add({"season": no, "title": "금", "price": round_no, "weight": 1.0,
+                               "purity_info": "24K", "url": f"https://example.com/p/{no}/{round_no}"})
+                    series.record(100000 + round_no % 3, at=1000 * no + round_no)
+
+        def read(no):
+            conn = get_db_connection(self.db_path)
+            try:
+                conn.execute("SELECT count(*), max(price) FROM auction_history").fetchone()
+                conn.execute("SELECT price FROM gold_price_series ORDER BY started_at DESC LIMIT 1").fetchone()
+            finally:
+                conn.close()
+
+        self.assertEqual(self.run_threads(write, read), [])
+        conn = get_db_connection(self.db_path)
+        self.addCleanup(conn.close)
+        self.assertEqual(conn.execute("SELECT count(*) FROM auction_history").fetchone()[0], self.WRITERS * self.ROUNDS)
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+    def test_orm_read_then_write_transactions_in_parallel(self):
+        """ 먼저 읽고 나서 쓰는 트랜잭션 (ItemWriter.flush 같은 모양) 여러 개 + 리스트 조회 """
+        from django.db import connections, transaction
+
+        alias = "sqlite_tuning"
+        use_database(self, alias, self.db_path)
+        with connections[alias].schema_editor() as editor:
+            editor.create_model(AuctionItem)
+        items = AuctionItem.objects.using(alias)
+
+        def write(no):
+            try:
+                for round_no in range(self.ROUNDS):
+                    with transaction.atomic(using=alias):
+                        seen = items.filter(location=f"지역{no}").count()
+                        items.bulk_create([AuctionItem(url=f"https://example.com/o/{no}/{round_no}", title="금",
+                                                       location=f"지역{no}", price=seen)])
+                        items.filter(location=f"지역{no}").update(risk_factor="LOW")
+            finally:
+                connections[alias].close()
+
+        def read(no):
+            try:
+                items.count()
+                list(items.order_by("-created_at", "-id").values("id", "title", "price")[:40])
+            finally:
+                connections[alias].close()
+
+        self.assertEqual(self.run_threads(write, read), [])
+        with connections[alias].cursor() as cursor:
+            self.assertEqual(self.pragma(cursor, "journal_mode"), "wal")
+            self.assertEqual(self.pragma(cursor, "mmap_size"), 256 * 1024 * 1024)
+        self.assertEqual(items.count(), self.WRITERS * self.ROUNDS)
+        self.assertEqual(sorted(items.filter(location="지역0").values_list("price", flat=True)), list(range(self.ROUNDS)))
+
+
+class SeasonCheckpointTests(FixtureServerMixin, TestCase):
+    def setUp(self):
+        from .models import AuctionHistory
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db_path = os.path.join(tmp.name, "history.sqlite3")
+        create_model_tables(self, self.db_path, AuctionHistory)
+        self.server.paths.clear()
+
+    def run_season(self, pages, batch_size=20):
+        from . import kapao, past_collector
+        item_urls = [(f"물품 {page}", f"{self.base_url}{page}.html") for page in pages]
+        driver = mock.Mock(get_cookies=lambda: [])
+        with mock.patch.object(past_collector, "open_season_list", return_value=[]), \
+                mock.patch.object(past_collector, "read_item_urls", return_value=item_urls), \
+                kapao.open_session() as session, past_collector.HistoryStore(self.db_path, batch_size) as store:
+            self.inserted = past_collector.crawl_season(driver, session, store, 15)
+            return store.done_urls(15), store.finished_seasons()
+
+    def test_rerun_resumes_from_checkpoint(self):
+        done, finished = self.run_season(["view_101", "view_102", "missing"])
+        self.assertEqual(len(done), 2)
+        self.assertEqual(finished, set())          # 실패가 있으면 회차 미완료
+
+        self.server.paths.clear()
+        done, finished = self.run_season(["view_101", "view_102", "view_103"])
+        self.assertEqual(self.server.paths, ["/view_103.html"])   # 끝난 URL은 다시 안 엶
+        self.assertEqual(len(done), 3)
+        self.assertEqual(finished, {15})
+
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute("SELECT price, weight FROM auction_history ORDER BY url").fetchall()
+        self.assertEqual(rows, [(420000, 3.75), (310000, 5.2), (50000, 120.0)])
+
+    def test_inserted_count_includes_auto_flushes(self):
+        # batch_size=2 → 3개 중 2개는 add() 안에서 먼저 저장됨
+        self.run_season(["view_101", "view_102", "view_103"], batch_size=2)
+        self.assertEqual(self.inserted, 3)
+
+    def test_parse_seasons(self):
+        from .past_collector import parse_seasons
+        self.assertEqual(parse_seasons("12-14,20, 13"), [12, 13, 14, 20])
+        self.assertEqual(parse_seasons("18-16"), [16, 17, 18])
+
+
+class PriceSeriesTests(TestCase):
+    def setUp(self):
+        from .models import GoldPrice
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db_path = os.path.join(tmp.name, "prices.sqlite3")
+        create_model_tables(self, self.db_path, GoldPrice)
+
+    def test_unchanged_prices_collapse_into_ranges(self):
+        from .prices import PriceSeries, latest_price, price_at
+
+        with PriceSeries(self.db_path) as series:
+            changes = [series.record(price, at=at) for at, price in [
+                (1000, 98000), (1300, 98000), (1600, 98000), (1900, 99000), (2200, 99000), (2500, 97500),
+            ]]
+            self.assertEqual(changes, [True, False, False, True, False, True])
+            self.assertFalse(series.record(90000, at=1800))   # 과거 시각은 무시
+            self.assertEqual(series.ranges(), [(1000, 1600, 98000), (1900, 2200, 99000), (2500, 2500, 97500)])
+            plan = " ".join(row[-1] for row in series.conn.execute(
+                "EXPLAIN QUERY PLAN SELECT price FROM gold_price_series WHERE started_at <= '2025-01-01' "
+                "ORDER BY started_at DESC LIMIT 1"
+            ))
+
+        self.assertIn("SEARCH", plan)
+        self.assertEqual(latest_price(self.db_path), (97500, 2500))
+        self.assertEqual(price_at(999, self.db_path), None)
+        self.assertEqual(price_at(1700, self.db_path), 98000)    # 구간 사이 → 직전 가격
+        self.assertEqual(price_at(2400, self.db_path), 99000)
+
+
+class BacktestTests(TestCase):
+    def setUp(self):
+        from .models import AuctionHistory, GoldPrice
+        from .prices import PriceSeries
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        db_path = os.path.join(tmp.name, "history.sqlite3")
+        create_model_tables(self, db_path, AuctionHistory, GoldPrice)
+        self.conn = sqlite3.connect(db_path)
+        self.addCleanup(self.conn.close)
+
+        # 2025-01-01 00:00 UTC 부터 100,000원, 2025-02-01 부터 120,000원
+        series = PriceSeries(conn=self.conn)
+        series.record(100000, at=1735689600, commit=False)
+        series.record(120000, at=1738368000, commit=False)
+        self.conn.executemany(
+            "INSERT INTO auction_history (season, title, price, weight, purity_info, url, created_at) "
+            "VALUES (?, '금', ?, ?, ?, ?, ?)",
+            [
+                (12, 300000, 3.75, "함량 : 순금 99.9%", "u1", "2025-01-10 03:00:00"),
+                (12, 450000, 3.75, "함량 : 24K", "u2", "2025-01-10 03:00:00"),
+                (12, 100000, 2.0, "함량 : 18K", "u3", "2025-01-10 03:00:00"),
+                (13, 300000, 3.75, "Au999", "u4", "2025-02-10 03:00:00"),
+                (13, 100000, 9.0, "정보없음", "u5", "2025-02-10 03:00:00"),
+                (11, 300000, 3.75, "24K", "u6", "2024-12-01 03:00:00"),    # 시세 기록 이전
+            ],
+        )
+        self.conn.commit()
+
+    def test_asof_join_picks_price_in_effect(self):
+        from .backtest import spot_asof
+
+        starts, prices = np.array([100, 200, 300]), np.array([1.0, 2.0, 3.0])
+        at = np.array([50, 100, 150, 200, 299, 1000, -1])
+        spot = spot_asof(starts, prices, at)
+        self.assertTrue(np.isnan(spot[0]) and np.isnan(spot[-1]))
+        self.assertEqual(spot[1:-1].tolist(), [1.0, 1.0, 2.0, 2.0, 3.0])
+
+    def test_discount_distribution_per_season_and_purity(self):
+        from .backtest import run_backtest
+
+        report = {(row["season"], row["purity"]): row for row in run_backtest(self.conn)}
+        self.assertEqual(set(report), {(11, "24K"), (12, "24K"), (12, "18K"), (13, "24K")})
+        self.assertEqual(report[(11, "24K")]["valued"], 0)
+
+        season_12 = report[(12, "24K")]
+        self.assertEqual((season_12["lots"], season_12["valued"]), (2, 2))
+        self.assertAlmostEqual(season_12["p50"], (20.0 + -20.0) / 2)
+        self.assertEqual(season_12["below_melt"], 50.0)
+        self.assertEqual(report[(12, "18K")]["p50"], round((150000 - 100000) * 100 / 150000, 2))
+        # 13회차는 2월 시세(120,000원) 기준
+        self.assertEqual(report[(13, "24K")]["p50"], round((450000 - 300000) * 100 / 450000, 2))
+
+    def test_season_dates_override_collection_time(self):
+        from .backtest import parse_season_dates, run_backtest
+
+        dates = parse_season_dates("13=2025-01-20")
+        report = {(row["season"], row["purity"]): row for row in run_backtest(self.conn, [13], dates)}
+        self.assertEqual(list(report), [(13, "24K")])
+        self.assertEqual(report[(13, "24K")]["p50"], 20.0)     # 1월 시세 기준
+
+
+def set_spot(price, at=1000):
+    """ 테스트 DB에 시세 한 구간 기록 (TestCase 트랜잭션과 같이 롤백) """
+    from datetime import datetime, timezone as dt_timezone
+    from .models import GoldPrice
+
+    moment = datetime.fromtimestamp(at, dt_timezone.utc)
+    GoldPrice.objects.create(started_at=moment, last_seen_at=moment, price=price)
+
+
+class RawTableImportTests(TestCase):
+    """ 0010 마이그레이션: sqlite3로 만들던 auction_history / gold_price_series → 모델 테이블 """
+
+    def import_rows(self):
+        import importlib
+        migration = importlib.import_module("make_gold.migrations.0010_history_and_price_models")
+        migration.import_raw_rows(None, mock.Mock(connection=connection))
+
+    def test_raw_rows_are_converted_in_bulk(self):
+        from .models import AuctionHistory, GoldPrice
+
+        with connection.cursor() as cursor:
+            # 모델 이전의 모양 (stash_raw_tables가 __raw로 이름을 바꿔둔 상태)
+            cursor.execute(
+                "CREATE TABLE auction_history__raw (id INTEGER PRIMARY KEY AUTOINCREMENT, season INTEGER, title TEXT, "
+                "price INTEGER, weight REAL, purity_info TEXT, url TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+            )
+            cursor.executemany(
+                "INSERT INTO auction_history__raw (id, season, title, price, weight, purity_info, url, created_at) "
+                "VALUES (%s, %s, %s, %s, %s, %s, %s, %s)",
+                [(5, 12, "반지", 300000, 3.75, "24K", "u1", "2025-01-10 03:00:00"),
+                 (6, 12, None, None, None, None, "u2", None),
+                 (7, 13, "중복", 1, 1.0, "", "u1", "2025-01-11 03:00:00")],
+            )
+            cursor.execute(
+                "CREATE TABLE gold_price_series__raw (started_at INTEGER PRIMARY KEY, last_seen_at INTEGER NOT NULL, "
+                "price INTEGER NOT NULL, samples INTEGER NOT NULL DEFAULT 1) WITHOUT ROWID"
+            )
+            cursor.execute("INSERT INTO gold_price_series__raw VALUES (1735689600, 1735693200, 100000, 3)")
+        self.import_rows()
+
+        history = {row.url: row for row in AuctionHistory.objects.all()}
+        self.assertEqual(sorted(history), ["u1", "u2"])            # 중복 URL은 처음 행만
+        self.assertEqual(history["u1"].weight, Decimal("3.750"))
+        self.assertEqual(history["u1"].created_at.isoformat(), "2025-01-10T03:00:00+00:00")
+        self.assertEqual((history["u2"].title, history["u2"].purity_info), ("", ""))
+        self.assertIsNotNone(history["u2"].created_at)
+
+        price = GoldPrice.objects.get()
+        self.assertEqual(price.started_at.isoformat(), "2025-01-01T00:00:00+00:00")
+        self.assertEqual((price.last_seen_at.hour, price.price, price.samples), (1, Decimal("100000"), 3))
+        self.assertEqual(connection.introspection.table_names().count("gold_price_series__raw"), 0)
+
+        from .valuation import current_spot
+        self.assertEqual(current_spot(), 100000)
+
+    def test_legacy_daily_prices_become_ranges(self):
+        from .models import GoldPrice
+
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE TABLE gold_price (id INTEGER PRIMARY KEY, date TEXT, price INTEGER, created_at TEXT)")
+            cursor.executemany("INSERT INTO gold_price (date, price, created_at) VALUES (%s, %s, %s)", [
+                ("2025-01-01", 98000, None), ("2025-01-02", 98000, None), ("2025-01-03", 99000, None),
+            ])
+        self.import_rows()
+        self.assertEqual(list(GoldPrice.objects.order_by("started_at").values_list("price", "samples")),
+                         [(Decimal("98000"), 2), (Decimal("99000"), 1)])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ValuationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def item(self, no, spot=100000, **fields):
+        values = {"url": f"https://example.com/v/{no}", "title": f"금 {no}", "location": "서울", "price": 300000}
+        values.update(fields)
+        item = AuctionItem(**values)
+        item.save(spot=spot)
+        return item
+
+    def test_melt_value_and_discount(self):
+        from .valuation import valuation
+
+        self.assertEqual(valuation(300000, 3.75, "24K", 100000),
+                         {"melt_value": 375000, "discount_pct": 20.0, "valued_spot": 100000})
+        self.assertEqual(valuation(300000, 10, "18K", 100000)["discount_pct"], 60.0)
+        self.assertEqual(valuation(700000, 10, "14K", 100000)["discount_pct"], -19.66)   # 금값보다 비쌈
+        for args in [(300000, 3.75, "SILVER", 100000), (300000, 0, "24K", 100000), (300000, 3.75, "24K", None)]:
+            self.assertIsNone(valuation(*args)["melt_value"])
+        self.assertIsNone(valuation(0, 3.75, "24K", 100000)["discount_pct"])             # 가격 정보 없음
+
+    def test_rules_and_llm_weights_value_the_same(self):
+        from . import agent, rules
+
+        class GrossWeightClient(FakeSpecClient):
+            # 프롬프트대로 적힌 총 중량을 돌려주는 모델
+            SPEC = {"material": "GOLD", "purity": "18K", "weight_g": "5.2", "risk_factor": "LOW"}
+
+        description = "18K 체인 목걸이 5.2g"
+        set_spot(100000)
+        by_rules = self.item(1, description=description, **{
+            field: rules.classify(description)[field] for field in ("material", "purity", "weight_g")
+        })
+        by_llm = self.item(2, spot=None, description=description)
+        client = GrossWeightClient(latency=0)
+        agent.run_batch_analysis(client=client, workers=1, rpm=60000, use_rules=False)
+
+        self.assertIn("총 중량", client.prompts[0])
+        by_llm.refresh_from_db()
+        self.assertEqual(by_llm.melt_value, by_rules.melt_value)
+        self.assertEqual(by_rules.melt_value, 390000)        # 5.2g × 0.75 × 100,000원
+
+    def test_items_are_valued_when_saved_or_written(self):
+        from .writer import ItemWriter
+
+        # 시세를 안 넘기면 평가하지 않고, 시세 조회도 안 함
+        with CaptureQueriesContext(connection) as queries:
+            self.assertIsNone(self.item(0, spot=None, purity="24K", weight_g=3.75).melt_value)
+        self.assertFalse([q for q in queries.captured_queries if "gold_price_series" in q["sql"]])
+
+        set_spot(100000)
+        item = self.item(1, purity="24K", weight_g=3.75)
+        self.assertEqual((item.melt_value, item.discount_pct, item.valued_spot), (375000, 20.0, 100000))
+
+        item.price = 375000
+        item.save(update_fields=["price"], spot=100000)
+        item.refresh_from_db()
+        self.assertEqual(item.discount_pct, 0.0)
+
+        with ItemWriter(verbose=False) as writer:
+            writer.add({"url": "https://example.com/v/2", "title": "금 2", "location": "서울", "price": 150000,
+                        "weight_g": 2, "purity": "18K", "description": "", "image_url": "", "list_fingerprint": ""})
+        self.assertEqual(AuctionItem.objects.get(url__endswith="/v/2").discount_pct, 0.0)
+
+    def test_valuation_migration_is_self_contained(self):
+        import importlib
+        from django.apps import apps
+        migration = importlib.import_module("make_gold.migrations.0011_value_existing_items")
+
+        self.item(0, spot=None, purity="18K", weight_g=10)
+        migration.value_existing(apps, mock.Mock(connection=connection))   # 시세 기록 없음 → 건너뜀
+        self.assertIsNone(AuctionItem.objects.get().valued_spot)
+
+        set_spot(100000)
+        migration.value_existing(apps, mock.Mock(connection=connection))
+        item = AuctionItem.objects.get()
+        self.assertEqual((item.melt_value, item.discount_pct, item.valued_spot), (750000, 60.0, 100000))
+
+    def test_upgrade_values_items_with_imported_spot(self):
+        """ 시세가 sqlite3 테이블에만 있던 DB를 올리면, 0010이 시세를 옮긴 뒤에 평가됨 """
+        from django.db.migrations.executor import MigrationExecutor
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        alias = "upgrade_check"
+        conn = use_database(self, alias, os.path.join(tmp.name, "upgrade.sqlite3"))
+
+        executor = MigrationExecutor(conn)
+        executor.migrate([("make_gold", "0009_auctionitem_updated_idx")])
+        Item = executor.loader.project_state(("make_gold", "0009_auctionitem_updated_idx")).apps.get_model(
+            "make_gold", "AuctionItem")
+        item = Item.objects.using(alias).create(url="https://example.com/u/1", title="금", price=300000,
+                                                purity="18K", weight_g=10)
+        with conn.cursor() as cursor:
+            # gold_price.py가 sqlite3로 만들던 모양 (epoch 정수)
+            cursor.execute("CREATE TABLE gold_price_series (started_at INTEGER PRIMARY KEY, last_seen_at INTEGER NOT NULL, "
+                           "price INTEGER NOT NULL, samples INTEGER NOT NULL DEFAULT 1) WITHOUT ROWID")
+            cursor.execute("INSERT INTO gold_price_series VALUES (1735689600, 1735693200, 100000, 3)")
+
+        MigrationExecutor(conn).migrate([("make_gold", "0011_value_existing_items")])
+        item = AuctionItem.objects.using(alias).get(pk=item.pk)
+        self.assertEqual((item.melt_value, item.discount_pct, item.valued_spot), (750000, 60.0, 100000))
+
+    def test_current_spot_reads_without_a_transaction(self):
+        from .valuation import current_spot
+
+        set_spot(100000)
+        # 트랜잭션(= IMMEDIATE 쓰기 잠금)이나 savepoint 없이 SELECT 한 번
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(current_spot(), 100000)
+        self.assertEqual([q["sql"].split()[0] for q in queries.captured_queries], ["SELECT"])
+
+    def test_new_spot_revalues_only_stale_rows(self):
+        from .valuation import revalue
+
+        set_spot(100000)
+        for no in range(5):
+            self.item(no, purity="24K", weight_g=3.75)
+        self.item(9, purity="SILVER", weight_g=100)
+
+        self.assertEqual(revalue(100000), 0)                  # 이미 이 시세로 평가됨
+        self.assertEqual(revalue(120000, chunk_size=2), 6)    # 은도 평가 시세는 갱신
+        self.assertEqual(revalue(120000), 0)
+        item = AuctionItem.objects.get(url__endswith="/v/0")
+        self.assertEqual((item.melt_value, item.discount_pct), (450000, 33.33))
+        self.assertIsNone(AuctionItem.objects.get(url__endswith="/v/9").melt_value)
+
+    def test_vectorized_revalue_matches_row_by_row(self):
+        from .valuation import valuation, revalue
+
+        purities = ["24K", "18K", "14K", "SILVER", None, "UNKNOWN"]
+        AuctionItem.objects.bulk_create([
+            AuctionItem(url=f"https://example.com/b/{no}", title="금", location="서울",
+                        price=(no * 7919) % 900000, weight_g=(no % 13) * 1.37, purity=purities[no % len(purities)])
+            for no in range(50)
+        ])
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(revalue(98765, chunk_size=7), 50)
+        updates = [q for q in queries.captured_queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 8)
+
+        for item in AuctionItem.objects.all():
+            expected = valuation(item.price, item.weight_g, item.purity, 98765)
+            self.assertEqual({field: getattr(item, field) for field in expected}, expected)
+
+    def test_list_sorts_and_filters_by_discount(self):
+        set_spot(100000)
+        for no, price in enumerate([360000, 200000, 300000, 500000]):
+            self.item(no, purity="24K", weight_g=3.75, price=price)
+        self.item(9, purity="UNKNOWN")
+
+        response = self.client.get("/?sort=discount&size=2")
+        self.assertEqual([item.price for item in response.context["items"]], [200000, 300000])
+        response = self.client.get("/?" + response.context["next_query"])
+        self.assertEqual([item.price for item in response.context["items"]], [360000, 500000])
+
+        response = self.client.get("/?min_discount=10")
+        self.assertEqual(sorted(item.price for item in response.context["items"]), [200000, 300000])
+        self.assertEqual(response.context["total_count"], 2)
+        self.assertEqual(self.client.get("/?min_discount=nan").context["total_count"], 5)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PageCacheTests(TestCase):
+    def setUp(self):
+        from . import page_cache
+
+        cache.clear()
+        page_cache.stats.reset()
+        AuctionItem.objects.create(url="https://example.com/c/1", title="순금 반지", location="서울 강남구", price=1000)
+
+    def test_repeat_requests_are_served_from_cache(self):
+        from . import page_cache
+
+        first = self.client.get("/?region=서울")
+        self.assertEqual(first["X-Cache"], "MISS")
+        with CaptureQueriesContext(connection) as queries:
+            # 표기만 다른 같은 목록 (서울특별시 → 서울, 공백 정리)
+            second = self.client.get("/?region=서울특별시&q=")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(len(queries), 0)
+
+        self.assertEqual(self.client.get("/?region=부산")["X-Cache"], "MISS")
+        self.assertEqual((page_cache.stats.hits, page_cache.stats.misses), (1, 2))
+        self.assertIn("적중률 33%", page_cache.stats.summary())
+
+    def test_writes_bump_the_data_version(self):
+        from .writer import ItemWriter
+
+        self.client.get("/")
+        with self.captureOnCommitCallbacks(execute=True):
+            with ItemWriter(verbose=False) as writer:
+                writer.add({"url": "https://example.com/c/2", "title": "18K 목걸이", "location": "부산",
+                            "price": 2000, "weight_g": 0, "purity": "18K", "description": "", "image_url": "",
+                            "list_fingerprint": ""})
+        response = self.client.get("/")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertContains(response, "18K 목걸이")
+
+        # save() / delete() 는 시그널로
+        self.assertEqual(self.client.get("/")["X-Cache"], "HIT")
+        with self.captureOnCommitCallbacks(execute=True):
+            AuctionItem.objects.filter(url__endswith="/c/2").get().delete()
+        response = self.client.get("/")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertNotContains(response, "18K 목걸이")
+
+    def test_version_is_bumped_only_after_commit(self):
+        from . import page_cache
+
+        before = page_cache.data_version()
+        with self.captureOnCommitCallbacks() as callbacks:
+            AuctionItem.objects.create(url="https://example.com/c/3", title="금", location="서울")
+            self.assertEqual(page_cache.data_version(), before)
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(page_cache.data_version(), before)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ItemApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for no, (location, purity, weight, price) in enumerate([
+            ("서울 강남구", "24K", 3.75, 300000),
+            ("서울 종로구", "18K", 10.0, 500000),
+            ("부산 해운대구", "24K", 37.5, 3000000),
+            ("경기 수원시", "14K", 2.0, 90000),
+        ]):
+            AuctionItem.objects.create(
+                url=f"https://example.com/api/{no}", title=f"금반지 {no}", location=location,
+                purity=purity, weight_g=weight, price=price, description="긴 설명 " * 50,
+            )
+
+    def setUp(self):
+        cache.clear()
+
+    def get(self, query, **headers):
+        return self.client.get("/api/items/?" + query, **headers)
+
+    def test_sparse_fields_become_values_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get("fields=url,price,weight_g&region=서울")
+        self.assertEqual(response.status_code, 200)
+        items = response.json()["items"]
+        self.assertEqual([set(item) for item in items], [{"url", "price", "weight_g"}] * 2)
+        sql = next(q["sql"] for q in queries.captured_queries if '"gold_items"' in q["sql"])
+        self.assertNotIn('"description"', sql)
+
+        self.assertEqual(self.get("fields=url,password").status_code, 400)
+        self.assertEqual(self.get("min_price=abc").status_code, 400)
+
+    def test_purity_weight_and_price_ranges(self):
+        items = self.get("purity=24k,18K&min_weight=3&max_price=600000&fields=url").json()["items"]
+        self.assertEqual(sorted(item["url"][-1] for item in items), ["0", "1"])
+        items = self.get("min_weight=30&fields=price").json()["items"]
+        self.assertEqual(items, [{"price": 3000000}])
+        items = self.get("q=금반지&region=부산&fields=title").json()["items"]
+        self.assertEqual(items, [{"title": "금반지 2"}])
+
+    def test_keyset_cursor_walks_all_rows(self):
+        seen, query = [], "size=3&fields=url"
+        while query:
+            body = self.get(query).json()
+            seen += [item["url"] for item in body["items"]]
+            query = body["next"] and body["next"].split("?", 1)[1]
+        self.assertEqual(len(seen), 4)
+        self.assertEqual(len(set(seen)), 4)
+
+    def test_etag_returns_304_without_db_hit(self):
+        from . import page_cache
+
+        first = self.get("region=서울&fields=url")
+        etag = first["ETag"]
+        with CaptureQueriesContext(connection) as queries:
+            again = self.get("region=서울특별시&fields=url", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(len(queries), 0)
+
+        page_cache.bump_data_version()
+        self.assertEqual(self.get("region=서울&fields=url", HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AsyncViewTests(TestCase):
+    """ ASGI용 async 뷰가 동기 뷰와 같은 응답을 내는지 """
+
+    @classmethod
+    def setUpTestData(cls):
+        from .valuation import revalue
+
+        set_spot(100000)
+        for no in range(7):
+            AuctionItem.objects.create(
+                url=f"https://example.com/async/{no}", title=f"순금 반지 {no}", location="서울 강남구" if no % 2 else "부산",
+                purity="24K", weight_g=1 + no, price=50000 + no * 20000,
+            )
+        revalue()
+
+    def setUp(self):
+        cache.clear()
+
+    async def both(self, sync_view, async_view, query):
+        await cache.aclear()
+        expected = await sync_to_async(sync_view)(RequestFactory().get("/?" + query))
+        await cache.aclear()
+        response = await async_view(AsyncRequestFactory().get("/?" + query))
+        self.assertEqual(response.status_code, expected.status_code)
+        return expected, response
+
+    async def test_listing_matches_sync_view(self):
+        from . import views
+
+        pages = {}
+        for query in ["", "size=3", "size=3&region=서울", "sort=discount&size=2", "q=순금 반지&size=4", "min_discount=50"]:
+            expected, response = await self.both(views.gold_list, views.gold_list_async, query)
+            self.assertEqual(response.content, expected.content, query)
+            pages[query] = response.content.decode()
+
+        # 다음 페이지 커서도 같은 결과
+        for query in ["size=3", "sort=discount&size=2", "q=순금 반지&size=4"]:
+            next_query = re.search(r'href="\?([^"]*cursor=[^"]*)"', pages[query]).group(1).replace("&amp;", "&")
+            expected, response = await self.both(views.gold_list, views.gold_list_async, next_query)
+            self.assertEqual(response.content, expected.content, next_query)
+
+        # 두 번째 요청은 캐시에서 (DB 조회 없음)
+        first = await views.gold_list_async(AsyncRequestFactory().get("/?size=3"))
+        response = await views.gold_list_async(AsyncRequestFactory().get("/?size=3&q="))
+        self.assertEqual((first["X-Cache"], response["X-Cache"]), ("MISS", "HIT"))
+
+    async def test_api_matches_sync_view(self):
+        from . import api
+
+        for query in ["fields=url,price", "size=2&sort=discount", "q=순금&fields=title", "purity=18K", "min_price=x"]:
+            expected, response = await self.both(api.item_list, api.item_list_async, query)
+            self.assertEqual(json.loads(response.content), json.loads(expected.content), query)
+
+    async def test_api_etag_matches_sync_view(self):
+        from . import api
+
+        expected = await sync_to_async(api.item_list)(RequestFactory().get("/?fields=url"))
+        response = await api.item_list_async(AsyncRequestFactory().get("/?fields=url"))
+        self.assertEqual(response["ETag"], expected["ETag"])
+
+        with mock.patch.object(api, "afetch_page") as fetch:
+            again = await api.item_list_async(AsyncRequestFactory().get("/?fields=url", headers={"If-None-Match": response["ETag"]}))
+        self.assertEqual(again.status_code, 304)
+        fetch.assert_not_called()
+
+    async def test_export_streams_async_rows(self):
+        from . import export
+
+        for query in ["", "format=csv", "format=csv&since=2000-01-01"]:
+            expected = await sync_to_async(export.export_view)(RequestFactory().get("/?" + query), "gold_items")
+            expected_body = await sync_to_async(lambda: b"".join(expected.streaming_content))()
+            response = await export.export_view_async(AsyncRequestFactory().get("/?" + query), "gold_items")
+            # async 제너레이터 → ASGI 핸들러가 버퍼링하지 않고 바로 보냄
+            self.assertTrue(response.is_async)
+            self.assertEqual(b"".join([chunk async for chunk in response.streaming_content]), expected_body, query)
+            self.assertEqual(response["Content-Disposition"], expected["Content-Disposition"])
+
+        response = await export.export_view_async(AsyncRequestFactory().get("/?format=xml"), "gold_items")
+        self.assertEqual(response.status_code, 400)
+
+
+class ExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for no in range(5):
+            AuctionItem.objects.create(url=f"https://example.com/x/{no}", title=f"금, \"{no}\"", location="서울", price=no)
+        # 앞의 3개는 오래전에 마지막으로 바뀐 것으로
+        AuctionItem.objects.filter(price__lt=3).update(updated_at=timezone.now() - timedelta(days=30))
+
+    def stream(self, url):
+        response = self.client.get(url)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_ndjson_and_csv_stream_every_row(self):
+        lines = self.stream("/api/export/gold_items/").splitlines()
+        rows = [json.loads(line) for line in lines]
+        self.assertEqual([row["price"] for row in rows], [0, 1, 2, 3, 4])
+        self.assertEqual(rows[0]["title"], '금, "0"')
+
+        import csv
+        rows = list(csv.DictReader(self.stream("/api/export/gold_items/?format=csv").splitlines()))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[4]["title"], '금, "4"')
+        self.assertEqual(rows[4]["melt_value"], "")
+
+    def test_since_exports_only_changed_rows(self):
+        since = (timezone.now() - timedelta(days=1)).isoformat()
+        rows = [json.loads(line) for line in self.stream("/api/export/gold_items/?" + f"since={since}".replace("+", "%2B")).splitlines()]
+        self.assertEqual(sorted(row["price"] for row in rows), [3, 4])
+
+        # 시세가 바뀌어 재평가된 행(할인율 등 평가 컬럼 변경)도 다음 동기화에 포함
+        from .valuation import revalue
+        AuctionItem.objects.filter(price=0).update(purity="24K", weight_g=1)
+        AuctionItem.objects.filter(price__lt=3).update(updated_at=timezone.now() - timedelta(days=30))
+        self.assertEqual(revalue(100000), 5)
+        rows = [json.loads(line) for line in self.stream("/api/export/gold_items/?" + f"since={since}".replace("+", "%2B")).splitlines()]
+        self.assertEqual(sorted(row["price"] for row in rows), [0, 1, 2, 3, 4])
+        self.assertEqual(rows[0]["melt_value"], 100000)
+
+        for query in ["format=xml", "since=yesterday"]:
+            self.assertEqual(self.client.get("/api/export/gold_items/?" + query).status_code, 400)
+        self.assertEqual(self.client.get("/api/export/secrets/").status_code, 400)
+
+    def test_auction_history_and_command(self):
+        from django.core.management import call_command
+
+        from .models import AuctionHistory
+
+        # past_collector처럼 sqlite3 방식으로 (created_at은 UTC 문자열)
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                "INSERT INTO auction_history (season, title, price, weight, purity_info, url, created_at) "
+                "VALUES (%s, %s, %s, %s, %s, %s, %s)",
+                [(12, "반지", 1000, 3.75, "24K", f"u{no}", f"2025-01-0{no + 1} 00:00:00") for no in range(3)],
+            )
+        self.assertEqual(AuctionHistory.objects.filter(created_at__gte="2025-01-02T00:00:00Z").count(), 2)
+
+        rows = [json.loads(line) for line in self.stream("/api/export/auction_history/?since=2025-01-02").splitlines()]
+        self.assertEqual([row["url"] for row in rows], ["u1", "u2"])
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, "history.csv")
+        call_command("export_data", "auction_history", "--format", "csv", "--output", path, "--chunk-size", "2",
+                     stderr=open(os.devnull, "w"))
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(len(f.read().splitlines()), 4)
+
+
+class GrowingListDriver:
+    """ 시간이 지나면서 li가 나눠서 붙는 리스트 흉내 (schedule: [(초, 개수), ...]) """
+
+    def __init__(self, schedule):
+        self.started = time.monotonic()
+        self.schedule = schedule
+
+    def find_elements(self, by, value):
+        elapsed = time.monotonic() - self.started
+        count = 0
+        for at, size in self.schedule:
+            if elapsed >= at:
+                count = size
+        return [f"li-{idx}" for idx in range(count)]
+
+
+class StaleElement:
+    def __init__(self, stale_after):
+        self.stale_at = time.monotonic() + stale_after
+
+    def is_enabled(self):
+        from selenium.common.exceptions import StaleElementReferenceException
+        if time.monotonic() >= self.stale_at:
+            raise StaleElementReferenceException("gone")
+        return True
+
+
+class WaitHelperTests(TestCase):
+    def setUp(self):
+        from . import waits
+        self.waits = waits
+        waits.stats.reset()
+
+    def test_list_wait_returns_once_count_is_stable(self):
+        driver = GrowingListDriver([(0.05, 3), (0.15, 8)])
+
+        items = self.waits.wait_list(driver, "//li", "리스트", timeout=3)
+
+        # 다 붙은 뒤(8개)에 개수가 안정돼서 반환 - 타임아웃까지 기다리지 않음
+        # (걸린 시간 상한은 머신 부하에 따라 흔들려서 보지 않음)
+        self.assertEqual(len(items), 8)
+        record = self.waits.stats.records["리스트"]
+        self.assertEqual((record["count"], record["timeouts"]), (1, 0))
+        self.assertGreaterEqual(record["total"], 0.15)
+
+    def test_refresh_waits_for_old_list_to_go_stale(self):
+        driver = GrowingListDriver([(0, 0)])   # 새 리스트는 0건
+        previous = StaleElement(stale_after=0.2)
+
+        items = self.waits.wait_list(driver, "//li", "검색", previous=previous, timeout=3)
+
+        self.assertEqual(items, [])
+        self.assertGreaterEqual(self.waits.stats.records["검색"]["total"], 0.2)
+
+    def test_timeouts_are_recorded(self):
+        from selenium.common.exceptions import TimeoutException
+        driver = GrowingListDriver([(0, 0)])
+
+        with self.assertRaises(TimeoutException):
+            self.waits.wait_list(driver, "//li", "빈 리스트", timeout=0.2)
+
+        self.assertEqual(self.waits.stats.records["빈 리스트"]["timeouts"], 1)
+        self.assertIn("빈 리스트", self.waits.stats.summary())
@@ -0,0 +1,89 @@
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+# =========================================================
+# 호출 속도 제한 / 재시도 도우미
+# =========================================================
+
+
+class TokenBucket:
+    """
+    토큰 버킷 방식 속도 제한기 (여러 스레드에서 같이 써도 안전)
+    - rate     : 초당 보충되는 토큰 수 (예: 분당 60회 → 1.0)
+    - capacity : 한 번에 몰아서 쓸 수 있는 최대 토큰 수 (버스트)
+    """
+
+    def __init__(self, rate, capacity=1, clock=time.monotonic, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = float(rate)
+        self.capacity = float(max(capacity, 1))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens=1):
+        """ 토큰이 생길 때까지 기다렸다가 가져감. 기다린 시간(초)을 반환 """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+
+def call_with_retry(func, retry_on=(Exception,), attempts=4, base_delay=1.0, max_delay=30.0, sleep=time.sleep):
+    """
+    func()를 실행하고 retry_on 예외가 나면 지수 백오프(+지터)로 재시도
+    마지막 시도까지 실패하면 예외를 그대로 올림
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            return func()
+        except retry_on as e:
+            if attempt == attempts:
+                raise
+            delay = min(max_delay, base_delay * (2 ** (attempt - 1)))
+            delay = random.uniform(delay / 2, delay)
+            print(f"   ↻ 일시 오류, {delay:.1f}초 후 재시도 ({attempt}/{attempts - 1}): {e}")
+            sleep(delay)
+
+
+class HostRateLimiter:
+    """
+    호스트(도메인)별 토큰 버킷 → 워커가 몇 개든 같은 사이트에는 초당 rate회까지만 요청
+    """
+
+    def __init__(self, rate, burst=1, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host):
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(
+                    self.rate, self.burst, clock=self._clock, sleep=self._sleep,
+                )
+            return bucket
+
+    def wait(self, url):
+        """ url의 호스트 차례가 올 때까지 대기. 기다린 시간(초)을 반환 """
+        return self._bucket(urlsplit(url).netloc).acquire()
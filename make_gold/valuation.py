@@ -0,0 +1,144 @@
+import numpy as np
+from django.db import DatabaseError, connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from . import page_cache
+
+# =========================================================
+# 매물 가치 평가: 금 함량 가치(melt value) + 시세 대비 할인율
+# - melt_value   = weight_g × 순도 비율 × 최신 1g 시세 (models.GoldPrice = gold_price_series)
+# - discount_pct = (melt_value - 최저입찰가) / melt_value × 100  (양수 = 금값보다 싸게 나옴)
+# - 결과는 gold_items 컬럼에 저장 → 리스트는 인덱스로 정렬/필터만 (요청마다 계산 안 함)
+# - 어떤 시세로 계산했는지(valued_spot)도 저장 → 시세가 바뀌면 아직 옛 시세인 행만 다시 계산
+# - 시세가 바뀌어 전체를 다시 계산할 때는 numpy 배열로 한 번에 계산하고
+#   UPDATE ... FROM (VALUES ...) 묶음으로 저장 (행마다 ORM save 안 함)
+# =========================================================
+
+# 시세(네이버 실물 팔 때)는 순금 1g 기준 → 24K = 1.0
+PURITY_FRACTION = {"24K": 1.0, "18K": 0.75, "14K": 0.585}
+
+VALUE_FIELDS = ['melt_value', 'discount_pct', 'valued_spot']
+
+# UPDATE ... FROM (VALUES ...) 한 문장에 넣는 행 수 (행당 파라미터 3개, SQLite 한도 32766)
+REVALUE_CHUNK = 5000
+
+
+def current_spot():
+    """ 최신 1g 시세 - 원 단위 정수 (models.GoldPrice 기록이 없으면 None) """
+    from .models import GoldPrice
+
+    try:
+        # SELECT 하나라 atomic()으로 감싸지 않음 (IMMEDIATE 모드에선 atomic()이 쓰기 잠금부터 잡음)
+        price = GoldPrice.objects.order_by('-started_at').values_list('price', flat=True).first()
+    except DatabaseError:
+        # 0010 마이그레이션 전이라 시세 테이블이 아직 없음
+        return None
+    return None if price is None else int(price)
+
+
+def _fractions(purities):
+    """ 순도 문자열 목록 → 순도 비율 배열 (금이 아니면 0) """
+    return np.array([PURITY_FRACTION.get(purity, 0.0) for purity in purities], dtype=np.float64)
+
+
+def value_arrays(price, weight_g, fraction, spot):
+    """
+    numpy 배열 단위 가치 계산 (행 하나든 100만 개든 같은 식)
+    반환: (melt_value, discount_pct, has_melt, has_discount) - has_* 가 False인 자리는 NULL
+    """
+    price = np.asarray(price, dtype=np.float64)
+    weight_g = np.asarray(weight_g, dtype=np.float64)
+    fraction = np.asarray(fraction, dtype=np.float64)
+
+    melt = np.rint(weight_g * fraction * (spot or 0))
+    has_melt = (fraction > 0) & (weight_g > 0) & (melt > 0)
+    # 가격 0 = 정보 없음
+    has_discount = has_melt & (price != 0)
+    discount = np.round((melt - price) * 100.0 / np.where(has_discount, melt, 1.0), 2)
+    return melt, discount, has_melt, has_discount
+
+
+def valuation(price, weight_g, purity, spot):
+    """ gold_items 평가 컬럼에 그대로 넣을 dict (금이 아니거나 무게/시세를 모르면 NULL) """
+    melt, discount, has_melt, has_discount = value_arrays([price or 0], [weight_g or 0], _fractions([purity]), spot)
+    return {
+        'melt_value': int(melt[0]) if has_melt[0] else None,
+        'discount_pct': float(discount[0]) if has_discount[0] else None,
+        'valued_spot': spot,
+    }
+
+
+def value_item(item, spot):
+    """ 모델 인스턴스의 평가 컬럼 채우기 (저장은 호출한 쪽에서) """
+    for field, value in valuation(item.price, item.weight_g, item.purity, spot).items():
+        setattr(item, field, value)
+
+
+def _update_from_values(table, rows, spot, now):
+    """ rows: [(id, melt_value, discount_pct), ...] → UPDATE 한 문장 (updated_at = now) """
+    placeholders = ", ".join(["(%s, %s, %s)"] * len(rows))
+    params = [spot, connection.ops.adapt_datetimefield_value(now), *(value for row in rows for value in row)]
+    if connection.vendor == 'postgresql':
+        sql = (
+            f'UPDATE "{table}" AS t SET melt_value = v.melt::bigint, '
+            f'discount_pct = v.pct::double precision, valued_spot = %s, updated_at = %s '
+            f'FROM (VALUES {placeholders}) AS v(id, melt, pct) WHERE t.id = v.id'
+        )
+    else:
+        # SQLite의 VALUES 컬럼 이름은 column1, column2, ...
+        sql = (
+            f'UPDATE "{table}" SET melt_value = v.column2, discount_pct = v.column3, valued_spot = %s, updated_at = %s '
+            f'FROM (VALUES {placeholders}) AS v WHERE "{table}".id = v.column1'
+        )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+
+
+def _supports_update_from():
+    if connection.vendor == 'postgresql':
+        return True
+    return connection.vendor == 'sqlite' and connection.Database.sqlite_version_info >= (3, 33)
+
+
+def revalue(spot=None, queryset=None, chunk_size=REVALUE_CHUNK):
+    """
+    spot(기본: 최신 시세)으로 평가되지 않은 행만 다시 계산해서 저장, 갱신한 행 수 반환
+    queryset을 주면 그 안에서만 (예: 방금 들어온 물건들)
+    1) 대상 행의 (id, weight_g, purity, price)를 배열로 읽고
+    2) numpy로 한 번에 계산한 뒤
+    3) chunk_size개씩 UPDATE ... FROM (VALUES ...) (지원 안 하는 DB는 bulk_update)
+    """
+    from .models import AuctionItem
+
+    spot = current_spot() if spot is None else spot
+    if spot is None:
+        return 0
+
+    queryset = AuctionItem.objects.all() if queryset is None else queryset
+    rows = list(queryset.filter(~Q(valued_spot=spot)).order_by().values_list('id', 'weight_g', 'purity', 'price'))
+    if not rows:
+        return 0
+
+    ids, weights, purities, prices = zip(*rows)
+    melt, discount, has_melt, has_discount = value_arrays(prices, weights, _fractions(purities), spot)
+    melts = [int(value) if ok else None for value, ok in zip(melt.tolist(), has_melt.tolist())]
+    discounts = [value if ok else None for value, ok in zip(discount.tolist(), has_discount.tolist())]
+
+    values = list(zip(ids, melts, discounts))
+    use_update_from = _supports_update_from()
+    # 평가 컬럼도 내보내기 대상이라 updated_at을 같이 올림 (?since= 증분 동기화가 놓치지 않도록)
+    now = timezone.now()
+    with transaction.atomic():
+        for start in range(0, len(values), chunk_size):
+            chunk = values[start:start + chunk_size]
+            if use_update_from:
+                _update_from_values(AuctionItem._meta.db_table, chunk, spot, now)
+            else:
+                AuctionItem.objects.bulk_update([
+                    AuctionItem(id=pk, melt_value=melt_value, discount_pct=pct, valued_spot=spot, updated_at=now)
+                    for pk, melt_value, pct in chunk
+                ], [*VALUE_FIELDS, 'updated_at'])
+        # 할인율이 바뀌었으니 리스트 페이지 캐시 무효화
+        page_cache.bump_on_commit()
+    return len(ids)
@@ -1,33 +1,168 @@
+import math
+
+from django.conf import settings
 from django.shortcuts import render
-from django.db.models import Q
+from . import page_cache
 from .models import AuctionItem
+from .pagination import (
+    acached_count, akeyset_page, awindow_page, cached_count, get_page_size, keyset_page, window_page,
+)
+from .regions import normalize_region
+from .search import search_items
 
-def gold_list(request):
-    # 1. 기본: 모든 데이터 가져오기 (최신순)
-    items = AuctionItem.objects.all().order_by('-created_at')
+# 리스트 카드에 실제로 쓰는 컬럼만 (description 같은 큰 텍스트는 안 읽음)
+LIST_FIELDS = ('id', 'title', 'location', 'price', 'image_url', 'url', 'created_at', 'melt_value', 'discount_pct')
+
+
+def parse_min_discount(raw_value):
+    """ ?min_discount= 파라미터 → 숫자 (없거나 잘못되면 None) """
+    try:
+        value = float(raw_value)
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def filter_items(items, query='', region='', min_discount=None, sort='latest'):
+    """ 리스트 화면과 JSON API(make_gold.api)가 같이 쓰는 검색/필터/정렬 """
+    # 1. 기본: 최신순
+    items = items.order_by('-created_at', '-id')
 
     # 2. 검색어 처리 (Search)
     # GET 파라미터 'q'를 받음 (예: ?q=24k)
-    query = request.GET.get('q', '')
     if query:
-        # 제목이나 설명에 검색어가 포함된 경우 필터링 (OR 조건)
-        items = items.filter(
-            Q(title__icontains=query) | 
-            Q(description__icontains=query)
-        )
+        # 전문 검색 인덱스(FTS)로 찾고 관련도 순으로 정렬
+        items = search_items(items, query)
 
     # 3. 지역 필터링 (Filter)
     # GET 파라미터 'region'을 받음 (예: ?region=서울)
-    region = request.GET.get('region', '')
     if region:
-        items = items.filter(location__icontains=region)
+        # 정규화된 region 컬럼 동등 비교 (인덱스 사용)
+        items = items.in_region(region)
+
+    # 4. 시세 대비 할인율 (Valuation)
+    # ?sort=discount → 금값보다 많이 싼 순, ?min_discount=20 → 20% 이상 싼 것만
+    # 할인율은 미리 계산된 컬럼이라 여기서는 비교/정렬만 함
+    if min_discount is not None:
+        items = items.filter(discount_pct__gte=min_discount)
+    if sort == 'discount':
+        items = items.filter(discount_pct__isnull=False).order_by('-discount_pct', '-id')
+    return items
+
+
+def list_params(request):
+    """
+    0. 파라미터 정리 → 같은 목록이면 같은 캐시 키
+    (검색어 공백 정리, 지역은 '서울특별시' → '서울' 처럼 정규화)
+    """
+    region = request.GET.get('region', '').strip()
+    return {
+        'query': " ".join(request.GET.get('q', '').split()),
+        'region': normalize_region(region) or region,
+        'sort': 'discount' if request.GET.get('sort') == 'discount' else 'latest',
+        'min_discount': parse_min_discount(request.GET.get('min_discount')),
+        'page_size': get_page_size(request.GET.get('size')),
+        'cursor': request.GET.get('cursor', ''),
+    }
+
+
+def list_cache_key(version, params):
+    # 수집기/AI 분석이 저장할 때마다 버전이 바뀌므로 캐시된 페이지는 항상 최신 데이터 기준
+    return page_cache.page_key(
+        version, q=params['query'], region=params['region'], sort=params['sort'],
+        min_discount=params['min_discount'], size=params['page_size'], cursor=params['cursor'],
+    )
+
+
+def list_items(params):
+    """ 1~4. 필요한 컬럼만 읽고 검색어 / 지역 / 할인율 조건 적용 (아직 DB 조회 안 함) """
+    items = filter_items(
+        AuctionItem.objects.only(*LIST_FIELDS),
+        params['query'], params['region'], params['min_discount'], params['sort'],
+    )
+    count_key = f"{params['query']}|{params['region']}|{params['sort']}|{params['min_discount']}"
+    return items, count_key
+
 
-    # 4. 템플릿에 전달할 데이터 패키징
+def search_window():
+    return getattr(settings, 'GOLD_SEARCH_RESULT_WINDOW', 400)
+
+
+def render_list(request, params, page, next_cursor, total_count):
+    # 검색 결과는 최대 결과 창까지만 셈 (넘치면 "400+")
+    count_capped = bool(params['query']) and total_count > search_window()
+    if params['query']:
+        total_count = min(total_count, search_window())
+
+    # 다음 페이지 링크 (검색어/지역/정렬 유지)
+    next_query = None
+    if next_cursor:
+        query_params = request.GET.copy()
+        query_params['cursor'] = next_cursor
+        next_query = query_params.urlencode()
+
+    # 6. 템플릿에 전달할 데이터 패키징
     context = {
-        'items': items,
-        'query': query,
-        'region': region,
-        'total_count': items.count(),
+        'items': page,
+        'query': params['query'],
+        'region': params['region'],
+        'sort': params['sort'],
+        'min_discount': request.GET.get('min_discount') if params['min_discount'] is not None else '',
+        'total_count': total_count,
+        'count_capped': count_capped,
+        'next_query': next_query,
+        'is_first_page': not params['cursor'],
     }
+    return render(request, 'make_gold/index.html', context)
+
+
+def gold_list(request):
+    params = list_params(request)
+    version = page_cache.data_version()
+    cache_key = list_cache_key(version, params)
+    cached = page_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    items, count_key = list_items(params)
+    count_key = f"{version}|{count_key}"
+
+    # 5. 페이지 자르기 (Pagination)
+    # 검색 결과는 관련도 순이라 최대 결과 창 안에서만, 기본 목록은 커서 방식
+    if params['query']:
+        window = search_window()
+        page, next_cursor = window_page(items, params['cursor'], params['page_size'], window)
+        total_count = cached_count(items, count_key, limit=window + 1)
+    else:
+        page, next_cursor = keyset_page(items, params['cursor'], params['page_size'], order=params['sort'])
+        total_count = cached_count(items, count_key)
+
+    return page_cache.put(cache_key, render_list(request, params, page, next_cursor, total_count))
+
+
+async def gold_list_async(request):
+    """
+    gold_list의 async 버전 (ASGI로 띄울 때 config/urls.py가 이쪽을 연결)
+    - 캐시 조회는 이벤트 루프에서 바로, DB 조회는 sync_to_async로 넘김
+    - ORM 호출은 thread_sensitive 스레드 하나에서 차례로 돌기 때문에 페이지 → 개수 순서로 그냥 기다림
+    """
+    params = list_params(request)
+    version = await page_cache.adata_version()
+    cache_key = list_cache_key(version, params)
+    cached = await page_cache.aget(cache_key)
+    if cached is not None:
+        return cached
+
+    items, count_key = list_items(params)
+    count_key = f"{version}|{count_key}"
+
+    if params['query']:
+        window = search_window()
+        page, next_cursor = await awindow_page(items, params['cursor'], params['page_size'], window)
+        total_count = await acached_count(items, count_key, limit=window + 1)
+    else:
+        page, next_cursor = await akeyset_page(items, params['cursor'], params['page_size'], order=params['sort'])
+        total_count = await acached_count(items, count_key)
 
-    return render(request, 'make_gold/index.html', context)
\ No newline at end of file
+    # 템플릿은 이미 읽어온 컬럼(LIST_FIELDS)만 써서 렌더링 중에 DB 조회가 없음
+    return await page_cache.aput(cache_key, render_list(request, params, page, next_cursor, total_count))
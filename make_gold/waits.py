@@ -0,0 +1,155 @@
+import threading
+import time
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+# =========================================================
+# 고정 sleep 대신 쓰는 대기 도우미 (probe / past_collector 공용)
+# - WebDriverWait로 실제 DOM 조건(리스트 개수 안정, 요소 등장 등)이 될 때까지만 기다림
+# - 대기마다 걸린 시간을 이름(label)별로 기록 → 크롤링 시간이 어디서 새는지 확인
+# =========================================================
+
+DEFAULT_TIMEOUT = 10
+POLL_INTERVAL = 0.1
+LIST_SETTLE_SECONDS = 0.3   # 리스트 li 개수가 이 시간 동안 그대로면 로딩 끝으로 봄
+
+
+class WaitStats:
+    """ 대기 이름별 횟수 / 총 시간 / 최대 시간 / 타임아웃 횟수 """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.records = {}
+
+    def record(self, label, seconds, timed_out=False):
+        with self._lock:
+            row = self.records.setdefault(label, {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+            row["count"] += 1
+            row["total"] += seconds
+            row["max"] = max(row["max"], seconds)
+            if timed_out:
+                row["timeouts"] += 1
+
+    def total_seconds(self):
+        return sum(row["total"] for row in self.records.values())
+
+    def summary(self):
+        if not self.records:
+            return "⏱️ 기록된 대기 없음"
+        lines = [f"⏱️ 대기 시간 합계 {self.total_seconds():.1f}초"]
+        for label, row in sorted(self.records.items(), key=lambda kv: -kv[1]["total"]):
+            line = (
+                f"   - {label}: {row['count']}회, 총 {row['total']:.1f}초 "
+                f"(평균 {row['total'] / row['count']:.2f}초 / 최대 {row['max']:.2f}초)"
+            )
+            if row["timeouts"]:
+                line += f", 타임아웃 {row['timeouts']}회"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+stats = WaitStats()
+
+
+def wait_for(driver, condition, label, timeout=DEFAULT_TIMEOUT, poll=POLL_INTERVAL):
+    """
+    condition(driver)이 참이 될 때까지 대기하고 그 값을 반환 (시간 초과면 TimeoutException)
+    걸린 시간은 label 이름으로 stats에 기록
+    """
+    started = time.monotonic()
+    try:
+        result = WebDriverWait(driver, timeout, poll_frequency=poll).until(condition)
+    except TimeoutException:
+        stats.record(label, time.monotonic() - started, timed_out=True)
+        raise
+    stats.record(label, time.monotonic() - started)
+    return result
+
+
+# ---------------------------------------------------------
+# 조건들 (driver를 받아서 참/거짓 반환)
+# ---------------------------------------------------------
+class count_stable:
+    """
+    locator로 찾은 요소 개수가 min_count 이상이고 settle초 동안 변하지 않으면 요소 목록 반환
+    (AJAX로 li가 여러 번에 나눠 붙는 리스트용)
+    """
+
+    def __init__(self, locator, settle=LIST_SETTLE_SECONDS, min_count=1):
+        self.locator = locator
+        self.settle = settle
+        self.min_count = min_count
+        self._count = None
+        self._since = None
+
+    def __call__(self, driver):
+        elements = driver.find_elements(*self.locator)
+        now = time.monotonic()
+        if len(elements) != self._count:
+            self._count = len(elements)
+            self._since = now
+            return False
+        if len(elements) >= self.min_count and now - self._since >= self.settle:
+            return elements or True   # 빈 리스트도 '완료'로 인정 (min_count=0일 때)
+        return False
+
+
+def page_settled(driver):
+    """ 문서 로딩 완료 + (jQuery가 있으면) 진행 중인 AJAX 없음 """
+    return driver.execute_script(
+        "return document.readyState === 'complete'"
+        " && (typeof jQuery === 'undefined' || jQuery.active === 0);"
+    )
+
+
+def _is_stale(element):
+    try:
+        element.is_enabled()
+        return False
+    except StaleElementReferenceException:
+        return True
+
+
+# ---------------------------------------------------------
+# 자주 쓰는 대기
+# ---------------------------------------------------------
+def wait_present(driver, xpath, label, timeout=DEFAULT_TIMEOUT):
+    """ xpath 요소가 DOM에 나타날 때까지 (화면에 안 보여도 됨) """
+    return wait_for(driver, EC.presence_of_element_located((By.XPATH, xpath)), label, timeout)
+
+
+def wait_selected(driver, xpath, label, timeout=DEFAULT_TIMEOUT):
+    """ 체크박스가 실제로 체크될 때까지 """
+    return wait_for(driver, EC.element_located_to_be_selected((By.XPATH, xpath)), label, timeout)
+
+
+def wait_settled(driver, label, timeout=DEFAULT_TIMEOUT):
+    return wait_for(driver, page_settled, label, timeout)
+
+
+def first_element(driver, xpath):
+    """ 리스트 갱신 전에 현재 첫 요소를 잡아둠 (없으면 None) → wait_list(previous=...) 용 """
+    elements = driver.find_elements(By.XPATH, xpath)
+    return elements[0] if elements else None
+
+
+def wait_list(driver, xpath, label, previous=None, timeout=DEFAULT_TIMEOUT, min_count=None):
+    """
+    리스트 li가 다 붙을 때까지 대기하고 요소 목록 반환
+    previous(갱신 전 첫 요소)를 주면 그 요소가 사라진(새 리스트로 바뀐) 뒤부터 개수를 셈
+    → 이 경우 0건(검색 결과 없음)도 바로 인정, previous가 없으면 최소 1건이 뜰 때까지 대기
+    """
+    if min_count is None:
+        min_count = 0 if previous is not None else 1
+    stable = count_stable((By.XPATH, xpath), min_count=min_count)
+    if previous is None:
+        result = wait_for(driver, stable, label, timeout)
+    else:
+        result = wait_for(driver, lambda d: _is_stale(previous) and stable(d), label, timeout)
+    return result if isinstance(result, list) else []
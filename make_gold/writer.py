@@ -0,0 +1,187 @@
+import time
+
+from django.db import transaction
+from django.utils import timezone
+
+from . import page_cache
+from .models import AuctionItem
+from .regions import normalize_region
+from .valuation import VALUE_FIELDS, current_spot, valuation
+
+# =========================================================
+# 수집 결과 묶음 저장기 (probe 단일 writer용)
+# - 물건마다 update_or_create(SELECT + INSERT/UPDATE, 각각 자동 커밋) 대신
+#   버퍼에 모았다가 N개 or N초마다 트랜잭션 하나로 bulk upsert
+# - 저장 전에 기존 값과 비교해서 신규 / 변경 / 그대로 건수를 보고
+#   (그대로인 행은 수집 확인 시각만 찍음 → updated_at은 안 바뀜)
+# - 묶음 저장이 실패하면 그 묶음을 한 건씩 save()로 다시 저장 → 문제 있는 행만 실패로 집계
+# - 신규/변경 행은 최신 시세로 가치 평가 컬럼까지 같이 채움 (make_gold.valuation)
+# =========================================================
+
+# 수집기가 채우는 컬럼 (AI 분석 결과 material / risk_factor 등은 건드리지 않음)
+UPSERT_FIELDS = ['title', 'price', 'location', 'image_url', 'description', 'weight_g', 'purity', 'list_fingerprint']
+# 비교 대상은 아니지만 저장할 때마다(그대로인 행 포함) 현재 시각으로 찍는 컬럼
+STAMP_FIELD = 'fingerprinted_at'
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_FLUSH_SECONDS = 5.0
+
+
+class FlushReport:
+    def __init__(self, inserted=0, updated=0, unchanged=0, failed=0, seconds=0.0):
+        self.inserted = inserted
+        self.updated = updated
+        self.unchanged = unchanged
+        self.failed = failed
+        self.seconds = seconds
+
+    @property
+    def total(self):
+        return self.inserted + self.updated + self.unchanged
+
+    def add(self, other):
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+        self.failed += other.failed
+        self.seconds += other.seconds
+
+    def summary(self):
+        failed = f" / 실패 {self.failed}" if self.failed else ""
+        return (
+            f"신규 {self.inserted} / 변경 {self.updated} / 그대로 {self.unchanged}{failed} "
+            f"({self.total}개, {self.seconds:.2f}초)"
+        )
+
+
+class ItemWriter:
+    """
+    with ItemWriter() as writer:
+        writer.add({"url": ..., "title": ..., ...})
+    블록이 끝나면(에러로 빠져나가도) 남은 버퍼를 저장
+    """
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE, flush_seconds=DEFAULT_FLUSH_SECONDS,
+                 fields=UPSERT_FIELDS, stamp_field=STAMP_FIELD, clock=time.monotonic, verbose=True):
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.fields = list(fields)
+        self.stamp_field = stamp_field
+        self._clock = clock
+        self.verbose = verbose
+        self._buffer = {}           # url → 필드 (같은 URL이 또 오면 마지막 값으로)
+        self._last_flush = clock()
+        self.totals = FlushReport()
+        self.flushes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def add(self, item):
+        self._buffer[item['url']] = item
+        if len(self._buffer) >= self.batch_size or self._clock() - self._last_flush >= self.flush_seconds:
+            return self.flush()
+        return None
+
+    def close(self):
+        report = self.flush()
+        if self.verbose and self.flushes:
+            print(f"   💾 저장 합계 ({self.flushes}회): {self.totals.summary()}")
+        return report
+
+    def flush(self):
+        """ 버퍼를 트랜잭션 하나로 저장하고 FlushReport 반환 (비어있으면 None) """
+        self._last_flush = self._clock()
+        if not self._buffer:
+            return None
+        items, self._buffer = self._buffer, {}
+
+        started = time.perf_counter()
+        now = timezone.now()
+        spot = current_spot()
+        stamp = {self.stamp_field: now} if self.stamp_field else {}
+        try:
+            report = self._save_batch(items, now, spot, stamp)
+        except Exception as e:
+            # 묶음 전체가 롤백됨 → 한 건씩 다시 저장해서 문제 있는 행만 버림
+            print(f"   ⚠️ 묶음 저장 실패, 한 건씩 다시 저장: {e}")
+            report = self._save_rows(items, spot, stamp)
+
+        report.seconds = time.perf_counter() - started
+        self.totals.add(report)
+        self.flushes += 1
+        if self.verbose:
+            print(f"   💾 [묶음 저장] {report.summary()}")
+        return report
+
+    def _save_batch(self, items, now, spot, stamp):
+        report = FlushReport()
+        with transaction.atomic():
+            existing = {
+                row['url']: row
+                for row in AuctionItem.objects.filter(url__in=items.keys()).values('url', *self.fields)
+            }
+
+            changed, unchanged = [], []
+            for url, item in items.items():
+                values = {field: item.get(field) for field in self.fields}
+                old = existing.get(url)
+                if old is None:
+                    report.inserted += 1
+                elif all(old[field] == values[field] for field in self.fields):
+                    report.unchanged += 1
+                    unchanged.append(url)
+                    continue
+                else:
+                    report.updated += 1
+                # bulk_create는 save()를 안 거치므로 region / updated_at은 직접 채움
+                value = valuation(values.get('price'), values.get('weight_g'), values.get('purity'), spot)
+                changed.append(AuctionItem(
+                    url=url, region=normalize_region(values.get('location')), updated_at=now,
+                    **values, **value, **stamp
+                ))
+
+            if changed:
+                AuctionItem.objects.bulk_create(
+                    changed,
+                    update_conflicts=True,
+                    unique_fields=['url'],
+                    update_fields=[*self.fields, 'region', 'updated_at', *VALUE_FIELDS, *stamp],
+                )
+            if unchanged and stamp:
+                # 내용은 그대로 → 확인 시각만 갱신 (updated_at은 유지)
+                AuctionItem.objects.filter(url__in=unchanged).update(**stamp)
+            if changed:
+                # 커밋되면 리스트 페이지 캐시 무효화
+                page_cache.bump_on_commit()
+        return report
+
+    def _save_rows(self, items, spot, stamp):
+        """ 실패한 묶음을 행마다 savepoint 하나씩 save()로 저장 (내용 비교 없이 신규 / 변경만 셈) """
+        report = FlushReport()
+        for url, item in items.items():
+            try:
+                with transaction.atomic():
+                    obj = AuctionItem.objects.filter(url=url).first()
+                    created = obj is None
+                    if created:
+                        obj = AuctionItem(url=url)
+                    for field in self.fields:
+                        setattr(obj, field, item.get(field))
+                    for field, value in stamp.items():
+                        setattr(obj, field, value)
+                    obj.save(spot=spot)
+            except Exception as e:
+                report.failed += 1
+                print(f"   ⚠️ 저장 실패 ({url}): {e}")
+                continue
+            if created:
+                report.inserted += 1
+            else:
+                report.updated += 1
+        if report.inserted or report.updated:
+            page_cache.bump_on_commit()
+        return report